@@ -1,4 +1,6 @@
 # hash_table.py
+from profiling import profiled
+
 class Node:
     """Node for linked list in separate chaining"""
     def __init__(self, key, value):
@@ -36,11 +38,12 @@ class HashTable:
             
             if current.key == key:
                 current.value = value
-            else:
-                current.next = Node(key, value)
+                return
+            current.next = Node(key, value)
         
         self.count += 1
     
+    @profiled
     def search(self, key):
         """Search for a key in the hash table"""
         index = self._hash(key)
@@ -0,0 +1,186 @@
+# inventory_analytics.py
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class InventorySnapshot:
+    """Columnar NumPy copy of the inventory for vectorized reports
+
+    Prices, quantities and category codes are stored in parallel arrays, one
+    row per product. The snapshot registers itself as a listener on the
+    storage, so every insert or update rewrites a single row instead of
+    rebuilding the arrays.
+    """
+
+    def __init__(self, storage=None, capacity=1024):
+        if np is None:
+            raise ImportError("Inventory analytics requires NumPy (pip install numpy)")
+        self.storage = storage
+        self.size = 0
+        self.prices = np.empty(capacity, dtype=np.float64)
+        self.quantities = np.empty(capacity, dtype=np.int64)
+        self.category_codes = np.empty(capacity, dtype=np.int32)
+        self.product_ids = []       # row -> product ID
+        self.rows = {}              # product ID -> row
+        self.categories = []        # code -> category name
+        self.category_codes_by_name = {}
+
+        if storage is not None:
+            # Loaded and subscribed atomically, so no write falls in between
+            storage.add_listener(self.apply, load=self._load_products)
+
+    def _load_products(self, products):
+        self.load_columns([p.product_id for p in products], [p.price for p in products],
+                          [p.quantity for p in products], [p.category for p in products])
+
+    def close(self):
+        """Stop following the storage"""
+        if self.storage is not None:
+            self.storage.remove_listener(self.apply)
+            self.storage = None
+
+    def _code(self, category):
+        code = self.category_codes_by_name.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self.category_codes_by_name[category] = code
+        return code
+
+    def _reserve(self, rows):
+        """Grow the columns (doubling) so that rows more rows fit"""
+        needed = self.size + rows
+        capacity = len(self.prices)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)  # 0 would never grow
+        while capacity < needed:
+            capacity *= 2
+        self.prices = np.resize(self.prices, capacity)
+        self.quantities = np.resize(self.quantities, capacity)
+        self.category_codes = np.resize(self.category_codes, capacity)
+
+    def load_columns(self, product_ids, prices, quantities, categories):
+        """Bulk-append new products given as columns (IDs must not be present yet)"""
+        count = len(product_ids)
+        self._reserve(count)
+        start, end = self.size, self.size + count
+        self.prices[start:end] = prices
+        self.quantities[start:end] = quantities
+        if isinstance(categories, np.ndarray) and categories.dtype.kind in "iu":
+            # Already encoded as indexes into self.categories
+            self.category_codes[start:end] = categories
+        else:
+            self.category_codes[start:end] = [self._code(category) for category in categories]
+        self.rows.update(zip(product_ids, range(start, end)))
+        self.product_ids.extend(product_ids)
+        self.size = end
+
+    def apply(self, product):
+        """Storage listener: insert or overwrite the row of one product"""
+        row = self.rows.get(product.product_id)
+        if row is None:
+            self._reserve(1)
+            row = self.size
+            self.size += 1
+            self.rows[product.product_id] = row
+            self.product_ids.append(product.product_id)
+        self.prices[row] = product.price
+        self.quantities[row] = product.quantity
+        self.category_codes[row] = self._code(product.category)
+
+    def columns(self):
+        """(prices, quantities, category codes) views of the live rows"""
+        n = self.size
+        return self.prices[:n], self.quantities[:n], self.category_codes[:n]
+
+    def total_stock_value(self):
+        """Sum of price * quantity over all products"""
+        prices, quantities, _ = self.columns()
+        return float(np.dot(prices, quantities))
+
+    def stock_value_by_category(self):
+        """{category: sum of price * quantity}"""
+        prices, quantities, codes = self.columns()
+        totals = np.bincount(codes, weights=prices * quantities, minlength=len(self.categories))
+        return dict(zip(self.categories, totals.tolist()))
+
+    def quantity_by_category(self):
+        """{category: units in stock}"""
+        _, quantities, codes = self.columns()
+        totals = np.bincount(codes, weights=quantities, minlength=len(self.categories))
+        return {category: int(total) for category, total in zip(self.categories, totals)}
+
+    def below_threshold(self, threshold, limit=None):
+        """Product IDs with quantity below a reorder threshold
+
+        threshold is either one number for every product or a dict of
+        {category: threshold}; categories missing from the dict are never
+        reported.
+        """
+        _, quantities, codes = self.columns()
+        if isinstance(threshold, dict):
+            per_code = np.array([threshold.get(category, np.iinfo(np.int64).min)
+                                 for category in self.categories], dtype=np.int64)
+            mask = quantities < per_code[codes] if len(per_code) else np.zeros(self.size, dtype=bool)
+        else:
+            mask = quantities < threshold
+        rows = np.flatnonzero(mask)
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.product_ids[row] for row in rows.tolist()]
+
+    def price_quantiles(self, quantiles=(0.25, 0.5, 0.75, 0.9, 0.99), category=None):
+        """{quantile: price}, over every product or one category"""
+        prices, _, codes = self.columns()
+        if category is not None:
+            code = self.category_codes_by_name.get(category)
+            prices = prices[codes == code] if code is not None else prices[:0]
+        if len(prices) == 0:
+            return {}
+        return dict(zip(quantiles, np.quantile(prices, quantiles).tolist()))
+
+
+def synthetic_snapshot(count, category_count=50, seed=42):
+    """A storage-less snapshot of count random SKUs, for timing reports at scale"""
+    rng = np.random.default_rng(seed)
+    snapshot = InventorySnapshot(capacity=count)
+    for i in range(category_count):
+        snapshot._code(f"Category {i:02d}")
+    product_ids = [f"SKU{i:08d}" for i in range(count)]
+    snapshot.load_columns(product_ids, rng.lognormal(3.0, 1.0, count).round(2),
+                          rng.integers(0, 200, count),
+                          rng.integers(0, category_count, count, dtype=np.int32))
+    return snapshot
+
+
+def main():
+    """Time the vectorized reports over a large synthetic inventory"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Time vectorized inventory reports")
+    parser.add_argument("--products", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    snapshot = synthetic_snapshot(args.products)
+    print(f"Built snapshot of {snapshot.size:,} products in {time.perf_counter() - start:.2f} s")
+
+    reports = [
+        ("Total stock value", snapshot.total_stock_value),
+        ("Stock value by category", snapshot.stock_value_by_category),
+        ("Quantity by category", snapshot.quantity_by_category),
+        ("Below threshold (10)", lambda: snapshot.below_threshold(10, limit=100)),
+        ("Price quantiles", snapshot.price_quantiles),
+    ]
+    for name, report in reports:
+        start = time.perf_counter()
+        report()
+        print(f"{name:<25} {(time.perf_counter() - start) * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,88 @@
 # inventory_system.py
+import copy
+import threading
 import time
 from hash_table import HashTable
 from models import BabyProduct
 
+class ProductVersion:
+    """One committed version of a product; previous links to the one it replaced"""
+    __slots__ = ("product", "version", "previous")
+    
+    def __init__(self, product, version, previous):
+        self.product = product
+        self.version = version
+        self.previous = previous
+
+class StorageSnapshot:
+    """Read-only, point-in-time view of a BabyShopStorage
+    
+    Sees exactly the writes committed before it was taken, however long it
+    is kept and whatever is written meanwhile. Reads take no locks. Release
+    it (or use it as a context manager) so older versions can be collected.
+    """
+    
+    def __init__(self, storage, version, key_count):
+        self.storage = storage
+        self.version = version
+        self.key_count = key_count  # products that existed when the snapshot was taken
+        self.released = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.release()
+    
+    def release(self):
+        """Let the storage forget versions only this snapshot could see"""
+        if not self.released:
+            self.released = True
+            self.storage._release_snapshot(self)
+    
+    def _visible(self, head):
+        while head is not None and head.version > self.version:
+            head = head.previous
+        return head.product if head is not None else None
+    
+    def get(self, product_id):
+        """The product as it was when the snapshot was taken (None if it did not exist)"""
+        position = self.storage._positions.get(product_id)
+        if position is None or position >= self.key_count:
+            return None
+        return self._visible(self.storage._heads[position])
+    
+    def __iter__(self):
+        heads = self.storage._heads
+        for position in range(self.key_count):
+            product = self._visible(heads[position])
+            if product is not None:
+                yield product
+    
+    def get_all_products_array(self):
+        """All products in the snapshot, in insertion order"""
+        return list(self)
+
 class BabyShopStorage:
     """Local storage system for baby products using hash table"""
     
-    def __init__(self, size=15):
-        self.hash_table = HashTable(size)
+    def __init__(self, size=15, seed_sample_data=True):
+        self.hash_table = HashTable(size)  # latest version of every product
+        self.listeners = []
+        # Multi-version store: _heads[position] is the newest ProductVersion of a
+        # product and _positions maps product IDs to positions. Writers serialize
+        # on _write_lock and never modify a published version, so readers of a
+        # snapshot walk the chains without locking.
+        self.version = 0  # number of the last committed write
+        self._heads = []
+        self._positions = {}
+        self._write_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._active_snapshots = {}  # version -> number of unreleased snapshots
+        self._garbage = set()  # positions whose chains may hold unreachable versions
+        self._retained = 0  # superseded versions kept in those chains
+        self.gc_threshold = 1024
+        self._next_gc = self.gc_threshold
         self.predefined_products = [
             ("BP001", "Baby Bottle", "Feeding", 12.99, 50, "0-6 months"),
             ("BP002", "Diapers Pack", "Hygiene", 24.99, 100, "0-12 months"),
@@ -20,31 +95,196 @@ class BabyShopStorage:
             ("BP009", "Baby Wipes", "Hygiene", 4.99, 80, "0-12 months"),
             ("BP010", "Rattle Toy", "Toys", 7.99, 45, "3-6 months")
         ]
-        self._insert_predefined_products()
+        if seed_sample_data:
+            self._insert_predefined_products()
     
     def _insert_predefined_products(self):
         """Insert predefined products into the hash table"""
         for product_data in self.predefined_products:
             product_id, name, category, price, quantity, age_range = product_data
             product = BabyProduct(product_id, name, category, price, quantity, age_range)
-            self.hash_table.insert(product_id, product)
+            with self._write_lock:
+                self._commit(product)
+    
+    def add_listener(self, callback, load=None):
+        """Register callback(product), called after every insert or update, in commit order
+        
+        Callbacks run under the write lock, so they must not write to the
+        storage themselves. load(products), if given, is first called with the
+        stored products under the same lock, so that a copy built from them
+        and then kept current by callback misses no write and sees none twice.
+        """
+        with self._write_lock:
+            if load is not None:
+                load([head.product for head in self._heads])
+            # Replaced, not appended to, so a notification in progress is not disturbed
+            self.listeners = self.listeners + [callback]
+    
+    def remove_listener(self, callback):
+        """Stop notifying a callback registered with add_listener"""
+        listeners = list(self.listeners)
+        listeners.remove(callback)
+        self.listeners = listeners
+    
+    def _notify(self, product):
+        for callback in self.listeners:
+            callback(product)
+    
+    def _commit(self, product):
+        """Publish product as a new version (caller holds _write_lock)"""
+        version = self.version + 1
+        position = self._positions.get(product.product_id)
+        if position is None:
+            self._heads.append(ProductVersion(product, version, None))
+            self._positions[product.product_id] = len(self._heads) - 1
+        else:
+            head = self._heads[position] = ProductVersion(product, version, self._heads[position])
+        self.hash_table.insert(product.product_id, product)
+        # Committed last: snapshots taken before this line cannot see the new version
+        self.version = version
+        if position is None:
+            return
+        with self._snapshot_lock:
+            unobserved = not self._active_snapshots
+        if unobserved:
+            # No snapshot can need the replaced version, and any taken from now on sees this one
+            head.previous = None
+            return
+        self._garbage.add(position)
+        self._retained += 1
+        if self._retained >= self._next_gc:
+            self._collect_garbage()
+    
+    def insert_product(self, product):
+        """Insert (or replace) a product and notify listeners"""
+        with self._write_lock:
+            self._commit(product)
+            self._notify(product)
+    
+    def update_product(self, product_id, price=None, quantity=None):
+        """Change the price and/or quantity of a stored product and notify listeners
+        
+        The stored object is not modified: a changed copy replaces it, so
+        snapshots still holding the old version keep seeing the old values.
+        """
+        with self._write_lock:
+            product = self.hash_table.search(product_id)
+            if product is None:
+                raise KeyError(product_id)
+            product = copy.copy(product)
+            if price is not None:
+                product.price = float(price)
+            if quantity is not None:
+                product.quantity = int(quantity)
+            self._commit(product)
+            # Under the lock, so listeners see writes in the order they were committed
+            self._notify(product)
+        return product
+    
+    def snapshot(self):
+        """Point-in-time StorageSnapshot; O(1), and never blocks or is blocked by writers"""
+        with self._snapshot_lock:
+            snapshot = StorageSnapshot(self, self.version, len(self._heads))
+            self._active_snapshots[snapshot.version] = self._active_snapshots.get(snapshot.version, 0) + 1
+        return snapshot
+    
+    def _release_snapshot(self, snapshot):
+        with self._snapshot_lock:
+            remaining = self._active_snapshots[snapshot.version] - 1
+            if remaining:
+                self._active_snapshots[snapshot.version] = remaining
+            else:
+                del self._active_snapshots[snapshot.version]
+        # Collect now unless a write is in progress; the writer will do it later
+        if self._write_lock.acquire(blocking=False):
+            try:
+                self._collect_garbage()
+            finally:
+                self._write_lock.release()
+    
+    def _collect_garbage(self):
+        """Drop versions no snapshot can see any more (caller holds _write_lock)
+        
+        A chain keeps its head plus, for each active snapshot, the newest
+        version not newer than it. Dropped versions are only unlinked, never
+        modified, so a reader standing on one still reaches what it needs.
+        """
+        with self._snapshot_lock:
+            active = sorted(self._active_snapshots, reverse=True)
+        retained = 0
+        for position in list(self._garbage):
+            kept = self._heads[position]
+            for version in active:
+                visible = kept
+                while visible is not None and visible.version > version:
+                    visible = visible.previous
+                if visible is None:
+                    break  # the product is newer than this and every older snapshot
+                if visible is not kept:
+                    kept.previous = visible
+                    kept = visible
+                    retained += 1
+            kept.previous = None
+            if kept is self._heads[position]:
+                self._garbage.discard(position)
+        self._retained = retained
+        # Versions pinned by long-lived snapshots stay; wait for as many again before rescanning
+        self._next_gc = max(self.gc_threshold, 2 * retained)
+    
+    def version_count(self):
+        """Number of stored product versions, including those kept for snapshots"""
+        count = 0
+        for head in self._heads:
+            while head is not None:
+                count += 1
+                head = head.previous
+        return count
     
     def get_all_products_array(self):
-        """Get all products as array for performance comparison"""
-        products = []
-        for i in range(self.hash_table.size):
-            current = self.hash_table.table[i]
-            while current is not None:
-                products.append(current.value)
-                current = current.next
-        return products
+        """Get all products as array for performance comparison
+        
+        Read from a snapshot, so the list is consistent even while other
+        threads write.
+        """
+        with self.snapshot() as snapshot:
+            return snapshot.get_all_products_array()
 
 class InventorySystem:
     """Command-line Inventory System for baby products"""
     
-    def __init__(self):
-        self.storage = BabyShopStorage()
-        self.products_array = self.storage.get_all_products_array()
+    def __init__(self, seed_sample_data=True):
+        # Storage and the array copy are built on first use, so start-up
+        # cost does not depend on how much data there is
+        self.seed_sample_data = seed_sample_data
+        self._storage = None
+        self._products_array = None
+        self.snapshot = None
+    
+    @property
+    def storage(self):
+        """The product storage, created on first use"""
+        if self._storage is None:
+            self._storage = BabyShopStorage(seed_sample_data=self.seed_sample_data)
+            self._storage.add_listener(self._invalidate_products_array)
+        return self._storage
+    
+    @property
+    def products_array(self):
+        """Array copy of all products for the search comparison, built on first use"""
+        if self._products_array is None:
+            self._products_array = self.storage.get_all_products_array()
+        return self._products_array
+    
+    def _invalidate_products_array(self, product):
+        self._products_array = None
+    
+    def get_snapshot(self):
+        """Columnar analytics snapshot, built on first use and kept current by the storage's listeners"""
+        if self.snapshot is None:
+            # Imported here: NumPy is slow to import and only the reports need it
+            from inventory_analytics import InventorySnapshot
+            self.snapshot = InventorySnapshot(self.storage)
+        return self.snapshot
     
     def display_menu(self):
         """Display the main menu"""
@@ -55,7 +295,8 @@ class InventorySystem:
         print("2. Search Product")
         print("3. Display All Products")
         print("4. Performance Comparison")
-        print("5. Exit")
+        print("5. Inventory Reports")
+        print("6. Exit")
         print("="*50)
     
     def insert_product(self):
@@ -76,8 +317,7 @@ class InventorySystem:
                 return
             
             new_product = BabyProduct(product_id, name, category, price, quantity, age_range)
-            self.storage.hash_table.insert(product_id, new_product)
-            self.products_array = self.storage.get_all_products_array()
+            self.storage.insert_product(new_product)
             
             print(f"Product '{name}' inserted successfully!")
             
@@ -209,11 +449,36 @@ class InventorySystem:
         print("array search varies from O(1) to O(n), making hash tables superior")
         print("for frequent search operations in inventory systems.")
     
+    def inventory_reports(self, low_stock_threshold=25):
+        """Vectorized stock reports over a columnar snapshot of the storage"""
+        print("\n--- INVENTORY REPORTS ---")
+        
+        try:
+            snapshot = self.get_snapshot()
+        except ImportError as e:
+            print(f"Error: {e}")
+            return
+        
+        print(f"{'Category':<15} {'Units':>8} {'Stock Value':>14}")
+        print("-" * 39)
+        units = snapshot.quantity_by_category()
+        for category, value in sorted(snapshot.stock_value_by_category().items()):
+            print(f"{category:<15} {units[category]:>8} {value:>14,.2f}")
+        print(f"{'Total':<15} {sum(units.values()):>8} {snapshot.total_stock_value():>14,.2f}")
+        
+        low_stock = snapshot.below_threshold(low_stock_threshold)
+        print(f"\nBelow reorder threshold ({low_stock_threshold} units): {', '.join(low_stock) or 'none'}")
+        
+        quantiles = snapshot.price_quantiles((0.25, 0.5, 0.75))
+        if quantiles:
+            print("Price quartiles: " + ", ".join(f"Q{i + 1} ${price:.2f}"
+                                                  for i, price in enumerate(quantiles.values())))
+    
     def run(self):
         """Main method to run the inventory system"""
         while True:
             self.display_menu()
-            choice = input("Enter your choice (1-5): ").strip()
+            choice = input("Enter your choice (1-6): ").strip()
             
             if choice == '1':
                 self.insert_product()
@@ -224,6 +489,8 @@ class InventorySystem:
             elif choice == '4':
                 self.performance_comparison()
             elif choice == '5':
+                self.inventory_reports()
+            elif choice == '6':
                 print("Thank you for using Baby Shop Inventory System!")
                 break
             else:
@@ -0,0 +1,270 @@
+"""
+Opt-in Profiling Hooks
+
+Nothing is measured unless the PROFILE environment variable is set. Then:
+
+- functions decorated with @profiled and blocks wrapped in section(name)
+  count their calls and add up their wall time (recursive calls are counted
+  at every level, and counts may miss a few calls made from several threads
+  at once)
+- session(label), wrapped around an entry point, records the call stacks of
+  every thread while it runs. On exit it writes them in the collapsed-stack
+  format read by flame graph tools ("frame;frame;frame count", one line per
+  distinct stack, for flamegraph.pl, speedscope or inferno) and prints the
+  @profiled totals to stderr
+
+PROFILE chooses how stacks are recorded:
+
+  trace      sys.setprofile on every call and return, counting microseconds
+             of self time per stack: exact and portable, but several times
+             slower to run
+  any other  a SIGPROF sampler, every PROFILE_INTERVAL ms (default 5) of CPU
+             time, counting samples per stack. Cheap, but only samples
+             between bytecodes, so one long C call (a huge multiplication,
+             math.factorial) is a single sample, and other threads are only
+             sampled when the main thread gets to run the handler, so prefer
+             trace for multithreaded runs. Falls back to trace where SIGPROF
+             does not exist (Windows) or off the main thread
+
+PROFILE_OUTPUT names the collapsed-stack file (default <label>.collapsed).
+
+Each Project Question directory, and the repository root, holds a
+byte-identical copy of this file: the apps run as plain scripts from their
+own directory, with no package to share a module through. Change them
+together.
+
+When PROFILE is unset, @profiled returns the function itself and section()
+and session() return a shared do-nothing context manager, so the hooks in hot
+paths cost nothing.
+
+Example:
+    PROFILE=1 python main.py batch load.txt
+    flamegraph.pl inventory.collapsed > inventory.svg
+"""
+
+import os
+import sys
+import time
+
+MODE = os.environ.get("PROFILE", "").strip().lower()
+ENABLED = MODE not in ("", "0", "off", "false", "no")
+INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL", "5"))
+
+# name -> [calls, total wall time in ns], filled by @profiled and section()
+STATS = {}
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL = _NullContext()
+
+
+def profiled(func=None, name=None):
+    """Decorator counting the calls and wall time of func, under name (default module.qualname)
+
+    Usable as @profiled or @profiled(name="..."). Returns func unchanged when
+    profiling is disabled.
+    """
+    if func is None:
+        return lambda func: profiled(func, name)
+    if not ENABLED:
+        return func
+    import functools
+    stats = STATS.setdefault(name or f"{func.__module__}.{func.__qualname__}", [0, 0])
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += clock() - start
+    return wrapper
+
+
+class _Section:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats[0] += 1
+        self.stats[1] += time.perf_counter_ns() - self.start
+        return False
+
+
+def section(name):
+    """Context manager counting the runs and wall time of a block, like @profiled"""
+    if not ENABLED:
+        return _NULL
+    return _Section(STATS.setdefault(name, [0, 0]))
+
+
+def _frame_label(code):
+    # Flame graph tools split stacks on ";" and the count on the last space
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+class SignalSampler:
+    """Counts the stacks of all threads every interval_ms of process CPU time (SIGPROF)"""
+
+    def __init__(self, interval_ms=INTERVAL_MS):
+        from collections import Counter
+        self.interval = interval_ms / 1000
+        self.stacks = Counter()
+        self._labels = {}  # code object -> frame label
+        self._previous_handler = None
+
+    @staticmethod
+    def available():
+        import signal
+        import threading
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def start(self):
+        import signal
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        import signal
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def _stack(self, frame):
+        labels = self._labels
+        stack = []
+        while frame is not None:
+            label = labels.get(frame.f_code)
+            if label is None:
+                label = labels[frame.f_code] = _frame_label(frame.f_code)
+            stack.append(label)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _sample(self, signum, frame):
+        import threading
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        current = threading.get_ident()
+        for ident, thread_frame in sys._current_frames().items():
+            if ident == current:
+                thread_frame = frame  # the interrupted frame, not this handler
+            thread = names.get(ident, f"Thread-{ident}").replace(";", ":").replace(" ", "_")
+            self.stacks[";".join([thread] + self._stack(thread_frame))] += 1
+
+
+class TraceProfiler:
+    """Adds up microseconds of self time per stack, from sys.setprofile call and return events
+
+    Covers the calling thread and threads started after start().
+    """
+
+    def __init__(self):
+        import threading
+        from collections import Counter
+        self.stacks = Counter()
+        self._nanoseconds = {}  # stack -> ns of self time
+        self._labels = {}
+        self._local = threading.local()
+
+    def start(self):
+        import threading
+        threading.setprofile(self._event)
+        sys.setprofile(self._event)
+
+    def stop(self):
+        import threading
+        sys.setprofile(None)
+        threading.setprofile(None)
+        for stack, nanoseconds in self._nanoseconds.items():
+            self.stacks[stack] = max(1, nanoseconds // 1000)
+
+    def _event(self, frame, event, arg):
+        now = time.perf_counter_ns()
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            import threading
+            # [stack, time it last started running]; the root is the thread itself
+            thread = threading.current_thread().name.replace(";", ":").replace(" ", "_")
+            stack = self._local.stack = [[thread, now]]
+        top = stack[-1]
+        self._nanoseconds[top[0]] = self._nanoseconds.get(top[0], 0) + now - top[1]
+        if event == "call" or event == "c_call":
+            code = frame.f_code if event == "call" else arg
+            label = self._labels.get(code)
+            if label is None:
+                if event == "call":
+                    label = _frame_label(code)
+                else:
+                    label = f"{getattr(arg, '__qualname__', repr(arg))} (builtin)".replace(";", ":")
+                self._labels[code] = label
+            stack.append([f"{top[0]};{label}", now])
+        else:
+            if len(stack) > 1:  # else a return from a frame entered before start()
+                stack.pop()
+            stack[-1][1] = now
+
+
+def write_collapsed(path, stacks):
+    """Write stack -> count pairs in collapsed-stack format, most frequent first"""
+    with open(path, "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def report(output=None):
+    """Print the @profiled and section() totals, largest total time first"""
+    output = output or sys.stderr
+    if not STATS:
+        return
+    print(f"{'Profiled':<50} {'Calls':>10} {'Total (ms)':>12} {'Mean (us)':>11}", file=output)
+    for name, (calls, total) in sorted(STATS.items(), key=lambda item: -item[1][1]):
+        if calls:
+            print(f"{name:<50} {calls:>10,} {total / 1e6:>12.2f} {total / calls / 1e3:>11.2f}", file=output)
+
+
+class _Session:
+    def __init__(self, label, output):
+        self.label = label
+        self.output = output or os.environ.get("PROFILE_OUTPUT") or f"{label}.collapsed"
+        self.recorder = None
+
+    def __enter__(self):
+        if MODE != "trace" and SignalSampler.available():
+            self.recorder = SignalSampler()
+        else:
+            self.recorder = TraceProfiler()
+        self.recorder.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.stop()
+        write_collapsed(self.output, self.recorder.stacks)
+        print(f"\n[profiling] {self.label}: {sum(self.recorder.stacks.values()):,} "
+              f"{'samples' if isinstance(self.recorder, SignalSampler) else 'us'} "
+              f"written to {self.output}", file=sys.stderr)
+        report()
+        return False
+
+
+def session(label, output=None):
+    """Context manager profiling everything run inside it (see the module docstring)"""
+    if not ENABLED:
+        return _NULL
+    return _Session(label, output)
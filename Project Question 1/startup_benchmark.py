@@ -0,0 +1,77 @@
+# startup_benchmark.py
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from inventory_system import InventorySystem
+from models import BabyProduct
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Each snippet runs in a fresh interpreter; the baseline is subtracted from the others
+SNIPPETS = [
+    ("Interpreter only", "pass"),
+    ("Import main", "import main"),
+    ("Construct InventorySystem", "import main; main.InventorySystem()"),
+    ("Construct + first search", "import main; main.InventorySystem().storage.hash_table.search('BP001')"),
+    ("Scripted 'search' command", None),
+]
+
+
+def cold_start_ms(snippet, runs):
+    """Median wall time of running snippet in a new Python process"""
+    if snippet is None:
+        command = [sys.executable, "main.py", "search", "BP001"]
+    else:
+        command = [sys.executable, "-c", snippet]
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def construction_ms(product_count):
+    """(construct, first use) times in ms for a system that will hold product_count extra products"""
+    start = time.perf_counter()
+    system = InventorySystem()
+    constructed = time.perf_counter()
+    storage = system.storage
+    for i in range(product_count):
+        storage.insert_product(BabyProduct(f"SKU{i:06d}", f"Product {i}", "Misc", 1.0, 1, ""))
+    system.products_array
+    used = time.perf_counter()
+    return (constructed - start) * 1000, (used - constructed) * 1000
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("="*60)
+    print(f"COLD START (new process, median of {runs} runs)")
+    print("="*60)
+    baseline = None
+    for label, snippet in SNIPPETS:
+        elapsed = cold_start_ms(snippet, runs)
+        if baseline is None:
+            baseline = elapsed
+            print(f"{label:<30} {elapsed:>10.1f} ms")
+        else:
+            print(f"{label:<30} {elapsed:>10.1f} ms  (+{elapsed - baseline:.1f} ms)")
+    imported = subprocess.run([sys.executable, "-c", "import sys, main; print('numpy' in sys.modules)"],
+                              cwd=HERE, capture_output=True, text=True).stdout.strip()
+    print(f"NumPy imported at start-up: {imported}")
+
+    print("\n" + "="*60)
+    print("CONSTRUCTION VS FIRST USE AS THE DATA GROWS")
+    print("="*60)
+    print(f"{'Products':>10} {'Construct (ms)':>16} {'First use (ms)':>16}")
+    for product_count in (0, 100, 1000, 5000):
+        constructed, used = construction_ms(product_count)
+        print(f"{product_count:>10} {constructed:>16.3f} {used:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import argparse
+import json
+import shlex
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from graph import Page
+from graph_aggregates import FollowAggregates
+from visibility import VisibilityIndex
+from person import Person
+
+
+class CommandError(Exception):
+    """A scripted command that could not be executed (unknown command or user, bad arguments)"""
+
+
+def _describe(person: Person) -> Dict[str, Any]:
+    return {"user_id": person.user_id, "name": person.name}
+
+
+def _page(page: Page) -> Dict[str, Any]:
+    return {"items": [_describe(person) for person in page.items], "next_cursor": page.next_cursor}
+
+
+def _coerce(argument: str, convert: Callable, default: List[Any], value: Any) -> Any:
+    """An argument value checked against and converted by its COMMANDS converter.
+
+    Text is converted; other values (from JSON) must already have the right
+    type. "" keeps an optional argument's default.
+    """
+    if default and (value is default[0] or value == ""):
+        return default[0]
+    if isinstance(value, str):
+        return convert(value)
+    if convert is str or isinstance(value, bool) or not isinstance(value, int):
+        expected = "a string" if convert is str else "an integer"
+        raise TypeError(f"{argument} must be {expected}, not {type(value).__name__}")
+    return convert(value)
+
+
+# Arguments shared by the paged listings
+_PAGE_ARGUMENTS = [("cursor", int, 0), ("limit", int, 50), ("viewer_id", int, 0)]
+
+
+class SocialMediaCommands:
+    """Non-interactive interface to a SocialMediaApp.
+
+    Every command is a cmd_<name> method (dashes in the name become
+    underscores) returning JSON-serializable data. COMMANDS lists the
+    arguments of each command in order, as (argument, convert) or (argument,
+    convert, default), where convert turns a text argument into its value;
+    the same table builds the argparse subcommands. Optional arguments may be
+    omitted at the end of a line or passed as "" to keep their default.
+    """
+
+    COMMANDS: Dict[str, List[Tuple]] = {
+        "users": _PAGE_ARGUMENTS,
+        "profile": [("user_id", int)],
+        "following": [("user_id", int)] + _PAGE_ARGUMENTS,
+        "followers": [("user_id", int)] + _PAGE_ARGUMENTS,
+        "add-user": [("name", str), ("gender", str, ""), ("bio", str, ""), ("privacy", str, "public")],
+        "follow": [("follower_id", int), ("followed_id", int)],
+        "unfollow": [("follower_id", int), ("followed_id", int)],
+        "post": [("author_id", int), ("content", str)],
+        "feed": [("user_id", int), ("limit", int, 20)],
+        "search": [("query", str), ("limit", int, 20)],
+        "path": [("source_id", int), ("target_id", int)],
+        "common-following": [("first_id", int), ("second_id", int)],
+        "most-followed": [("limit", int, 10)],
+        "mutual": [("first_id", int), ("second_id", int)],
+    }
+
+    def __init__(self, app):
+        self.app = app
+        self.aggregates: Optional[FollowAggregates] = None  # built by the first query that needs it
+        self.visibility: Optional[VisibilityIndex] = None
+
+    def _user(self, user_id: int) -> Person:
+        person = self.app.users.get(user_id)
+        if person is None:
+            raise CommandError(f"Unknown user ID: {user_id}")
+        return person
+
+    def _viewer_index(self, viewer_id: int) -> Tuple[Optional[VisibilityIndex], Optional[Person]]:
+        """(visibility index, viewer) when listing as viewer_id, or (None, None) for viewer_id 0"""
+        if not viewer_id:
+            return None, None
+        viewer = self._user(viewer_id)
+        if self.visibility is None:
+            self.visibility = VisibilityIndex(self.app.social_graph)
+        return self.visibility, viewer
+
+    def cmd_users(self, cursor: int = 0, limit: int = 50, viewer_id: int = 0):
+        """List users, one page at a time (only those viewer_id may see, if given)"""
+        visibility, viewer = self._viewer_index(viewer_id)
+        if visibility is not None:
+            return _page(visibility.page_vertices(viewer, cursor, limit))
+        return _page(self.app.social_graph.page_vertices(cursor, limit))
+
+    def cmd_profile(self, user_id: int):
+        """Show a user's profile (private profiles only show public details)"""
+        person = self._user(user_id)
+        profile = {"user_id": person.user_id, "name": person.name, "privacy": person.privacy}
+        if person.privacy != "private":
+            profile.update(gender=person.gender, biography=person.biography)
+        return profile
+
+    def cmd_following(self, user_id: int, cursor: int = 0, limit: int = 50, viewer_id: int = 0):
+        """List the accounts a user follows (only those viewer_id may see, if given)"""
+        person = self._user(user_id)
+        visibility, viewer = self._viewer_index(viewer_id)
+        if visibility is not None:
+            return _page(visibility.page_outgoing(viewer, person, cursor, limit))
+        return _page(self.app.social_graph.page_outgoing(person, cursor, limit))
+
+    def cmd_followers(self, user_id: int, cursor: int = 0, limit: int = 50, viewer_id: int = 0):
+        """List a user's followers (only those viewer_id may see, if given)"""
+        person = self._user(user_id)
+        visibility, viewer = self._viewer_index(viewer_id)
+        if visibility is not None:
+            return _page(visibility.page_incoming(viewer, person, cursor, limit))
+        return _page(self.app.social_graph.page_incoming(person, cursor, limit))
+
+    def cmd_add_user(self, name: str, gender: str = "", bio: str = "", privacy: str = "public"):
+        """Create a user and return its ID"""
+        if privacy not in ("public", "private"):
+            raise CommandError("privacy must be 'public' or 'private'")
+        person = self.app.users.create_user(name, gender, bio, privacy)
+        self.app.social_graph.add_vertex(person)
+        return {"user_id": person.user_id}
+
+    def cmd_follow(self, follower_id: int, followed_id: int):
+        """Make one user follow another"""
+        follower, followed = self._user(follower_id), self._user(followed_id)
+        if follower == followed:
+            raise CommandError("A user cannot follow themselves")
+        already = followed in self.app.social_graph.outgoing_view(follower)
+        if not already:
+            self.app.social_graph.add_edge(follower, followed)
+        return {"changed": not already}
+
+    def cmd_unfollow(self, follower_id: int, followed_id: int):
+        """Remove a follow relationship"""
+        follower, followed = self._user(follower_id), self._user(followed_id)
+        following = followed in self.app.social_graph.outgoing_view(follower)
+        if following:
+            self.app.social_graph.remove_edge(follower, followed)
+        return {"changed": following}
+
+    def cmd_post(self, author_id: int, content: str):
+        """Publish a post"""
+        if not content.strip():
+            raise CommandError("Post content cannot be empty")
+        post = self.app.feed.publish(self._user(author_id), content)
+        return {"sequence": post.sequence}
+
+    def cmd_feed(self, user_id: int, limit: int = 20):
+        """Newest posts from the accounts a user follows"""
+        return [{"author_id": post.author.user_id, "content": post.content,
+                 "created_at": post.created_at, "sequence": post.sequence}
+                for post in self.app.feed.home_feed(self._user(user_id), limit)]
+
+    def cmd_search(self, query: str, limit: int = 20):
+        """Find users by (part of) their name"""
+        return [_describe(person) for person in self.app.users.search(query, limit)]
+
+    def cmd_path(self, source_id: int, target_id: int):
+        """Shortest follow path between two users, or null if there is none"""
+        path = self.app.social_graph.shortest_path(self._user(source_id), self._user(target_id))
+        return None if path is None else [_describe(person) for person in path]
+
+    def cmd_common_following(self, first_id: int, second_id: int):
+        """Accounts two users both follow"""
+        graph = self.app.social_graph
+        return [_describe(person) for person in graph.common_outgoing(self._user(first_id), self._user(second_id))]
+
+    def cmd_most_followed(self, limit: int = 10):
+        """Users with the most followers, kept current incrementally"""
+        if self.aggregates is None:
+            self.aggregates = FollowAggregates(self.app.social_graph)
+        return [dict(_describe(person), followers=count)
+                for person, count in self.aggregates.most_followed(limit)]
+
+    def cmd_mutual(self, first_id: int, second_id: int):
+        """Whether two users follow each other"""
+        first, second = self._user(first_id), self._user(second_id)
+        if self.aggregates is None:
+            self.aggregates = FollowAggregates(self.app.social_graph)
+        return {"mutual": self.aggregates.is_mutual(first, second)}
+
+    def execute(self, name: str, args: Iterable = (), kwargs: Optional[Dict[str, Any]] = None):
+        """Run one command; args are bound in COMMANDS order, then kwargs by name"""
+        spec = self.COMMANDS.get(name)
+        if spec is None:
+            raise CommandError(f"Unknown command: {name}")
+        args = list(args)
+        if len(args) > len(spec):
+            raise CommandError(f"{name} takes at most {len(spec)} arguments")
+        given = dict(zip((argument for argument, *_ in spec), args))
+        for argument, value in (kwargs or {}).items():
+            if argument in given:
+                raise CommandError(f"{name}: {argument} given twice")
+            given[argument] = value
+        unknown = given.keys() - {argument for argument, *_ in spec}
+        if unknown:
+            raise CommandError(f"{name}: unknown argument {min(unknown)}")
+        values = {}
+        try:
+            for argument, convert, *default in spec:
+                if argument in given:
+                    values[argument] = _coerce(argument, convert, default, given[argument])
+                elif not default:
+                    raise CommandError(f"{name}: missing argument {argument}")
+        except (TypeError, ValueError) as e:
+            raise CommandError(f"{name}: {e}") from None
+        # Outside the try: an error raised by the command itself is not a usage error
+        return getattr(self, "cmd_" + name.replace("-", "_"))(**values)
+
+    def execute_line(self, line: str):
+        """Run one batch line: a JSON object {"command": ..., <argument>: ...} or 'command arg ... --option value'
+
+        As with the argparse subcommands, --option value (or --option=value)
+        names an argument, dashes standing for underscores; other words are
+        bound in order, and everything after a lone -- is taken as words.
+        """
+        line = line.strip()
+        if line.startswith("{"):
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f"Invalid JSON: {e}") from None
+            name = request.pop("command", None)
+            if name is None:
+                raise CommandError("JSON commands need a 'command' field")
+            return self.execute(name, kwargs=request)
+        tokens = shlex.split(line) if '"' in line or "'" in line else line.split()
+        if not tokens:
+            raise CommandError("Empty command")
+        name, args, kwargs = tokens[0], [], {}
+        words = iter(tokens[1:])
+        for word in words:
+            if word == "--":
+                args.extend(words)
+            elif word.startswith("--"):
+                option, equals, value = word[2:].partition("=")
+                if not equals:
+                    value = next(words, None)
+                    if value is None:
+                        raise CommandError(f"{name}: --{option} needs a value")
+                kwargs[option.replace("-", "_")] = value
+            else:
+                args.append(word)
+        return self.execute(name, args, kwargs)
+
+    def run_batch(self, lines: Iterable[str], output: TextIO, stop_on_error: bool = False) -> int:
+        """Run every non-empty, non-comment line, writing one JSON result per line; returns the error count"""
+        errors = 0
+        write = output.write
+        dumps = json.dumps
+        for number, line in enumerate(lines, 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                write(dumps({"line": number, "ok": True, "result": self.execute_line(line)}) + "\n")
+            except Exception as e:
+                # Any failure is reported for its line; the rest of the batch still runs
+                errors += 1
+                message = str(e) if isinstance(e, CommandError) else f"{type(e).__name__}: {e}"
+                write(dumps({"line": number, "ok": False, "error": message}) + "\n")
+                if stop_on_error:
+                    break
+        return errors
+
+
+# Shown by "batch --help"
+BATCH_EXAMPLE = """example input:
+  # text lines take arguments in order, or as --option value like the subcommands
+  add-user "Ivy Chen" --privacy private
+  follow 1 9
+  users --limit 2
+  following 1 --viewer-id 2 --limit 10
+  {"command": "feed", "user_id": 1, "limit": 5}
+"""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """argparse parser with one subcommand per command, plus 'batch'"""
+    parser = argparse.ArgumentParser(description="Social Media App command interface "
+                                                 "(run without a command for the interactive menu)")
+    parser.add_argument("--no-sample-data", action="store_true", help="start with no users")
+    subparsers = parser.add_subparsers(dest="command")
+    for name, spec in SocialMediaCommands.COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=getattr(SocialMediaCommands,
+                                                             "cmd_" + name.replace("-", "_")).__doc__)
+        for argument, convert, *default in spec:
+            if default:
+                subparser.add_argument("--" + argument.replace("_", "-"), dest=argument,
+                                       type=convert, default=default[0])
+            else:
+                subparser.add_argument(argument, type=convert)
+    batch = subparsers.add_parser("batch", help="Run commands from a file or stdin, one per line, "
+                                                "printing one JSON result per line",
+                                  epilog=BATCH_EXAMPLE, formatter_class=argparse.RawDescriptionHelpFormatter)
+    batch.add_argument("file", nargs="?", default="-", help="command file ('-' for stdin)")
+    batch.add_argument("--stop-on-error", action="store_true")
+    return parser
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse a scripted invocation; the command is None when only options are given"""
+    return build_parser().parse_args(argv)
+
+
+def run(args: argparse.Namespace, create_app: Callable) -> int:
+    """Run the command of parse_args(...) and return the process exit status.
+
+    The app is only created now, by calling create_app(seed_sample_data=...).
+    """
+    args = vars(args)
+    commands = SocialMediaCommands(create_app(seed_sample_data=not args.pop("no_sample_data")))
+    name = args.pop("command")
+    if name == "batch":
+        if args["file"] == "-":
+            return 1 if commands.run_batch(sys.stdin, sys.stdout, args["stop_on_error"]) else 0
+        with open(args["file"]) as handle:
+            return 1 if commands.run_batch(handle, sys.stdout, args["stop_on_error"]) else 0
+    try:
+        result = commands.execute(name, kwargs=args)
+    except CommandError as e:
+        print(json.dumps({"ok": False, "error": str(e)}))
+        return 1
+    print(json.dumps({"ok": True, "result": result}))
+    return 0
@@ -0,0 +1,149 @@
+import heapq
+import time
+from collections import deque
+from itertools import count, islice
+from typing import Deque, Dict, Iterator, List, Optional
+
+from graph import EDGE_REMOVED, Graph, GraphEvent
+from person import Person
+
+FAN_OUT = "fan_out"    # push every post into each follower's inbox at write time
+FAN_IN = "fan_in"      # merge the followed authors' timelines at read time
+HYBRID = "hybrid"      # fan out, except for high-follower authors who are pulled on read
+
+
+class Post:
+    """A single post authored by a Person"""
+
+    _sequence = count(1)
+
+    def __init__(self, author: Person, content: str):
+        self.author = author
+        self.content = content
+        self.created_at = time.time()
+        # Strictly increasing across all posts, so it orders feeds without ties
+        self.sequence = next(Post._sequence)
+
+    def __str__(self) -> str:
+        posted = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created_at))
+        return f"[{posted}] {self.author.name}: {self.content}"
+
+
+class FeedService:
+    """Home-feed generation over the follow graph.
+
+    In FAN_OUT mode publishing a post appends it to a bounded inbox for every
+    follower, so reading a feed is a slice of one deque. In FAN_IN mode nothing
+    is copied on write and the feed is a lazy k-way heap merge of the newest
+    posts of every followed account. HYBRID fans out for ordinary accounts but
+    treats authors with at least celebrity_threshold followers as pull-only,
+    which bounds the write amplification of a single post. The choice is made
+    once per post, when it is published: readers pull exactly the posts that
+    were not pushed, so an author crossing the threshold in either direction
+    loses no posts from followers' feeds.
+
+    Inboxes are filled at publish time only: following someone does not
+    backfill their older posts into a FAN_OUT inbox. Unfollowing someone does
+    remove their posts from the inbox, through the graph's change feed.
+    """
+
+    def __init__(self, graph: Graph[Person], mode: str = HYBRID, inbox_size: int = 500,
+                 celebrity_threshold: int = 10_000):
+        if mode not in (FAN_OUT, FAN_IN, HYBRID):
+            raise ValueError(f"Unknown feed mode: {mode}")
+        self.graph = graph
+        self.mode = mode
+        self.inbox_size = inbox_size
+        self.celebrity_threshold = celebrity_threshold
+        self.inboxes: Dict[Person, Deque[Post]] = {}
+        self.pulled_posts: Dict[Person, List[Post]] = {}  # HYBRID: posts not pushed, oldest first
+        self.posts_published = 0
+        self.inbox_writes = 0  # write amplification = inbox_writes / posts_published
+        graph.subscribe(self._on_graph_change)
+
+    def close(self) -> None:
+        """Stop following the graph's changes"""
+        self.graph.unsubscribe(self._on_graph_change)
+
+    def _on_graph_change(self, event: GraphEvent) -> None:
+        """Drop an unfollowed author's posts from the follower's inbox"""
+        if event.kind != EDGE_REMOVED:
+            return
+        inbox = self.inboxes.get(event.source)
+        if inbox:
+            unfollowed = event.target
+            kept = [post for post in inbox if post.author != unfollowed]
+            if len(kept) != len(inbox):
+                inbox.clear()
+                inbox.extend(kept)
+
+    def is_celebrity(self, person: Person) -> bool:
+        """Whether a post person publishes now is pulled at read time instead of pushed"""
+        if self.mode == FAN_IN:
+            return True
+        if self.mode == FAN_OUT:
+            return False
+        return self.graph.in_degree(person) >= self.celebrity_threshold
+
+    def publish(self, author: Person, content: str) -> Post:
+        """Create a post for author and deliver it according to the feed mode"""
+        post = Post(author, content)
+        author.posts.append(post)
+        self.posts_published += 1
+
+        if self.is_celebrity(author):
+            if self.mode == HYBRID:
+                self.pulled_posts.setdefault(author, []).append(post)
+        else:
+            inboxes = self.inboxes
+            followers = self.graph.list_incoming_adjacent_vertex(author)
+            for follower in followers:
+                inbox = inboxes.get(follower)
+                if inbox is None:
+                    inbox = inboxes[follower] = deque(maxlen=self.inbox_size)
+                inbox.append(post)
+            self.inbox_writes += len(followers)
+        return post
+
+    def home_feed(self, person: Person, limit: int = 20) -> List[Post]:
+        """The newest limit posts from accounts person follows, newest first"""
+        return list(islice(self.iter_home_feed(person), limit))
+
+    def iter_home_feed(self, person: Person) -> Iterator[Post]:
+        """Lazily yield person's home feed, newest first"""
+        followed = self.graph.list_outgoing_adjacent_vertex(person)
+        if self.mode == FAN_IN:
+            return _merge_newest_first([reversed(author.posts) for author in followed])
+
+        inbox = self.inboxes.get(person)
+        sources = [reversed(inbox)] if inbox else []
+        if self.mode == HYBRID:
+            pulled_posts = self.pulled_posts
+            sources.extend(reversed(pulled_posts[author]) for author in followed if author in pulled_posts)
+        return _merge_newest_first(sources)
+
+    def write_amplification(self) -> float:
+        """Average number of inbox writes caused by one published post"""
+        if self.posts_published == 0:
+            return 0.0
+        return self.inbox_writes / self.posts_published
+
+    def inbox_of(self, person: Person) -> Optional[Deque[Post]]:
+        """The materialized inbox of person (None in FAN_IN mode or if empty)"""
+        return self.inboxes.get(person)
+
+
+def _merge_newest_first(timelines: List[Iterator[Post]]) -> Iterator[Post]:
+    """k-way heap merge of timelines that are each already newest first.
+
+    Duplicates (the same post in two timelines) are adjacent after the merge
+    and yielded once.
+    """
+    if len(timelines) == 1:
+        yield from timelines[0]
+        return
+    last_sequence = 0
+    for post in heapq.merge(*timelines, key=lambda post: post.sequence, reverse=True):
+        if post.sequence != last_sequence:
+            last_sequence = post.sequence
+            yield post
@@ -0,0 +1,59 @@
+import random
+import statistics
+import time
+from typing import List
+
+from feed import FAN_IN, FAN_OUT, HYBRID, FeedService
+from graph_generators import build_power_law_graph
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_feed_benchmark(user_count: int = 10_000, follows_per_user: int = 20, posts: int = 10_000,
+                       reads: int = 5_000, feed_size: int = 20, celebrity_threshold: int = 500,
+                       seed: int = 42) -> None:
+    """Compare publish latency, feed latency and write amplification per feed mode"""
+    print(f"Building power-law graph: {user_count:,} users, ~{follows_per_user} follows each...")
+    graph = build_power_law_graph(user_count, follows_per_user, seed)
+    people = graph.get_all_vertices()
+    max_followers = max(len(graph.list_incoming_adjacent_vertex(p)) for p in people)
+    print(f"Most-followed account has {max_followers:,} followers\n")
+
+    print(f"{'Mode':<10} {'Publish p50 (us)':>17} {'Publish p99 (us)':>17} "
+          f"{'Feed p50 (us)':>14} {'Feed p99 (us)':>14} {'Write amp.':>11}")
+    print("-" * 88)
+
+    for mode in (FAN_OUT, FAN_IN, HYBRID):
+        for person in people:
+            person.posts = []
+        service = FeedService(graph, mode, celebrity_threshold=celebrity_threshold)
+        rng = random.Random(seed)
+
+        # A followee of a random user is picked in proportion to follower count,
+        # so popular accounts post most often, as they do in practice
+        authors = [rng.choice(graph.list_outgoing_adjacent_vertex(p) or [p]) for p in
+                   (rng.choice(people) for _ in range(posts))]
+        publish_times = []
+        for i, author in enumerate(authors):
+            start = time.perf_counter()
+            service.publish(author, f"post {i}")
+            publish_times.append((time.perf_counter() - start) * 1e6)
+
+        read_times = []
+        for _ in range(reads):
+            reader = rng.choice(people)
+            start = time.perf_counter()
+            service.home_feed(reader, feed_size)
+            read_times.append((time.perf_counter() - start) * 1e6)
+
+        print(f"{mode:<10} {statistics.median(publish_times):>17.1f} {_percentile(publish_times, 0.99):>17.1f} "
+              f"{statistics.median(read_times):>14.1f} {_percentile(read_times, 0.99):>14.1f} "
+              f"{service.write_amplification():>11.1f}")
+        service.close()
+
+
+if __name__ == "__main__":
+    run_feed_benchmark()
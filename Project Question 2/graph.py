@@ -1,42 +1,183 @@
-from typing import TypeVar, Generic, List, Dict, Optional
+from collections import deque
+from typing import TypeVar, Generic, Callable, Deque, List, Dict, Optional, Sequence, Iterable, Iterator, NamedTuple, Tuple
+
+from profiling import profiled
 
 T = TypeVar('T')
 
+# Kinds of GraphEvent
+VERTEX_ADDED = "vertex_added"
+EDGE_ADDED = "edge_added"
+EDGE_REMOVED = "edge_removed"
+
+
+class ListView(Sequence[T]):
+    """Read-only, zero-copy view over a list owned by the graph.
+
+    The view reflects later changes to the underlying list.
+    """
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[T]):
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"ListView({self._items!r})"
+
+
+class GraphEvent(NamedTuple):
+    """One change to a Graph; target is None for VERTEX_ADDED"""
+    kind: str
+    source: T
+    target: Optional[T]
+    sequence: int  # 1, 2, 3, ... in the order the changes were made
+
+
+class Page(NamedTuple):
+    """One page of a listing; pass next_cursor back to fetch the following page.
+
+    A cursor is an offset into the listed sequence, not a key. For
+    page_vertices it stays valid, since vertices are only ever appended.
+    Adjacency listings are exact only while the list is unchanged: new
+    edges are appended and simply show up on a later page, but every edge
+    removed before the cursor shifts later items back, so the next page
+    skips one item. Restart from 0 for a fresh listing.
+    """
+    items: List[T]
+    next_cursor: Optional[int]  # None when this is the last page
+
+
+_EMPTY: List = []
+
 
 class Graph(Generic[T]):
     def __init__(self):
         self.vertices: List[T] = []
         self.adjacency_list: Dict[T, List[T]] = {}
         self.incoming_edges: Dict[T, List[T]] = {}  # For tracking followers
+        self._index: Dict[T, int] = {}  # vertex -> position in self.vertices
+        # Traversal scratch space, indexed by vertex position. A slot counts as
+        # visited when its stamp equals the current epoch, so it never needs clearing.
+        self._epoch = 0
+        self._forward_seen: List[int] = []
+        self._backward_seen: List[int] = []
+        self._forward_parent: List[int] = []
+        self._backward_parent: List[int] = []
+        self._forward_depth: List[int] = []
+        self._backward_depth: List[int] = []
+        # Change feed: events are only built while someone is listening
+        self._subscribers: List[Callable[[GraphEvent], None]] = []
+        self._change_log: Optional[Deque[GraphEvent]] = None
+        self._event_sequence = 0
+        self.sorted_adjacency = None  # set by enable_sorted_adjacency()
+
+    def subscribe(self, callback: Callable[[GraphEvent], None]) -> None:
+        """Call callback(event) synchronously after every change to the graph"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[GraphEvent], None]) -> None:
+        self._subscribers.remove(callback)
+
+    def enable_change_log(self, max_events: int = 100_000) -> None:
+        """Keep the most recent max_events events for events_since()"""
+        self._change_log = deque(self._change_log or (), maxlen=max_events)
+
+    def events_since(self, sequence: int) -> List[GraphEvent]:
+        """Logged events with a sequence number above sequence, oldest first.
+
+        Raises LookupError if some of those events have already been dropped
+        from the log, so a consumer knows it must rebuild instead of catch up.
+        """
+        log = self._change_log
+        if log is None:
+            raise LookupError("The change log is not enabled")
+        if sequence < self._event_sequence and (not log or log[0].sequence > sequence + 1):
+            raise LookupError(f"Events after {sequence} are no longer in the change log")
+        return [event for event in log if event.sequence > sequence]
+
+    def _emit(self, kind: str, source: T, target: Optional[T]) -> None:
+        self._event_sequence += 1
+        event = GraphEvent(kind, source, target, self._event_sequence)
+        if self._change_log is not None:
+            self._change_log.append(event)
+        for callback in self._subscribers:
+            callback(event)
 
     def add_vertex(self, vertex: T) -> None:
         """Add a new vertex to the graph"""
-        if vertex not in self.vertices:
+        if vertex not in self._index:
+            self._index[vertex] = len(self.vertices)
             self.vertices.append(vertex)
             self.adjacency_list[vertex] = []
             self.incoming_edges[vertex] = []
+            self._forward_seen.append(0)
+            self._backward_seen.append(0)
+            self._forward_parent.append(-1)
+            self._backward_parent.append(-1)
+            self._forward_depth.append(0)
+            self._backward_depth.append(0)
+            if self._subscribers or self._change_log is not None:
+                self._emit(VERTEX_ADDED, vertex, None)
 
+    @profiled
     def add_edge(self, from_vertex: T, to_vertex: T) -> None:
         """Connect one vertex with another vertex (directed edge)"""
-        if from_vertex not in self.vertices:
+        if from_vertex not in self._index:
             self.add_vertex(from_vertex)
-        if to_vertex not in self.vertices:
+        if to_vertex not in self._index:
             self.add_vertex(to_vertex)
 
+        changed = False
         if to_vertex not in self.adjacency_list[from_vertex]:
             self.adjacency_list[from_vertex].append(to_vertex)
+            changed = True
 
         if from_vertex not in self.incoming_edges[to_vertex]:
             self.incoming_edges[to_vertex].append(from_vertex)
 
+        if changed and (self._subscribers or self._change_log is not None):
+            self._emit(EDGE_ADDED, from_vertex, to_vertex)
+
+    def add_new_edges(self, edges: Iterable[Tuple[T, T]]) -> None:
+        """Bulk-load (from_vertex, to_vertex) edges that are not in the graph yet.
+
+        Skips the duplicate checks of add_edge, which scan the adjacency lists
+        and get slow around high-degree vertices; the caller guarantees that
+        no edge is repeated or already present.
+        """
+        adjacency_list, incoming_edges, index = self.adjacency_list, self.incoming_edges, self._index
+        for from_vertex, to_vertex in edges:
+            if from_vertex not in index:
+                self.add_vertex(from_vertex)
+            if to_vertex not in index:
+                self.add_vertex(to_vertex)
+            adjacency_list[from_vertex].append(to_vertex)
+            incoming_edges[to_vertex].append(from_vertex)
+            if self._subscribers or self._change_log is not None:
+                self._emit(EDGE_ADDED, from_vertex, to_vertex)
+
     def remove_edge(self, from_vertex: T, to_vertex: T) -> None:
         """Remove an edge between two vertices"""
+        changed = False
         if from_vertex in self.adjacency_list and to_vertex in self.adjacency_list[from_vertex]:
             self.adjacency_list[from_vertex].remove(to_vertex)
+            changed = True
 
         if to_vertex in self.incoming_edges and from_vertex in self.incoming_edges[to_vertex]:
             self.incoming_edges[to_vertex].remove(from_vertex)
 
+        if changed and (self._subscribers or self._change_log is not None):
+            self._emit(EDGE_REMOVED, from_vertex, to_vertex)
+
     def list_outgoing_adjacent_vertex(self, vertex: T) -> List[T]:
         """List all vertices in which edges are outgoing from this vertex"""
         return self.adjacency_list.get(vertex, [])
@@ -51,7 +192,228 @@ class Graph(Generic[T]):
 
     def vertex_exists(self, vertex: T) -> bool:
         """Check if a vertex exists in the graph"""
-        return vertex in self.vertices
+        return vertex in self._index
+
+    def vertex_count(self) -> int:
+        """Number of vertices in the graph"""
+        return len(self.vertices)
+
+    def out_degree(self, vertex: T) -> int:
+        """Number of vertices this vertex points to (accounts followed), in O(1)"""
+        return len(self.adjacency_list.get(vertex, _EMPTY))
+
+    def in_degree(self, vertex: T) -> int:
+        """Number of vertices pointing to this vertex (followers), in O(1)"""
+        return len(self.incoming_edges.get(vertex, _EMPTY))
+
+    def vertices_view(self) -> ListView[T]:
+        """Read-only view of all vertices, without copying"""
+        return ListView(self.vertices)
+
+    def outgoing_view(self, vertex: T) -> ListView[T]:
+        """Read-only view of the vertices this vertex points to, without copying"""
+        return ListView(self.adjacency_list.get(vertex, _EMPTY))
+
+    def incoming_view(self, vertex: T) -> ListView[T]:
+        """Read-only view of the vertices pointing to this vertex, without copying"""
+        return ListView(self.incoming_edges.get(vertex, _EMPTY))
+
+    def page_vertices(self, cursor: int = 0, limit: int = 50) -> Page:
+        """One page of vertices in insertion order, starting at cursor"""
+        return _page(self.vertices, cursor, limit)
+
+    def page_outgoing(self, vertex: T, cursor: int = 0, limit: int = 50) -> Page:
+        """One page of the vertices this vertex points to, starting at offset cursor (see Page)"""
+        return _page(self.adjacency_list.get(vertex, _EMPTY), cursor, limit)
+
+    def page_incoming(self, vertex: T, cursor: int = 0, limit: int = 50) -> Page:
+        """One page of the vertices pointing to this vertex, starting at offset cursor (see Page)"""
+        return _page(self.incoming_edges.get(vertex, _EMPTY), cursor, limit)
+
+    def _next_epoch(self) -> int:
+        """Start a new traversal, invalidating every visited stamp in O(1)"""
+        self._epoch += 1
+        return self._epoch
+
+    def shortest_path(self, source: T, target: T) -> Optional[List[T]]:
+        """Find a shortest directed path from source to target using bidirectional BFS.
+
+        The forward frontier follows outgoing edges from the source while the
+        backward frontier follows incoming edges (followers) from the target; the
+        smaller frontier is always expanded next. Returns the list of vertices on
+        the path (including both ends), or None if target is unreachable.
+        """
+        if source not in self._index or target not in self._index:
+            return None
+        if source == target:
+            return [source]
+
+        index = self._index
+        vertices = self.vertices
+        epoch = self._next_epoch()
+        forward_seen, backward_seen = self._forward_seen, self._backward_seen
+        forward_parent, backward_parent = self._forward_parent, self._backward_parent
+        forward_depth, backward_depth = self._forward_depth, self._backward_depth
+
+        source_id = index[source]
+        target_id = index[target]
+        forward_seen[source_id] = epoch
+        forward_parent[source_id] = -1
+        forward_depth[source_id] = 0
+        backward_seen[target_id] = epoch
+        backward_parent[target_id] = -1
+        backward_depth[target_id] = 0
+        forward_frontier = [source_id]
+        backward_frontier = [target_id]
+        meeting = -1
+
+        while forward_frontier and backward_frontier and meeting < 0:
+            # Expand the cheaper side one full level at a time
+            if len(forward_frontier) <= len(backward_frontier):
+                edges, frontier = self.adjacency_list, forward_frontier
+                seen, parent, depth = forward_seen, forward_parent, forward_depth
+                other_seen, other_depth = backward_seen, backward_depth
+            else:
+                edges, frontier = self.incoming_edges, backward_frontier
+                seen, parent, depth = backward_seen, backward_parent, backward_depth
+                other_seen, other_depth = forward_seen, forward_depth
+
+            # Finish the whole level before stopping: the first meeting found is
+            # not necessarily the shortest, the one with the smallest total is
+            next_frontier = []
+            best_length = -1
+            for vertex_id in frontier:
+                next_depth = depth[vertex_id] + 1
+                for neighbour in edges[vertices[vertex_id]]:
+                    neighbour_id = index[neighbour]
+                    if seen[neighbour_id] == epoch:
+                        continue
+                    seen[neighbour_id] = epoch
+                    parent[neighbour_id] = vertex_id
+                    depth[neighbour_id] = next_depth
+                    if other_seen[neighbour_id] == epoch:
+                        length = next_depth + other_depth[neighbour_id]
+                        if best_length < 0 or length < best_length:
+                            best_length = length
+                            meeting = neighbour_id
+                    else:
+                        next_frontier.append(neighbour_id)
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        if meeting < 0:
+            return None
+
+        path = []
+        vertex_id = meeting
+        while vertex_id >= 0:
+            path.append(vertices[vertex_id])
+            vertex_id = forward_parent[vertex_id]
+        path.reverse()
+        vertex_id = backward_parent[meeting]
+        while vertex_id >= 0:
+            path.append(vertices[vertex_id])
+            vertex_id = backward_parent[vertex_id]
+        return path
+
+    def degrees_of_separation(self, source: T, target: T) -> int:
+        """Number of follow hops from source to target, or -1 if unreachable"""
+        path = self.shortest_path(source, target)
+        if path is None:
+            return -1
+        return len(path) - 1
+
+    def k_hop_neighbours(self, vertex: T, k: int, limit: Optional[int] = None,
+                         incoming: bool = False, allowed: Optional[Sequence[int]] = None) -> Dict[T, int]:
+        """Vertices reachable from vertex within k hops, mapped to their hop distance.
+
+        Follows outgoing edges by default, or incoming edges (followers of
+        followers) when incoming is True. The start vertex itself is excluded.
+        The search stops as soon as depth k is exhausted or limit vertices have
+        been collected. allowed, if given, holds a flag per vertex position:
+        vertices whose flag is 0 are neither reported nor expanded.
+        """
+        result: Dict[T, int] = {}
+        if vertex not in self._index or k <= 0 or limit == 0:
+            return result
+        if allowed is not None and not allowed[self._index[vertex]]:
+            return result
+
+        index = self._index
+        vertices = self.vertices
+        edges = self.incoming_edges if incoming else self.adjacency_list
+        epoch = self._next_epoch()
+        seen = self._forward_seen
+
+        start_id = index[vertex]
+        seen[start_id] = epoch
+        queue = deque([(start_id, 0)])
+        while queue:
+            vertex_id, depth = queue.popleft()
+            if depth == k:
+                continue
+            for neighbour in edges[vertices[vertex_id]]:
+                neighbour_id = index[neighbour]
+                if seen[neighbour_id] == epoch:
+                    continue
+                seen[neighbour_id] = epoch
+                if allowed is not None and not allowed[neighbour_id]:
+                    continue
+                result[neighbour] = depth + 1
+                if limit is not None and len(result) >= limit:
+                    return result
+                queue.append((neighbour_id, depth + 1))
+        return result
+
+    def enable_sorted_adjacency(self, dense_ratio: int = 64):
+        """Maintain sorted integer adjacency (and bitsets for dense hubs) for
+        the overlap queries below; returns the SortedAdjacency"""
+        if self.sorted_adjacency is None:
+            from sorted_adjacency import SortedAdjacency
+            self.sorted_adjacency = SortedAdjacency(self, dense_ratio)
+        return self.sorted_adjacency
+
+    def common_outgoing(self, a: T, b: T) -> List[T]:
+        """Vertices both a and b point to (who do a and b both follow)"""
+        return self._common(a, b, incoming=False)
+
+    def common_incoming(self, a: T, b: T) -> List[T]:
+        """Vertices pointing to both a and b (followers they have in common)"""
+        return self._common(a, b, incoming=True)
+
+    def _common(self, a: T, b: T, incoming: bool) -> List[T]:
+        if a not in self._index or b not in self._index:
+            return []
+        if self.sorted_adjacency is not None:
+            vertices = self.vertices
+            return [vertices[i] for i in self.sorted_adjacency.common(self._index[a], self._index[b], incoming)]
+        edges = self.incoming_edges if incoming else self.adjacency_list
+        other = set(edges[b])
+        return [vertex for vertex in edges[a] if vertex in other]
+
+    def is_mutual(self, a: T, b: T) -> bool:
+        """Whether a and b point to each other (a mutual follow)"""
+        return self.are_mutual([(a, b)])[0]
 
+    def are_mutual(self, pairs: List[tuple]) -> List[bool]:
+        """Batched is_mutual over (a, b) pairs"""
+        index = self._index
+        if self.sorted_adjacency is not None:
+            known = [a in index and b in index for a, b in pairs]
+            answers = iter(self.sorted_adjacency.are_mutual(
+                (index[a], index[b]) for (a, b), ok in zip(pairs, known) if ok))
+            return [next(answers) if ok else False for ok in known]
+        adjacency = self.adjacency_list
+        return [a != b and a in index and b in index and b in adjacency[a] and a in adjacency[b]
+                for a, b in pairs]
 
 
+def _page(items: List[T], cursor: int, limit: int) -> Page:
+    """Slice one page out of items; only the page itself is copied"""
+    if cursor < 0 or limit <= 0:
+        raise ValueError("cursor must be >= 0 and limit must be > 0")
+    end = cursor + limit
+    return Page(items[cursor:end], end if end < len(items) else None)
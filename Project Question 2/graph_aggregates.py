@@ -0,0 +1,151 @@
+import heapq
+from typing import Dict, Generic, List, Optional, Set, Tuple
+
+from graph import EDGE_ADDED, EDGE_REMOVED, VERTEX_ADDED, Graph, GraphEvent, T
+
+
+class FollowAggregates(Generic[T]):
+    """Follower counts, mutual follows and the most-followed users of a Graph,
+    kept current from its change feed instead of recomputed.
+
+    Every event costs O(1): degree counters are dicts, and vertices are
+    bucketed by in-degree, with the non-empty degrees in a doubly linked list
+    in ascending order. A follow or unfollow moves an in-degree by exactly
+    one, so a new bucket is linked next to the old one without searching, and
+    most_followed(k) walks down from the top bucket, only ordering the tied
+    vertices of the buckets it reads. Mutual-follow checks use a set of
+    followed vertices per vertex (a second copy of the out-edges, traded for
+    O(1) membership tests).
+    """
+
+    def __init__(self, graph: Graph[T]):
+        self.graph = graph
+        self.in_degree: Dict[T, int] = {}
+        self.out_degree: Dict[T, int] = {}
+        self.mutual_count: Dict[T, int] = {}  # vertex -> number of mutual follows it is part of
+        self.mutual_pairs = 0
+        self._following: Dict[T, Set[T]] = {}
+        self._rank: Dict[T, int] = {}  # vertex -> order it was added in, to break ties
+        self._by_in_degree: Dict[int, Set[T]] = {}  # in-degree -> vertices (all degrees, including 0)
+        # Non-empty degrees as a doubly linked list: the next lower and higher
+        # degree of each, and the lowest and highest (None when empty)
+        self._lower: Dict[int, Optional[int]] = {}
+        self._higher: Dict[int, Optional[int]] = {}
+        self._bottom: Optional[int] = None
+        self._top: Optional[int] = None
+
+        for vertex in graph.vertices:
+            self._add_vertex(vertex)
+        for vertex in graph.vertices:
+            for followed in graph.adjacency_list[vertex]:
+                self._add_edge(vertex, followed)
+        graph.subscribe(self.apply)
+
+    def close(self) -> None:
+        """Stop following the graph's changes"""
+        self.graph.unsubscribe(self.apply)
+
+    def apply(self, event: GraphEvent) -> None:
+        """Change-feed callback"""
+        if event.kind == EDGE_ADDED:
+            self._add_edge(event.source, event.target)
+        elif event.kind == EDGE_REMOVED:
+            self._remove_edge(event.source, event.target)
+        elif event.kind == VERTEX_ADDED:
+            self._add_vertex(event.source)
+
+    def _add_vertex(self, vertex: T) -> None:
+        if vertex in self.in_degree:
+            return
+        self.in_degree[vertex] = 0
+        self.out_degree[vertex] = 0
+        self.mutual_count[vertex] = 0
+        self._following[vertex] = set()
+        self._rank[vertex] = len(self._rank)
+        self._bucket_add(vertex, 0, None)  # 0 is the lowest degree there can be
+
+    def _bucket_add(self, vertex: T, degree: int, below: Optional[int]) -> None:
+        # below: the non-empty degree a new bucket is linked just above (None for the bottom)
+        bucket = self._by_in_degree.get(degree)
+        if bucket is None:
+            bucket = self._by_in_degree[degree] = set()
+            above = self._bottom if below is None else self._higher[below]
+            self._lower[degree] = below
+            self._higher[degree] = above
+            if below is None:
+                self._bottom = degree
+            else:
+                self._higher[below] = degree
+            if above is None:
+                self._top = degree
+            else:
+                self._lower[above] = degree
+        bucket.add(vertex)
+
+    def _bucket_remove(self, vertex: T, degree: int) -> None:
+        bucket = self._by_in_degree[degree]
+        bucket.discard(vertex)
+        if not bucket:
+            del self._by_in_degree[degree]
+            below = self._lower.pop(degree)
+            above = self._higher.pop(degree)
+            if below is None:
+                self._bottom = above
+            else:
+                self._higher[below] = above
+            if above is None:
+                self._top = below
+            else:
+                self._lower[above] = below
+
+    def _move(self, vertex: T, delta: int) -> None:
+        # Link the new bucket next to the old one while that is still non-empty
+        degree = self.in_degree[vertex]
+        self.in_degree[vertex] = degree + delta
+        self._bucket_add(vertex, degree + delta, degree if delta > 0 else self._lower[degree])
+        self._bucket_remove(vertex, degree)
+
+    def _add_edge(self, source: T, target: T) -> None:
+        self._add_vertex(source)
+        self._add_vertex(target)
+        following = self._following[source]
+        if target in following:
+            return
+        following.add(target)
+        self.out_degree[source] += 1
+        self._move(target, +1)
+        if source != target and source in self._following[target]:
+            self.mutual_pairs += 1
+            self.mutual_count[source] += 1
+            self.mutual_count[target] += 1
+
+    def _remove_edge(self, source: T, target: T) -> None:
+        following = self._following.get(source)
+        if not following or target not in following:
+            return
+        following.remove(target)
+        self.out_degree[source] -= 1
+        self._move(target, -1)
+        if source != target and source in self._following[target]:
+            self.mutual_pairs -= 1
+            self.mutual_count[source] -= 1
+            self.mutual_count[target] -= 1
+
+    def is_mutual(self, a: T, b: T) -> bool:
+        """Whether a and b follow each other"""
+        return a != b and b in self._following.get(a, ()) and a in self._following.get(b, ())
+
+    def most_followed(self, k: int = 10) -> List[Tuple[T, int]]:
+        """Up to k (vertex, follower count) pairs with the most followers, highest first.
+
+        Ties are listed in the order the vertices were added, so equal inputs
+        give equal results.
+        """
+        top: List[Tuple[T, int]] = []
+        degree = self._top
+        while degree and len(top) < k:
+            bucket = self._by_in_degree[degree]
+            for vertex in heapq.nsmallest(k - len(top), bucket, key=self._rank.__getitem__):
+                top.append((vertex, degree))
+            degree = self._lower[degree]
+        return top
@@ -0,0 +1,297 @@
+from array import array
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar
+
+from graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # analytics still work, just through the pure Python loops
+    np = None
+
+T = TypeVar('T')
+
+
+class GraphSnapshot(Generic[T]):
+    """Immutable integer-indexed copy of a Graph in compressed sparse row form.
+
+    Vertex i of the snapshot is graph.vertices[i]. The out-edges of i are
+    targets[out_offsets[i]:out_offsets[i + 1]] and its in-edges are
+    sources[in_offsets[i]:in_offsets[i + 1]]. Every analytics pass below runs
+    over these flat integer arrays instead of walking the Person dictionaries.
+    """
+
+    def __init__(self, graph: Graph[T]):
+        self.vertices: List[T] = graph.get_all_vertices()
+        index = graph._index  # positions already match self.vertices
+        self.vertex_count = len(self.vertices)
+
+        self.out_offsets = array('q', [0])
+        self.targets = array('q')
+        for vertex in self.vertices:
+            self.targets.extend(index[v] for v in graph.list_outgoing_adjacent_vertex(vertex))
+            self.out_offsets.append(len(self.targets))
+
+        self.in_offsets = array('q', [0])
+        self.sources = array('q')
+        for vertex in self.vertices:
+            self.sources.extend(index[v] for v in graph.list_incoming_adjacent_vertex(vertex))
+            self.in_offsets.append(len(self.sources))
+
+        self.edge_count = len(self.targets)
+
+    def out_degrees(self) -> Sequence[int]:
+        """Out-degree (accounts followed) of every vertex"""
+        offsets = self.out_offsets
+        return [offsets[i + 1] - offsets[i] for i in range(self.vertex_count)]
+
+    def in_degrees(self) -> Sequence[int]:
+        """In-degree (followers) of every vertex"""
+        offsets = self.in_offsets
+        return [offsets[i + 1] - offsets[i] for i in range(self.vertex_count)]
+
+    def to_numpy(self):
+        """Zero-copy NumPy views of (out_offsets, targets, in_offsets, sources)"""
+        if np is None:
+            raise ImportError("NumPy is required for vectorized graph analytics")
+        return (np.frombuffer(self.out_offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.in_offsets, dtype=np.int64),
+                np.frombuffer(self.sources, dtype=np.int64))
+
+    def labelled(self, values: Sequence) -> Dict[T, object]:
+        """Map a per-vertex result array back onto the original vertices"""
+        return {vertex: values[i] for i, vertex in enumerate(self.vertices)}
+
+
+def pagerank(snapshot: GraphSnapshot, damping: float = 0.85, tolerance: float = 1e-6,
+             max_iterations: int = 100) -> List[float]:
+    """PageRank score of every snapshot vertex by power iteration.
+
+    Rank held by vertices with no outgoing edges is spread evenly over all
+    vertices. Iteration stops once the L1 change between two rounds drops
+    below tolerance, or after max_iterations rounds.
+    """
+    n = snapshot.vertex_count
+    if n == 0:
+        return []
+    if not 0.0 <= damping <= 1.0:
+        raise ValueError("damping must be between 0 and 1")
+
+    if np is not None:
+        return _pagerank_numpy(snapshot, damping, tolerance, max_iterations)
+
+    out_degrees = snapshot.out_degrees()
+    offsets, targets = snapshot.out_offsets, snapshot.targets
+    rank = [1.0 / n] * n
+    for _ in range(max_iterations):
+        dangling = sum(rank[i] for i in range(n) if out_degrees[i] == 0)
+        base = (1.0 - damping) / n + damping * dangling / n
+        new_rank = [base] * n
+        for i in range(n):
+            degree = out_degrees[i]
+            if degree:
+                share = damping * rank[i] / degree
+                for j in range(offsets[i], offsets[i + 1]):
+                    new_rank[targets[j]] += share
+        delta = sum(abs(new_rank[i] - rank[i]) for i in range(n))
+        rank = new_rank
+        if delta < tolerance:
+            break
+    return rank
+
+
+def _pagerank_numpy(snapshot: GraphSnapshot, damping: float, tolerance: float,
+                    max_iterations: int) -> List[float]:
+    """Vectorized PageRank: one bincount scatter per iteration"""
+    n = snapshot.vertex_count
+    out_offsets, targets, _, _ = snapshot.to_numpy()
+    out_degrees = np.diff(out_offsets)
+    edge_sources = np.repeat(np.arange(n, dtype=np.int64), out_degrees)
+    dangling_mask = out_degrees == 0
+    inverse_degree = np.zeros(n)
+    np.divide(1.0, out_degrees, out=inverse_degree, where=~dangling_mask)
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        share = rank * inverse_degree
+        new_rank = np.bincount(targets, weights=share[edge_sources], minlength=n) * damping
+        new_rank += (1.0 - damping) / n + damping * rank[dangling_mask].sum() / n
+        delta = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if delta < tolerance:
+            break
+    return rank.tolist()
+
+
+def weakly_connected_components(snapshot: GraphSnapshot) -> List[int]:
+    """Component label of every vertex, ignoring edge direction.
+
+    Labels are the smallest vertex index in each component.
+    """
+    n = snapshot.vertex_count
+    if n == 0:
+        return []
+    if np is not None:
+        return _weakly_connected_components_numpy(snapshot)
+
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    offsets, targets = snapshot.out_offsets, snapshot.targets
+    for i in range(n):
+        for j in range(offsets[i], offsets[i + 1]):
+            root_a, root_b = find(i), find(targets[j])
+            if root_a != root_b:
+                # Hook the larger root under the smaller so labels are minimal
+                if root_a < root_b:
+                    parent[root_b] = root_a
+                else:
+                    parent[root_a] = root_b
+    return [find(i) for i in range(n)]
+
+
+def _weakly_connected_components_numpy(snapshot: GraphSnapshot) -> List[int]:
+    """Vectorized hook-and-compress (Shiloach-Vishkin style) connected components"""
+    n = snapshot.vertex_count
+    out_offsets, targets, _, _ = snapshot.to_numpy()
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(out_offsets))
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        label_a, label_b = labels[sources], labels[targets]
+        unmerged = label_a != label_b
+        if not unmerged.any():
+            return labels.tolist()
+        low = np.minimum(label_a[unmerged], label_b[unmerged])
+        high = np.maximum(label_a[unmerged], label_b[unmerged])
+        # Hook every root under the smallest root it touches, then jump pointers
+        # until every label is a root again
+        np.minimum.at(labels, high, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def strongly_connected_components(snapshot: GraphSnapshot) -> List[int]:
+    """Component label of every vertex, following edge direction.
+
+    Uses Tarjan's algorithm with an explicit stack, so arbitrarily deep graphs
+    do not hit Python's recursion limit. Labels are numbered in the order the
+    components are completed (reverse topological order of the condensation).
+    """
+    n = snapshot.vertex_count
+    offsets, targets = snapshot.out_offsets, snapshot.targets
+    unvisited = -1
+    order = [unvisited] * n    # discovery index
+    low_link = [0] * n
+    component = [unvisited] * n
+    next_edge = [0] * n        # resume position in each vertex's edge range
+    stack: List[int] = []      # Tarjan's vertex stack
+    call_stack: List[int] = [] # replaces the recursion
+    counter = 0
+    component_count = 0
+
+    for root in range(n):
+        if order[root] != unvisited:
+            continue
+        call_stack.append(root)
+        while call_stack:
+            vertex = call_stack[-1]
+            if order[vertex] == unvisited:
+                order[vertex] = low_link[vertex] = counter
+                counter += 1
+                next_edge[vertex] = offsets[vertex]
+                stack.append(vertex)
+
+            descended = False
+            end = offsets[vertex + 1]
+            while next_edge[vertex] < end:
+                neighbour = targets[next_edge[vertex]]
+                next_edge[vertex] += 1
+                if order[neighbour] == unvisited:
+                    call_stack.append(neighbour)
+                    descended = True
+                    break
+                if component[neighbour] == unvisited:  # still on the stack
+                    low_link[vertex] = min(low_link[vertex], order[neighbour])
+            if descended:
+                continue
+
+            call_stack.pop()
+            if call_stack:
+                caller = call_stack[-1]
+                low_link[caller] = min(low_link[caller], low_link[vertex])
+            if low_link[vertex] == order[vertex]:
+                while True:
+                    member = stack.pop()
+                    component[member] = component_count
+                    if member == vertex:
+                        break
+                component_count += 1
+    return component
+
+
+def degree_distribution(snapshot: GraphSnapshot, incoming: bool = True) -> Dict[int, int]:
+    """Histogram of degree -> number of vertices with that degree.
+
+    Uses in-degree (follower counts) by default, or out-degree when incoming is False.
+    """
+    if np is not None and snapshot.vertex_count:
+        out_offsets, _, in_offsets, _ = snapshot.to_numpy()
+        counts = np.bincount(np.diff(in_offsets if incoming else out_offsets))
+        return {int(degree): int(count) for degree, count in enumerate(counts) if count}
+
+    histogram: Dict[int, int] = {}
+    for degree in (snapshot.in_degrees() if incoming else snapshot.out_degrees()):
+        histogram[degree] = histogram.get(degree, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+def degree_statistics(snapshot: GraphSnapshot, incoming: bool = True) -> Dict[str, float]:
+    """Summary statistics (mean, median, max, 99th percentile) of the degree distribution"""
+    histogram = degree_distribution(snapshot, incoming)
+    n = snapshot.vertex_count
+    if n == 0:
+        return {"mean": 0.0, "median": 0.0, "p99": 0.0, "max": 0.0}
+
+    def percentile(fraction: float) -> float:
+        rank = fraction * (n - 1)
+        seen = 0
+        for degree, count in histogram.items():
+            seen += count
+            if seen > rank:
+                return float(degree)
+        return float(max(histogram))
+
+    return {
+        "mean": snapshot.edge_count / n,
+        "median": percentile(0.5),
+        "p99": percentile(0.99),
+        "max": float(max(histogram)),
+    }
+
+
+def component_sizes(labels: Sequence[int]) -> Dict[int, int]:
+    """Number of vertices carrying each component label, largest first"""
+    sizes: Dict[int, int] = {}
+    for label in labels:
+        sizes[label] = sizes.get(label, 0) + 1
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+
+def top_ranked(snapshot: GraphSnapshot, scores: Sequence[float], k: int = 10,
+               min_score: Optional[float] = None) -> List[tuple]:
+    """The k highest-scoring vertices as (vertex, score) pairs"""
+    order = sorted(range(snapshot.vertex_count), key=lambda i: scores[i], reverse=True)
+    result = []
+    for i in order[:k]:
+        if min_score is not None and scores[i] < min_score:
+            break
+        result.append((snapshot.vertices[i], scores[i]))
+    return result
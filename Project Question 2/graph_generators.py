@@ -0,0 +1,97 @@
+import random
+from array import array
+from typing import Iterator, List, Tuple
+
+from graph import Graph
+from person import Person
+
+
+def preferential_attachment_edges(user_count: int, follows_per_user: int, seed: int = 42,
+                                  reciprocity: float = 0.0) -> Iterator[Tuple[int, int]]:
+    """Yield the (follower, followed) user numbers of a preferential-attachment follow graph.
+
+    Users 0 .. user_count - 1 join in order. Each new user follows up to
+    follows_per_user existing users, chosen with probability proportional to
+    (followers + 1), which yields the heavy-tailed follower distribution of
+    real social networks; with probability reciprocity a followed user
+    follows back. There are no self-follows or duplicate edges, and the same
+    seed always yields the same edges.
+
+    The only state is an array of endpoints (8 bytes per user and per edge),
+    sampled uniformly, so millions of edges can be streamed to a file or a
+    Graph without holding them anywhere else.
+    """
+    rng = random.Random(seed)
+    # Every user appears once, plus once more per follower it gains
+    endpoints = array("l")
+    for i in range(user_count):
+        chosen = set()
+        for _ in range(min(follows_per_user, i)):
+            chosen.add(endpoints[rng.randrange(len(endpoints))])
+        for target in chosen:
+            yield i, target
+            endpoints.append(target)
+            if reciprocity and rng.random() < reciprocity:
+                yield target, i
+                endpoints.append(i)
+        endpoints.append(i)
+
+
+def generate_people(user_count: int, seed: int = 42, private_ratio: float = 0.0) -> Iterator[Person]:
+    """Yield user_count Persons named user0, user1, ...; about private_ratio of them private"""
+    rng = random.Random(seed)
+    for i in range(user_count):
+        private = private_ratio > 0 and rng.random() < private_ratio
+        yield Person(f"user{i}", "N/A", "", "private" if private else "public")
+
+
+def build_power_law_graph(user_count: int, follows_per_user: int, seed: int = 42,
+                          reciprocity: float = 0.0, private_ratio: float = 0.0) -> Graph[Person]:
+    """Graph[Person] of generate_people joined by preferential_attachment_edges"""
+    graph = Graph[Person]()
+    people: List[Person] = []
+    for person in generate_people(user_count, seed, private_ratio):
+        graph.add_vertex(person)
+        people.append(person)
+    # The generator never repeats an edge, so the duplicate checks of add_edge can be skipped
+    graph.add_new_edges((people[follower], people[followed]) for follower, followed
+                        in preferential_attachment_edges(user_count, follows_per_user, seed, reciprocity))
+    return graph
+
+
+def main() -> None:
+    """Stream a follow graph to a CSV file (or just count it) and summarise its degree distribution"""
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Generate a preferential-attachment follow graph")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--follows", type=int, default=10, help="accounts each new user follows")
+    parser.add_argument("--reciprocity", type=float, default=0.0, help="probability of a follow-back")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write 'follower,followed' lines to this file")
+    args = parser.parse_args()
+
+    followers = array("l", bytes(args.users * array("l").itemsize))
+    edges = 0
+    start = time.perf_counter()
+    output = open(args.output, "w") if args.output else None
+    try:
+        for follower, followed in preferential_attachment_edges(args.users, args.follows, args.seed,
+                                                                args.reciprocity):
+            followers[followed] += 1
+            edges += 1
+            if output:
+                output.write(f"{follower},{followed}\n")
+    finally:
+        if output:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(followers, reverse=True)
+    print(f"{args.users:,} users, {edges:,} edges in {elapsed:.1f} s ({edges / elapsed:,.0f} edges/s)")
+    print(f"Followers: max {ordered[0]:,}, median {ordered[len(ordered) // 2]:,}, "
+          f"top 1% of users hold {sum(ordered[:max(1, len(ordered) // 100)]) / max(edges, 1):.0%} of follows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
-from graph import Graph
+import sys
+from functools import partial
+from typing import Callable, Optional
+
+import profiling
+from feed import FeedService
+from graph import Graph, Page
 from person import Person
+from user_registry import UserRegistry
 
 
 class SocialMediaApp:
-    def __init__(self):
+    PAGE_SIZE = 20
+
+    def __init__(self, seed_sample_data: bool = True):
         self.social_graph = Graph[Person]()
-        self.initialize_sample_data()
+        self.users = UserRegistry()
+        self.feed = FeedService(self.social_graph)
+        if seed_sample_data:
+            self.initialize_sample_data()
 
     def initialize_sample_data(self):
         """Initialize with sample person profiles"""
@@ -21,8 +33,9 @@ class SocialMediaApp:
             Person("Henry Taylor", "Male", "Chef and food blogger", "public")
         ]
 
-        # Add people to graph
+        # Register people and add them to the graph
         for person in people:
+            self.users.add(person)
             self.social_graph.add_vertex(person)
 
         # Create follow relationships
@@ -51,25 +64,41 @@ class SocialMediaApp:
         print("\n" + "=" * 50)
         print("ALL USERS")
         print("=" * 50)
-        for i, person in enumerate(self.social_graph.get_all_vertices(), 1):
-            print(f"{i}. {person.name}")
+        self.print_pages(self.social_graph.page_vertices,
+                         lambda person: f"{person.user_id}. {person.name}")
         print("=" * 50)
 
+    def print_pages(self, fetch_page: Callable[..., Page], describe: Callable[[Person], str]):
+        """Print a listing one page at a time, asking before fetching the next page"""
+        cursor = 0
+        while True:
+            page = fetch_page(cursor=cursor, limit=self.PAGE_SIZE)
+            for person in page.items:
+                print(describe(person))
+            if page.next_cursor is None:
+                return
+            if input("-- Show more? (y/n): ").strip().lower() != "y":
+                return
+            cursor = page.next_cursor
+
+    def select_user(self, prompt: str) -> Optional[Person]:
+        """Ask for a user ID and return that user, or None if there is no such user"""
+        person = self.users.get(int(input(prompt)))
+        if person is None:
+            print("Invalid selection!")
+        return person
+
     def view_profile_detail(self):
         """View the profile of any one person in detail"""
         self.display_all_users()
         try:
-            choice = int(input("\nEnter the number of the person to view: ")) - 1
-            people = self.social_graph.get_all_vertices()
-            if 0 <= choice < len(people):
-                person = people[choice]
+            person = self.select_user("\nEnter the ID of the person to view: ")
+            if person is not None:
                 print("\n" + "=" * 50)
                 print("PROFILE DETAILS")
                 print("=" * 50)
                 print(person)
                 print("=" * 50)
-            else:
-                print("Invalid selection!")
         except ValueError:
             print("Please enter a valid number!")
 
@@ -77,18 +106,14 @@ class SocialMediaApp:
         """View the list of followed accounts of a particular person"""
         self.display_all_users()
         try:
-            choice = int(input("\nEnter the number of the person: ")) - 1
-            people = self.social_graph.get_all_vertices()
-            if 0 <= choice < len(people):
-                person = people[choice]
-                followed = self.social_graph.list_outgoing_adjacent_vertex(person)
+            person = self.select_user("\nEnter the ID of the person: ")
+            if person is not None:
+                following_count = self.social_graph.out_degree(person)
 
-                print(f"\n{person.name} is following {len(followed)} people:")
+                print(f"\n{person.name} is following {following_count} people:")
                 print("-" * 30)
-                for i, followed_person in enumerate(followed, 1):
-                    print(f"{i}. {followed_person.name}")
-            else:
-                print("Invalid selection!")
+                self.print_pages(partial(self.social_graph.page_outgoing, person),
+                                 lambda followed_person: f"{followed_person.user_id}. {followed_person.name}")
         except ValueError:
             print("Please enter a valid number!")
 
@@ -96,18 +121,14 @@ class SocialMediaApp:
         """View the list of followers of a particular person"""
         self.display_all_users()
         try:
-            choice = int(input("\nEnter the number of the person: ")) - 1
-            people = self.social_graph.get_all_vertices()
-            if 0 <= choice < len(people):
-                person = people[choice]
-                followers = self.social_graph.list_incoming_adjacent_vertex(person)
+            person = self.select_user("\nEnter the ID of the person: ")
+            if person is not None:
+                follower_count = self.social_graph.in_degree(person)
 
-                print(f"\n{person.name} has {len(followers)} followers:")
+                print(f"\n{person.name} has {follower_count} followers:")
                 print("-" * 30)
-                for i, follower in enumerate(followers, 1):
-                    print(f"{i}. {follower.name}")
-            else:
-                print("Invalid selection!")
+                self.print_pages(partial(self.social_graph.page_incoming, person),
+                                 lambda follower: f"{follower.user_id}. {follower.name}")
         except ValueError:
             print("Please enter a valid number!")
 
@@ -125,33 +146,38 @@ class SocialMediaApp:
         if privacy not in ["public", "private"]:
             privacy = "public"
 
-        new_person = Person(name, gender, bio, privacy)
+        new_person = self.users.create_user(name, gender, bio, privacy)
         self.social_graph.add_vertex(new_person)
-        print(f"\n✅ User '{name}' added successfully!")
+        print(f"\n✅ User '{name}' added successfully with ID {new_person.user_id}!")
+
+    def search_users(self):
+        """Find users by (part of) their name"""
+        query = input("\nEnter a name to search for: ")
+        matches = self.users.search(query)
+
+        print(f"\nUsers matching '{query.strip()}':")
+        print("-" * 30)
+        if not matches:
+            print("No users found.")
+        for person in matches:
+            print(f"{person.user_id}. {person.name}")
 
     def follow_user(self):
         """Allow a user to follow another user on-demand"""
         self.display_all_users()
         try:
-            follower_choice = int(input("\nEnter the number of the follower: ")) - 1
-            followed_choice = int(input("Enter the number of the person to follow: ")) - 1
-
-            people = self.social_graph.get_all_vertices()
-            if (0 <= follower_choice < len(people) and
-                    0 <= followed_choice < len(people)):
-
-                follower = people[follower_choice]
-                followed = people[followed_choice]
-
+            follower = self.select_user("\nEnter the ID of the follower: ")
+            if follower is None:
+                return
+            followed = self.select_user("Enter the ID of the person to follow: ")
+            if followed is not None:
                 if follower == followed:
                     print("You cannot follow yourself!")
-                elif followed in self.social_graph.list_outgoing_adjacent_vertex(follower):
+                elif followed in self.social_graph.outgoing_view(follower):
                     print(f"{follower.name} is already following {followed.name}!")
                 else:
                     self.social_graph.add_edge(follower, followed)
                     print(f"✅ {follower.name} is now following {followed.name}!")
-            else:
-                print("Invalid selection!")
         except ValueError:
             print("Please enter valid numbers!")
 
@@ -159,33 +185,59 @@ class SocialMediaApp:
         """Allow a user to unfollow another user on-demand"""
         self.display_all_users()
         try:
-            follower_choice = int(input("\nEnter the number of the follower: ")) - 1
-            people = self.social_graph.get_all_vertices()
-
-            if 0 <= follower_choice < len(people):
-                follower = people[follower_choice]
-                followed_list = self.social_graph.list_outgoing_adjacent_vertex(follower)
-
-                if not followed_list:
+            follower = self.select_user("\nEnter the ID of the follower: ")
+            if follower is not None:
+                if self.social_graph.out_degree(follower) == 0:
                     print(f"{follower.name} is not following anyone!")
                     return
 
                 print(f"\n{follower.name} is following:")
-                for i, person in enumerate(followed_list, 1):
-                    print(f"{i}. {person.name}")
+                self.print_pages(partial(self.social_graph.page_outgoing, follower),
+                                 lambda person: f"{person.user_id}. {person.name}")
 
-                unfollow_choice = int(input("\nEnter the number to unfollow: ")) - 1
-                if 0 <= unfollow_choice < len(followed_list):
-                    unfollowed = followed_list[unfollow_choice]
+                unfollowed = self.select_user("\nEnter the ID to unfollow: ")
+                if unfollowed is None:
+                    return
+                if unfollowed in self.social_graph.outgoing_view(follower):
                     self.social_graph.remove_edge(follower, unfollowed)
                     print(f"✅ {follower.name} has unfollowed {unfollowed.name}!")
                 else:
                     print("Invalid selection!")
-            else:
-                print("Invalid selection!")
         except ValueError:
             print("Please enter valid numbers!")
 
+    def create_post(self):
+        """Publish a post on behalf of a user"""
+        self.display_all_users()
+        try:
+            author = self.select_user("\nEnter the ID of the author: ")
+            if author is not None:
+                content = input("Enter post content: ").strip()
+                if not content:
+                    print("Post content cannot be empty!")
+                    return
+                self.feed.publish(author, content)
+                print(f"✅ {author.name} posted successfully!")
+        except ValueError:
+            print("Please enter a valid number!")
+
+    def view_home_feed(self):
+        """View the latest posts from the accounts a person follows"""
+        self.display_all_users()
+        try:
+            person = self.select_user("\nEnter the ID of the person: ")
+            if person is not None:
+                posts = self.feed.home_feed(person)
+
+                print(f"\nHome feed of {person.name}:")
+                print("-" * 30)
+                if not posts:
+                    print("No posts yet.")
+                for post in posts:
+                    print(post)
+        except ValueError:
+            print("Please enter a valid number!")
+
     def display_menu(self):
         """Display the main menu"""
         print("\n" + "=" * 50)
@@ -198,14 +250,17 @@ class SocialMediaApp:
         print("5. Add new user profile")
         print("6. Follow user")
         print("7. Unfollow user")
-        print("8. Exit")
+        print("8. Create post")
+        print("9. View home feed")
+        print("10. Search users")
+        print("11. Exit")
         print("=" * 50)
 
     def run(self):
         """Run the main program loop"""
         while True:
             self.display_menu()
-            choice = input("Enter your choice (1-8): ")
+            choice = input("Enter your choice (1-11): ")
 
             if choice == '1':
                 self.display_all_users()
@@ -222,6 +277,12 @@ class SocialMediaApp:
             elif choice == '7':
                 self.unfollow_user()
             elif choice == '8':
+                self.create_post()
+            elif choice == '9':
+                self.view_home_feed()
+            elif choice == '10':
+                self.search_users()
+            elif choice == '11':
                 print("Thank you for using Social Media App! Goodbye!")
                 break
             else:
@@ -231,5 +292,16 @@ class SocialMediaApp:
 
 
 if __name__ == "__main__":
-    app = SocialMediaApp()
-    app.run()
+    with profiling.session("social_graph"):
+        seed_sample_data = True
+        if len(sys.argv) > 1:
+            # Scripted use: python main.py <command> ... or python main.py batch [file].
+            # Imported here so the interactive menu does not pay for argparse and json.
+            import commands
+            args = commands.parse_args(sys.argv[1:])
+            if args.command is not None:
+                sys.exit(commands.run(args, SocialMediaApp))
+            # Only options, such as --no-sample-data: start the menu with them
+            seed_sample_data = not args.no_sample_data
+        app = SocialMediaApp(seed_sample_data)
+        app.run()
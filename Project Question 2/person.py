@@ -1,9 +1,22 @@
+from typing import Optional
+
+
 class Person:
-    def __init__(self, name: str, gender: str, biography: str = "", privacy: str = "public"):
+    _last_id = 0  # highest user_id handed out or given explicitly
+
+    def __init__(self, name: str, gender: str, biography: str = "", privacy: str = "public",
+                 user_id: Optional[int] = None):
+        # Identity is a compact integer, not the name: two users may share a name
+        # Explicit IDs move the counter past them, so later automatic IDs never collide
+        if user_id is None:
+            user_id = Person._last_id + 1
+        Person._last_id = max(Person._last_id, user_id)
+        self.user_id = user_id
         self.name = name
         self.gender = gender
         self.biography = biography
         self.privacy = privacy  # "public" or "private"
+        self.posts = []  # authored Post objects, oldest first
 
     def __str__(self) -> str:
         """String representation for display"""
@@ -15,10 +28,10 @@ class Person:
     def __eq__(self, other):
         if not isinstance(other, Person):
             return False
-        return self.name == other.name
+        return self.user_id == other.user_id
 
     def __hash__(self):
-        return hash(self.name)
+        return self.user_id
 
     def get_public_info(self) -> str:
         """Get only public information"""
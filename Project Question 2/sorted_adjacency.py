@@ -0,0 +1,167 @@
+import bisect
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from graph import EDGE_ADDED, EDGE_REMOVED, VERTEX_ADDED, Graph, GraphEvent
+
+# Galloping beats a linear merge once one list is this many times longer
+GALLOP_RATIO = 8
+
+
+def merge_intersection(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Intersection of two sorted sequences by a linear merge, O(len(a) + len(b))"""
+    result = []
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x == y:
+            result.append(x)
+            i += 1
+            j += 1
+        elif x < y:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def galloping_intersection(small: Sequence[int], large: Sequence[int]) -> List[int]:
+    """Intersection when one side is much shorter, O(len(small) * log(len(large)))
+
+    Each probe first doubles its step from the previous match position, then
+    binary-searches inside the bracket it found, so clustered hits stay cheap.
+    """
+    result = []
+    low = 0
+    size = len(large)
+    for x in small:
+        step = 1
+        high = low
+        while high < size and large[high] < x:
+            low = high + 1
+            high = low + step
+            step <<= 1
+        low = bisect.bisect_left(large, x, low, min(high + 1, size))
+        if low == size:
+            break
+        if large[low] == x:
+            result.append(x)
+    return result
+
+
+def sorted_intersection(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Intersection of two sorted sequences, choosing merge or galloping by their sizes"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return []
+    if len(a) * GALLOP_RATIO < len(b):
+        return galloping_intersection(a, b)
+    return merge_intersection(a, b)
+
+
+def bit_positions(bits: int) -> List[int]:
+    """Indexes of the set bits of a non-negative int, ascending"""
+    text = bin(bits)[:1:-1]  # least significant bit first
+    positions = []
+    index = text.find("1")
+    while index != -1:
+        positions.append(index)
+        index = text.find("1", index + 1)
+    return positions
+
+
+class SortedAdjacency:
+    """Sorted integer adjacency of a Graph, for fast overlap queries.
+
+    Vertices are identified by their position in graph.vertices. Every vertex
+    has a sorted array of the positions it points to and is pointed at from,
+    kept current through the graph's change feed. Vertices whose degree is at
+    least 1 / dense_ratio of the vertex count also get a bitset (a Python int)
+    of those positions, built on first use, so two dense hubs intersect with
+    one AND and count the overlap with int.bit_count().
+    """
+
+    def __init__(self, graph: Graph, dense_ratio: int = 64, min_dense_degree: int = 32):
+        self.graph = graph
+        self.dense_ratio = dense_ratio
+        self.min_dense_degree = min_dense_degree
+        index = graph._index
+        self.outgoing: List[array] = [array("q", sorted(index[v] for v in graph.adjacency_list[vertex]))
+                                      for vertex in graph.vertices]
+        self.incoming: List[array] = [array("q", sorted(index[v] for v in graph.incoming_edges[vertex]))
+                                      for vertex in graph.vertices]
+        self._out_bits: Dict[int, int] = {}
+        self._in_bits: Dict[int, int] = {}
+        graph.subscribe(self.apply)
+
+    def close(self) -> None:
+        self.graph.unsubscribe(self.apply)
+
+    def apply(self, event: GraphEvent) -> None:
+        """Change-feed callback"""
+        if event.kind == VERTEX_ADDED:
+            self.outgoing.append(array("q"))
+            self.incoming.append(array("q"))
+            return
+        source, target = self.graph._index[event.source], self.graph._index[event.target]
+        if event.kind == EDGE_ADDED:
+            bisect.insort(self.outgoing[source], target)
+            bisect.insort(self.incoming[target], source)
+            if source in self._out_bits:
+                self._out_bits[source] |= 1 << target
+            if target in self._in_bits:
+                self._in_bits[target] |= 1 << source
+        elif event.kind == EDGE_REMOVED:
+            for lists, bitsets, vertex, other in ((self.outgoing, self._out_bits, source, target),
+                                                  (self.incoming, self._in_bits, target, source)):
+                neighbours = lists[vertex]
+                del neighbours[bisect.bisect_left(neighbours, other)]
+                if vertex in bitsets:
+                    bitsets[vertex] &= ~(1 << other)
+
+    def _is_dense(self, degree: int) -> bool:
+        return degree >= self.min_dense_degree and degree * self.dense_ratio >= len(self.outgoing)
+
+    def _bits(self, position: int, incoming: bool) -> int:
+        bitsets = self._in_bits if incoming else self._out_bits
+        bits = bitsets.get(position)
+        if bits is None:
+            neighbours = (self.incoming if incoming else self.outgoing)[position]
+            # Set bits through a bytearray: building the int bit by bit would be quadratic
+            buffer = bytearray((len(self.outgoing) + 7) // 8)
+            for neighbour in neighbours:
+                buffer[neighbour >> 3] |= 1 << (neighbour & 7)
+            bits = bitsets[position] = int.from_bytes(buffer, "little")
+        return bits
+
+    def common(self, a: int, b: int, incoming: bool = False) -> List[int]:
+        """Sorted positions adjacent to both a and b (outgoing, or incoming)"""
+        lists = self.incoming if incoming else self.outgoing
+        first, second = lists[a], lists[b]
+        if self._is_dense(len(first)) and self._is_dense(len(second)):
+            return bit_positions(self._bits(a, incoming) & self._bits(b, incoming))
+        return sorted_intersection(first, second)
+
+    def overlap(self, a: int, b: int, incoming: bool = False) -> int:
+        """Number of positions adjacent to both a and b"""
+        lists = self.incoming if incoming else self.outgoing
+        first, second = lists[a], lists[b]
+        if self._is_dense(len(first)) and self._is_dense(len(second)):
+            return (self._bits(a, incoming) & self._bits(b, incoming)).bit_count()
+        return len(sorted_intersection(first, second))
+
+    def has_edge(self, source: int, target: int) -> bool:
+        """Whether source points to target, by binary search in the shorter list"""
+        outgoing, incoming = self.outgoing[source], self.incoming[target]
+        if len(outgoing) <= len(incoming):
+            i = bisect.bisect_left(outgoing, target)
+            return i < len(outgoing) and outgoing[i] == target
+        i = bisect.bisect_left(incoming, source)
+        return i < len(incoming) and incoming[i] == source
+
+    def are_mutual(self, pairs: Iterable[Tuple[int, int]]) -> List[bool]:
+        """For each (a, b) pair, whether a and b follow each other"""
+        has_edge = self.has_edge
+        return [a != b and has_edge(a, b) and has_edge(b, a) for a, b in pairs]
@@ -0,0 +1,71 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from main import SocialMediaApp
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Each snippet runs in a fresh interpreter; the baseline is subtracted from the others
+SNIPPETS: List[Tuple[str, Optional[str]]] = [
+    ("Interpreter only", "pass"),
+    ("Import main", "import main"),
+    ("App without sample data", "import main; main.SocialMediaApp(seed_sample_data=False)"),
+    ("App with sample data", "import main; main.SocialMediaApp()"),
+    ("Scripted 'users' command", None),
+]
+
+
+def cold_start_ms(snippet: Optional[str], runs: int) -> float:
+    """Median wall time of running snippet in a new Python process"""
+    if snippet is None:
+        command = [sys.executable, "main.py", "--no-sample-data", "users"]
+    else:
+        command = [sys.executable, "-c", snippet]
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def construction_ms(user_count: int) -> Tuple[float, float]:
+    """(construct, load) times in ms for an app that then registers user_count users"""
+    start = time.perf_counter()
+    app = SocialMediaApp(seed_sample_data=False)
+    constructed = time.perf_counter()
+    for i in range(user_count):
+        app.social_graph.add_vertex(app.users.create_user(f"User {i}", "Unspecified"))
+    loaded = time.perf_counter()
+    return (constructed - start) * 1000, (loaded - constructed) * 1000
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("=" * 60)
+    print(f"COLD START (new process, median of {runs} runs)")
+    print("=" * 60)
+    baseline = None
+    for label, snippet in SNIPPETS:
+        elapsed = cold_start_ms(snippet, runs)
+        if baseline is None:
+            baseline = elapsed
+            print(f"{label:<30} {elapsed:>10.1f} ms")
+        else:
+            print(f"{label:<30} {elapsed:>10.1f} ms  (+{elapsed - baseline:.1f} ms)")
+
+    print("\n" + "=" * 60)
+    print("CONSTRUCTION VS LOADING AS THE DATA GROWS")
+    print("=" * 60)
+    print(f"{'Users':>10} {'Construct (ms)':>16} {'Load (ms)':>16}")
+    for user_count in (0, 1_000, 10_000, 100_000):
+        constructed, loaded = construction_ms(user_count)
+        print(f"{user_count:>10,} {constructed:>16.3f} {loaded:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
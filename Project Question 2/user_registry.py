@@ -0,0 +1,86 @@
+import heapq
+from typing import Dict, Iterator, List, Optional, Set
+
+from person import Person
+
+
+class UserRegistry:
+    """All user profiles keyed by their integer user_id, with a name-search index.
+
+    Names are indexed by character trigrams, so a substring query only has to
+    verify the users whose names contain every trigram of the query. Queries
+    shorter than three characters use a separate index of word prefixes.
+    """
+
+    def __init__(self):
+        self.users: Dict[int, Person] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._short_prefixes: Dict[str, Set[int]] = {}  # 1-2 character word prefixes
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.users
+
+    def __iter__(self) -> Iterator[Person]:
+        return iter(self.users.values())
+
+    def create_user(self, name: str, gender: str, biography: str = "",
+                    privacy: str = "public") -> Person:
+        """Create a new Person with a fresh user_id and register it"""
+        person = Person(name, gender, biography, privacy)
+        self.add(person)
+        return person
+
+    def add(self, person: Person) -> None:
+        """Register an existing Person; a second user with the same name is a separate user"""
+        if person.user_id in self.users:
+            raise ValueError(f"User ID {person.user_id} is already registered")
+        if not isinstance(person.name, str):
+            raise TypeError(f"name must be a string, not {type(person.name).__name__}")
+        # Validated before any change, so a rejected user leaves no trace in the indexes
+        key = person.name.lower()
+        self.users[person.user_id] = person
+        for trigram in _trigrams(key):
+            self._trigrams.setdefault(trigram, set()).add(person.user_id)
+        for word in key.split():
+            for length in (1, 2):
+                if len(word) >= length:
+                    self._short_prefixes.setdefault(word[:length], set()).add(person.user_id)
+
+    def get(self, user_id: int) -> Optional[Person]:
+        """Look up a user by ID in O(1)"""
+        return self.users.get(user_id)
+
+    def search(self, query: str, limit: int = 20) -> List[Person]:
+        """Up to limit users whose name contains query (case-insensitive).
+
+        Queries shorter than three characters match the start of a name word.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        if len(query) < 3:
+            candidates = self._short_prefixes.get(query, set())
+        else:
+            postings = []
+            for trigram in _trigrams(query):
+                ids = self._trigrams.get(trigram)
+                if not ids:
+                    return []
+                postings.append(ids)
+            # Intersect starting from the rarest trigram to keep the working set small
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+
+        # The limit lowest user IDs among the matches, so results do not depend on set order
+        users = self.users
+        return heapq.nsmallest(limit, (users[user_id] for user_id in candidates
+                                       if query in users[user_id].name.lower()),
+                               key=lambda person: person.user_id)
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from itertools import compress
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
+
+from graph import EDGE_ADDED, EDGE_REMOVED, VERTEX_ADDED, Graph, GraphEvent, Page
+from person import Person
+
+# bytes.translate table turning 0/1 flag bytes into the digits "0"/"1"
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class VisibilityIndex:
+    """Precomputed privacy rules for a Graph[Person].
+
+    A public account is visible to everyone. A private account is visible to
+    itself and to the accounts that follow it; to anyone else it is hidden
+    from listings, and traversals do not pass through it.
+
+    public holds one flag byte per vertex position. The flags of a viewer are
+    a copy of it with the private accounts the viewer follows switched on,
+    computed once and kept current through the graph's change feed (for the
+    max_viewers most recently used viewers). Filtering is then a byte lookup
+    per vertex, or a single itertools.compress over a slice of positions.
+    """
+
+    def __init__(self, graph: Graph[Person], max_viewers: int = 1024):
+        self.graph = graph
+        self.max_viewers = max_viewers
+        self.public = bytearray(person.privacy != "private" for person in graph.vertices)
+        self._viewers: "OrderedDict[int, bytearray]" = OrderedDict()  # viewer position -> flags
+        self._public_bits: Optional[int] = None
+        graph.subscribe(self.apply)
+
+    def close(self) -> None:
+        self.graph.unsubscribe(self.apply)
+
+    def apply(self, event: GraphEvent) -> None:
+        """Change-feed callback"""
+        if event.kind == VERTEX_ADDED:
+            flag = event.source.privacy != "private"
+            self.public.append(flag)
+            for flags in self._viewers.values():
+                flags.append(flag)
+            self._public_bits = None
+            return
+        index = self.graph._index
+        flags = self._viewers.get(index[event.source])
+        if flags is not None:
+            target = index[event.target]
+            if event.kind == EDGE_ADDED:
+                flags[target] = 1
+            elif event.kind == EDGE_REMOVED:
+                flags[target] = self.public[target] or target == index[event.source]
+
+    def set_privacy(self, person: Person, privacy: str) -> None:
+        """Change an account's privacy and update the precomputed flags"""
+        if privacy not in ("public", "private"):
+            raise ValueError("privacy must be 'public' or 'private'")
+        person.privacy = privacy
+        position = self.graph._index.get(person)
+        if position is not None:
+            self.public[position] = privacy == "public"
+            self._viewers.clear()  # cheaper than checking who follows person
+            self._public_bits = None
+
+    def viewer_flags(self, viewer: Optional[Person]) -> bytearray:
+        """One flag per vertex position: 1 if viewer may see that vertex (None = logged out)"""
+        if viewer is None or viewer not in self.graph._index:
+            return self.public
+        position = self.graph._index[viewer]
+        flags = self._viewers.get(position)
+        if flags is not None:
+            self._viewers.move_to_end(position)
+            return flags
+        flags = bytearray(self.public)
+        flags[position] = 1
+        index = self.graph._index
+        for followed in self.graph.adjacency_list[viewer]:
+            flags[index[followed]] = 1
+        self._viewers[position] = flags
+        if len(self._viewers) > self.max_viewers:
+            self._viewers.popitem(last=False)
+        return flags
+
+    def visible_bits(self, viewer: Optional[Person]) -> int:
+        """viewer_flags as an int bitset (bit i = vertex position i), for AND with adjacency bitsets"""
+        if viewer is None and self._public_bits is not None:
+            return self._public_bits
+        flags = self.viewer_flags(viewer)
+        bits = int(flags[::-1].translate(_FLAG_DIGITS) or b"0", 2)
+        if viewer is None:
+            self._public_bits = bits
+        return bits
+
+    def can_see(self, viewer: Optional[Person], vertex: Person) -> bool:
+        position = self.graph._index.get(vertex)
+        return position is not None and bool(self.viewer_flags(viewer)[position])
+
+    def filter(self, viewer: Optional[Person], vertices: Iterable[Person]) -> List[Person]:
+        """The vertices viewer may see, in their original order"""
+        vertices = list(vertices)
+        if not vertices:
+            return []
+        flags = self.viewer_flags(viewer)
+        index = self.graph._index
+        if len(vertices) == 1:
+            return vertices if flags[index[vertices[0]]] else []
+        positions = itemgetter(*vertices)(index)
+        return list(compress(vertices, itemgetter(*positions)(flags)))
+
+    def page(self, viewer: Optional[Person], items: List[Person], cursor: int = 0, limit: int = 50) -> Page:
+        """Up to limit visible items starting at cursor; next_cursor is an offset into items, not
+        into the filtered list, with the same validity as Graph's cursors (see Page)"""
+        if cursor < 0 or limit <= 0:
+            raise ValueError("cursor must be >= 0 and limit must be > 0")
+        found: List[Person] = []
+        position = cursor
+        chunk = limit
+        while position < len(items) and len(found) < limit:
+            window = items[position:position + chunk]
+            if items is self.graph.vertices:
+                # Positions are the list indexes themselves: one C-level pass
+                visible = list(compress(window, self.viewer_flags(viewer)[position:position + chunk]))
+            else:
+                visible = self.filter(viewer, window)
+            if len(found) + len(visible) > limit:
+                # Stop right after the limit-th visible item
+                last = visible[limit - len(found) - 1]
+                window = window[:window.index(last) + 1]
+                visible = visible[:limit - len(found)]
+            found.extend(visible)
+            position += len(window)
+            chunk *= 2
+        return Page(found, position if position < len(items) else None)
+
+    def page_vertices(self, viewer: Optional[Person], cursor: int = 0, limit: int = 50) -> Page:
+        return self.page(viewer, self.graph.vertices, cursor, limit)
+
+    def page_outgoing(self, viewer: Optional[Person], vertex: Person, cursor: int = 0, limit: int = 50) -> Page:
+        return self.page(viewer, self.graph.adjacency_list.get(vertex, []), cursor, limit)
+
+    def page_incoming(self, viewer: Optional[Person], vertex: Person, cursor: int = 0, limit: int = 50) -> Page:
+        return self.page(viewer, self.graph.incoming_edges.get(vertex, []), cursor, limit)
+
+    def k_hop_neighbours(self, viewer: Optional[Person], vertex: Person, k: int,
+                         limit: Optional[int] = None, incoming: bool = False) -> Dict[Person, int]:
+        """Graph.k_hop_neighbours restricted to the vertices viewer may see"""
+        return self.graph.k_hop_neighbours(vertex, k, limit, incoming, allowed=self.viewer_flags(viewer))
+
+    def common_outgoing(self, viewer: Optional[Person], a: Person, b: Person) -> List[Person]:
+        """Accounts both a and b follow that viewer may see (a "you may know" building block)"""
+        return self.filter(viewer, self.graph.common_outgoing(a, b))
@@ -0,0 +1,158 @@
+"""
+Benchmark Runner
+
+Repeats a measured round function, discarding warmup rounds, optionally with
+the garbage collector paused so a collection cannot land inside one round, and
+summarizes the samples with robust statistics:
+
+- mean, median, sample standard deviation, min and max
+- a confidence interval for the mean (Student's t for small samples)
+- outliers by Tukey's fences (outside [Q1 - 1.5 IQR, Q3 + 1.5 IQR])
+
+Results can be written as JSON (samples, statistics and machine metadata) or
+CSV (one row per round) so runs can be compared across machines and commits.
+"""
+
+import csv
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+# Two-sided 95% critical values of Student's t distribution, by degrees of freedom
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045,
+    30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+# One measured round: elapsed_ns is the figure that gets summarized, the rest
+# is kept for reporting (results per input, (start, end) per worker)
+RoundResult = namedtuple("RoundResult", ["elapsed_ns", "results", "worker_times"])
+
+
+def t_critical(degrees_of_freedom, confidence=0.95):
+    """Two-sided critical value for a confidence interval of the mean"""
+    if confidence != 0.95:
+        # Normal approximation for other levels
+        return statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    if degrees_of_freedom > 120:
+        return 1.960
+    # Rounding the degrees of freedom down keeps the interval conservative
+    return _T_95[max(df for df in _T_95 if df <= degrees_of_freedom)]
+
+
+def summarize(samples, confidence=0.95):
+    """Descriptive statistics, confidence interval and outliers of a list of timings"""
+    n = len(samples)
+    if n == 0:
+        raise ValueError("Cannot summarize an empty list of samples")
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    half_width = t_critical(n - 1, confidence) * stdev / n ** 0.5 if n > 1 else 0.0
+
+    if n >= 4:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+        fence = 1.5 * (q3 - q1)
+        low_fence, high_fence = q1 - fence, q3 + fence
+        outliers = [i for i, value in enumerate(samples) if value < low_fence or value > high_fence]
+    else:
+        outliers = []
+
+    return {
+        "count": n,
+        "mean": mean,
+        "median": statistics.median(samples),
+        "stdev": stdev,
+        "min": min(samples),
+        "max": max(samples),
+        "confidence": confidence,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+        "outliers": outliers,
+    }
+
+
+class BenchmarkRunner:
+    """Runs round functions with warmup and GC control and collects their samples"""
+
+    def __init__(self, rounds=10, warmup=1, disable_gc=True):
+        if rounds < 1:
+            raise ValueError("rounds must be at least 1")
+        self.rounds = rounds
+        self.warmup = warmup
+        self.disable_gc = disable_gc
+
+    def run(self, round_function):
+        """
+        Call round_function() warmup + rounds times and return the RoundResults
+        of the measured rounds. Nothing is printed while rounds are running.
+        """
+        for _ in range(self.warmup):
+            round_function()
+
+        measured = []
+        gc_was_enabled = gc.isenabled()
+        try:
+            for _ in range(self.rounds):
+                if self.disable_gc:
+                    # Collect between rounds, never during one
+                    gc.collect()
+                    gc.disable()
+                measured.append(round_function())
+                if self.disable_gc and gc_was_enabled:
+                    gc.enable()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return measured
+
+
+def environment_metadata():
+    """Machine and interpreter details stored alongside exported results"""
+    metadata = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        metadata["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        metadata["git_commit"] = None
+    return metadata
+
+
+def write_json(path, samples_by_mode, settings):
+    """Write samples and statistics per mode plus environment metadata as JSON"""
+    document = {
+        "metadata": environment_metadata(),
+        "settings": settings,
+        "modes": {mode: {"samples_ns": samples, "stats": summarize(samples)}
+                  for mode, samples in samples_by_mode.items()},
+    }
+    with open(path, "w") as handle:
+        json.dump(document, handle, indent=2)
+
+
+def write_csv(path, samples_by_mode):
+    """Write one row per measured round: mode, round, elapsed_ns, outlier flag"""
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["mode", "round", "elapsed_ns", "outlier"])
+        for mode, samples in samples_by_mode.items():
+            outliers = set(summarize(samples)["outliers"])
+            for i, elapsed in enumerate(samples):
+                writer.writerow([mode, i + 1, elapsed, int(i in outliers)])
@@ -0,0 +1,122 @@
+"""
+Digit Counting and Decimal Conversion for Huge Integers
+
+len(str(n)) is the obvious way to count digits, but converting a binary
+integer to decimal is quadratic in CPython 3.11 and older, and since 3.11
+str() refuses integers above sys.get_int_max_str_digits() digits (4300 by
+default) unless that limit is raised. For a large factorial the conversion
+costs more than computing the factorial.
+
+- count_digits never builds the string: the bit length bounds the digit count
+  to one of two values, and a single comparison with a power of ten decides.
+- to_decimal builds the full digit string in subquadratic time by converting
+  to a decimal.Decimal with divide and conquer (libmpdec multiplies large
+  decimals with a number-theoretic transform); Decimal -> str is then linear.
+"""
+
+import argparse
+import decimal
+import math
+import sys
+import time
+from functools import lru_cache
+
+_LOG10_2 = math.log10(2)
+_SMALL_BITS = 60     # below this, str() is cheaper than any arithmetic
+_BASE_BITS = 128     # leaf size of the binary -> decimal recursion
+_STR_FAST_BITS = 20_000  # below this, str() is faster than the Decimal route
+
+
+@lru_cache(maxsize=128)
+def _power_of_ten(exponent):
+    return 10 ** exponent
+
+
+def count_digits(n):
+    """Number of decimal digits of n (the sign is not counted)"""
+    n = abs(n)
+    if n.bit_length() <= _SMALL_BITS:
+        return len(str(n))
+    # 2^(b-1) <= n < 2^b, so n has floor((b-1)·log10 2) + 1 or one more digit
+    bits = n.bit_length()
+    digits = int((bits - 1) * _LOG10_2) + 1
+    # Guard against float rounding for astronomically large bit lengths
+    while digits > 1 and n < _power_of_ten(digits - 1):
+        digits -= 1
+    while n >= _power_of_ten(digits):
+        digits += 1
+    return digits
+
+
+def _int_to_decimal(n):
+    """Exact conversion of a non-negative int to decimal.Decimal by divide and conquer.
+
+    n = hi · 2^w + lo is converted as D(hi) · D(2^w) + D(lo), caching the
+    Decimal powers of two so each is computed once per call.
+    """
+    two = decimal.Decimal(2)
+    powers = {}
+
+    def power_of_two(w):
+        result = powers.get(w)
+        if result is None:
+            if w <= _BASE_BITS:
+                result = two ** w
+            elif w - 1 in powers:
+                result = powers[w - 1] * 2
+            else:
+                half = w >> 1
+                result = power_of_two(half) * power_of_two(w - half)
+            powers[w] = result
+        return result
+
+    def convert(value, width):
+        if width <= _BASE_BITS:
+            return decimal.Decimal(value)
+        half = width >> 1
+        high = value >> half
+        low = value - (high << half)
+        return convert(high, width - half) * power_of_two(half) + convert(low, half)
+
+    with decimal.localcontext() as context:
+        context.prec = decimal.MAX_PREC
+        context.Emax = decimal.MAX_EMAX
+        context.Emin = decimal.MIN_EMIN
+        context.traps[decimal.Inexact] = True  # any rounding would be a bug
+        return convert(n, n.bit_length())
+
+
+def to_decimal(n):
+    """Full decimal string of n, without str()'s quadratic cost or digit limit"""
+    if n < 0:
+        return "-" + to_decimal(-n)
+    if n.bit_length() <= _STR_FAST_BITS:
+        return str(n)
+    return str(_int_to_decimal(n))
+
+
+def main():
+    from factorial_algorithms import factorial_math
+
+    parser = argparse.ArgumentParser(description="Compare digit counting and decimal conversion methods")
+    parser.add_argument("numbers", type=int, nargs="*", default=[200, 1_000, 10_000, 50_000, 100_000])
+    args = parser.parse_args()
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)  # let str() run, so it can be timed
+
+    print(f"{'n!':>10} {'digits':>10} {'len(str)':>12} {'count_digits':>14} {'str()':>12} {'to_decimal':>12}")
+    print("-" * 76)
+    for n in args.numbers:
+        value = factorial_math(n)
+        timings = []
+        for function in (lambda: len(str(value)), lambda: count_digits(value),
+                         lambda: str(value), lambda: to_decimal(value)):
+            start = time.perf_counter_ns()
+            function()
+            timings.append((time.perf_counter_ns() - start) / 1e6)
+        assert count_digits(value) == len(str(value)) and to_decimal(value) == str(value)
+        print(f"{n:>10,} {count_digits(value):>10,} " + " ".join(f"{t:>11.2f}ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
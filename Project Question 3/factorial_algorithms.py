@@ -0,0 +1,114 @@
+"""
+Fast big-integer factorial algorithms.
+
+The schoolbook loop in factorial_worker.factorial multiplies a
+huge running product by one small integer per step, so every step costs
+O(size of the product) and the whole computation is quadratic in the number
+of digits. The algorithms below instead multiply numbers of similar size,
+which lets CPython use Karatsuba multiplication on large operands:
+
+- binary_split: product tree over the range 1..n
+- prime_swing: Luschny's prime-swing algorithm, n! = (n/2)!^2 * swing(n),
+  where swing(n) is assembled from a sieve-based prime factorization
+- math: CPython's built-in math.factorial (a C implementation of a
+  divide-and-conquer algorithm), kept as the reference
+"""
+
+import math
+
+# Below this many factors a plain loop beats further splitting
+_SPLIT_THRESHOLD = 32
+
+
+def product_range(low, high):
+    """Product of the integers in [low, high) by binary splitting"""
+    if high - low <= _SPLIT_THRESHOLD:
+        result = 1
+        for i in range(low, high):
+            result *= i
+        return result
+    mid = (low + high) // 2
+    return product_range(low, mid) * product_range(mid, high)
+
+
+def product_list(values, low=0, high=None):
+    """Product of values[low:high] by binary splitting"""
+    if high is None:
+        high = len(values)
+    if high - low <= _SPLIT_THRESHOLD:
+        result = 1
+        for i in range(low, high):
+            result *= values[i]
+        return result
+    mid = (low + high) // 2
+    return product_list(values, low, mid) * product_list(values, mid, high)
+
+
+def factorial_binary_split(n):
+    """n! as a balanced product tree over 1..n"""
+    if n < 2:
+        return 1
+    return product_range(2, n + 1)
+
+
+def primes_up_to(n):
+    """All primes <= n, by a sieve of Eratosthenes over a bytearray"""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+def _odd_swing(n, odd_primes):
+    """Odd part of the swinging factorial n! / (n//2)!^2.
+
+    The exponent of a prime p in n!/(n//2)!^2 is the number of k with
+    floor(n / p^k) odd, so each prime contributes at most p^log_p(n).
+    """
+    factors = []
+    for p in odd_primes:
+        if p > n:
+            break
+        q, power = n, 1
+        while q:
+            q //= p
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    return product_list(factors)
+
+
+def factorial_prime_swing(n):
+    """n! by Luschny's prime-swing algorithm.
+
+    Uses oddpart(n!) = oddpart(n//2 !)^2 * oddswing(n), and the power of two
+    in n! is n - popcount(n), applied at the end as a single shift.
+    """
+    if n < 2:
+        return 1
+    odd_primes = primes_up_to(n)[1:]
+
+    def odd_factorial(m):
+        if m < 3:
+            return 1
+        half = odd_factorial(m // 2)
+        return half * half * _odd_swing(m, odd_primes)
+
+    return odd_factorial(n) << (n - bin(n).count("1"))
+
+
+def factorial_math(n):
+    """Reference implementation: CPython's math.factorial"""
+    return math.factorial(n)
+
+
+ALGORITHMS = {
+    "binary_split": factorial_binary_split,
+    "prime_swing": factorial_prime_swing,
+    "math": factorial_math,
+}
@@ -0,0 +1,100 @@
+"""
+Factorial Algorithm Benchmark
+
+Compares the schoolbook loop against the binary-splitting, prime-swing and
+math.factorial implementations for n from 50 up to 10^6. Each cell is the
+best per-call time over enough repetitions to fill a minimum measuring window,
+so tiny inputs are not dominated by timer resolution.
+"""
+
+import argparse
+import time
+
+from factorial_algorithms import ALGORITHMS
+from factorial_concurrent_analysis import factorial
+
+DEFAULT_NUMBERS = [50, 100, 200, 1_000, 10_000, 100_000, 1_000_000]
+ALGORITHM_NAMES = ["iterative"] + list(ALGORITHMS)
+
+# The quadratic loop takes minutes at 10^6; skip it above this n unless asked
+ITERATIVE_LIMIT = 100_000
+
+
+def time_algorithm(n, algorithm, min_window_ns=200_000_000, max_repeats=1000):
+    """Best per-call time in nanoseconds of factorial(n, algorithm)"""
+    best = None
+    elapsed_total = 0
+    repeats = 0
+    while repeats < max_repeats and (repeats == 0 or elapsed_total < min_window_ns):
+        start = time.perf_counter_ns()
+        factorial(n, algorithm)
+        elapsed = time.perf_counter_ns() - start
+        elapsed_total += elapsed
+        repeats += 1
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def run_benchmark(numbers=None, algorithms=None, iterative_limit=ITERATIVE_LIMIT):
+    """Print a table of best times per algorithm and n, with speedup over the loop"""
+    numbers = numbers or DEFAULT_NUMBERS
+    algorithms = algorithms or ALGORITHM_NAMES
+
+    # Sanity check: every algorithm must agree before any timing is trusted
+    for algorithm in algorithms:
+        for n in (0, 1, 2, 50, 1_000):
+            if factorial(n, algorithm) != factorial(n, "math"):
+                raise AssertionError(f"{algorithm} returned a wrong value for {n}!")
+
+    print("FACTORIAL ALGORITHM BENCHMARK (best time per call)")
+    print("=" * (12 + 16 * len(algorithms)))
+    print(f"{'n':>10}  " + "".join(f"{name:>16}" for name in algorithms))
+    print("-" * (12 + 16 * len(algorithms)))
+
+    results = {}
+    for n in numbers:
+        row = []
+        for algorithm in algorithms:
+            if algorithm == "iterative" and n > iterative_limit:
+                row.append(None)
+                continue
+            elapsed = time_algorithm(n, algorithm)
+            results[(n, algorithm)] = elapsed
+            row.append(elapsed)
+        cells = "".join(f"{'skipped':>16}" if t is None else f"{_format_ns(t):>16}" for t in row)
+        print(f"{n:>10,}  {cells}")
+
+    if "iterative" in algorithms:
+        print("\nSPEEDUP OVER THE ITERATIVE LOOP")
+        print("-" * (12 + 16 * len(algorithms)))
+        for n in numbers:
+            baseline = results.get((n, "iterative"))
+            if baseline is None:
+                continue
+            cells = "".join(f"{baseline / results[(n, a)]:>15.1f}x" for a in algorithms)
+            print(f"{n:>10,}  {cells}")
+    return results
+
+
+def _format_ns(elapsed_ns):
+    if elapsed_ns >= 1_000_000_000:
+        return f"{elapsed_ns / 1e9:.2f} s"
+    if elapsed_ns >= 1_000_000:
+        return f"{elapsed_ns / 1e6:.2f} ms"
+    return f"{elapsed_ns / 1e3:.1f} us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare factorial algorithms across input sizes")
+    parser.add_argument("--numbers", type=int, nargs="+", default=DEFAULT_NUMBERS,
+                        help="values of n to benchmark")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHM_NAMES, default=ALGORITHM_NAMES)
+    parser.add_argument("--iterative-limit", type=int, default=ITERATIVE_LIMIT,
+                        help="largest n to run the quadratic loop for")
+    args = parser.parse_args()
+    run_benchmark(args.numbers, args.algorithms, args.iterative_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Checkpointed Factorial Cache
+
+Every experiment round recomputes the same factorials from 1. This cache keeps
+factorials at checkpoints (every power of two by default, or every k-th n) plus
+the most recently requested results, and computes a new n! by extending the
+nearest lower checkpoint:
+
+    n! = c! * (c + 1) * (c + 2) * ... * n      (product by binary splitting)
+
+Entries are evicted least-recently-used first once their total size exceeds a
+memory cap. With a directory configured, checkpoints are also written to disk
+(one file per n, raw little-endian bytes) so a restarted process can resume
+from them instead of recomputing the large products.
+"""
+
+import argparse
+import bisect
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from factorial_algorithms import product_range
+from parallel_factorial import decode_int, encode_int
+
+_FILE_SUFFIX = ".fact"
+
+
+class FactorialCache:
+    """Thread-safe LRU cache of factorials with checkpoint-based extension"""
+
+    def __init__(self, checkpoint_every=None, max_bytes=64 * 1024 * 1024, directory=None):
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be a positive integer")
+        self.checkpoint_every = checkpoint_every
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()  # n -> n!, least recently used first
+        self.cached_keys = []         # sorted keys of self.entries
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.disk_keys = []
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.disk_keys = sorted(int(name[:-len(_FILE_SUFFIX)]) for name in os.listdir(directory)
+                                    if name.endswith(_FILE_SUFFIX) and name[:-len(_FILE_SUFFIX)].isdigit())
+
+    def factorial(self, n):
+        """n!, served from the cache or extended from the nearest lower checkpoint"""
+        if n < 0:
+            raise ValueError("Factorial is not defined for negative numbers")
+        with self._lock:
+            if n in self.entries:
+                self.entries.move_to_end(n)
+                self.hits += 1
+                return self.entries[n]
+            self.misses += 1
+            start, value = self._nearest_below(n)
+
+        # Multiply outside the lock so other threads can still read the cache
+        computed = []
+        for checkpoint in self._checkpoints_between(start, n):
+            value *= product_range(start + 1, checkpoint + 1)
+            start = checkpoint
+            computed.append((checkpoint, value))
+        if start < n:
+            value *= product_range(start + 1, n + 1)
+            computed.append((n, value))
+
+        with self._lock:
+            for key, result in computed:
+                self._store(key, result)
+        if self.directory is not None:
+            for key, result in computed:
+                if self.is_checkpoint(key):
+                    self._persist(key, result)
+        return value
+
+    def is_checkpoint(self, n):
+        """Whether n! is kept as a checkpoint under the configured policy"""
+        if n < 2:
+            return False
+        if self.checkpoint_every is None:
+            return n & (n - 1) == 0
+        return n % self.checkpoint_every == 0
+
+    def clear(self):
+        """Drop every in-memory entry (files on disk are kept)"""
+        with self._lock:
+            self.entries.clear()
+            self.cached_keys.clear()
+            self.size_bytes = 0
+
+    def _checkpoints_between(self, low, high):
+        """Checkpoint values c with low < c <= high, ascending"""
+        if self.checkpoint_every is None:
+            c = 2
+            while c <= low:
+                c *= 2
+            while c <= high:
+                yield c
+                c *= 2
+        else:
+            step = self.checkpoint_every
+            for c in range((low // step + 1) * step, high + 1, step):
+                if c >= 2:
+                    yield c
+
+    def _nearest_below(self, n):
+        """(c, c!) for the largest known c < n, from memory or disk (caller holds the lock)"""
+        best, value = 1, 1
+        i = bisect.bisect_left(self.cached_keys, n)
+        if i:
+            best = self.cached_keys[i - 1]
+            value = self.entries[best]
+            self.entries.move_to_end(best)
+        j = bisect.bisect_left(self.disk_keys, n)
+        if j and self.disk_keys[j - 1] > best:
+            disk_n = self.disk_keys[j - 1]
+            loaded = self._load(disk_n)
+            if loaded is not None:
+                best, value = disk_n, loaded
+                self._store(best, value)
+        return best, value
+
+    def _store(self, n, value):
+        """Insert n! and evict LRU entries beyond the memory cap (caller holds the lock)"""
+        if n in self.entries:
+            self.entries.move_to_end(n)
+            return
+        size = (value.bit_length() + 7) // 8
+        if size > self.max_bytes:
+            return
+        self.entries[n] = value
+        bisect.insort(self.cached_keys, n)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            old_n, old_value = self.entries.popitem(last=False)
+            del self.cached_keys[bisect.bisect_left(self.cached_keys, old_n)]
+            self.size_bytes -= (old_value.bit_length() + 7) // 8
+
+    def _path(self, n):
+        return os.path.join(self.directory, f"{n}{_FILE_SUFFIX}")
+
+    def _persist(self, n, value):
+        """Write n! to disk atomically, so a crash never leaves a truncated file"""
+        if n in self.disk_keys:
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(encode_int(value))
+        os.replace(temp_path, self._path(n))
+        with self._lock:
+            if n not in self.disk_keys:
+                bisect.insort(self.disk_keys, n)
+
+    def _load(self, n):
+        try:
+            with open(self._path(n), "rb") as handle:
+                return decode_int(handle.read())
+        except OSError:
+            return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show cold vs warm factorial cache timings")
+    parser.add_argument("numbers", type=int, nargs="*", default=[50, 100, 200, 10_000, 100_000])
+    parser.add_argument("--directory", help="persist checkpoints here (run twice to see a warm restart)")
+    parser.add_argument("--every", type=int, help="checkpoint every k-th n instead of powers of two")
+    args = parser.parse_args()
+
+    cache = FactorialCache(args.every, directory=args.directory)
+    print(f"{'n':>10} {'First call (ns)':>18} {'Second call (ns)':>18}")
+    print("-" * 48)
+    for n in args.numbers:
+        start = time.perf_counter_ns()
+        cache.factorial(n)
+        first = time.perf_counter_ns() - start
+        start = time.perf_counter_ns()
+        cache.factorial(n)
+        second = time.perf_counter_ns() - start
+        print(f"{n:>10,} {first:>18,} {second:>18,}")
+    print(f"\nCached entries: {len(cache.entries)}, {cache.size_bytes:,} bytes, "
+          f"{cache.hits} hits / {cache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
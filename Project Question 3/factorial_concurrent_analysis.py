@@ -1,6 +1,22 @@
 
+import argparse
+import sys
 import time
 import threading
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
+from benchmark_runner import BenchmarkRunner, RoundResult, summarize, write_csv, write_json
+from bigint_digits import count_digits
+import factorial_worker
+from factorial_algorithms import ALGORITHMS
+from factorial_cache import FactorialCache
+from factorial_worker import factorial, timed_factorial
+from parallel_factorial import run_parallel_factorial_experiment
+from profiling import session
+from thread_trace import ThreadTrace, render_gantt, write_chrome_trace
 
 """
 1. Python Multithreading: Concurrent vs Parallel Processing
@@ -20,35 +36,22 @@ can still provide performance benefits as threads can release the GIL while wait
 This experiment with factorial calculations will demonstrate the GIL's impact on CPU-bound tasks.
 """
 
-def factorial(n):
-    """
-    2. Factorial Function with Big-O Analysis
-    
-    Time Complexity: O(n)
-    - The function performs exactly n multiplications
-    - Each iteration of the loop is a primitive operation
-    - Number of operations grows linearly with input size n
-    
-    Space Complexity: O(log(n!)) ≈ O(n log n)
-    - The result requires O(n log n) bits to store
-    - We use constant additional space (only one variable 'result')
-    
-    Primitive Operations Analysis:
-    - 1 assignment (result = 1)
-    - n comparisons (i <= n)
-    - n increments (i += 1)
-    - n multiplications (result *= i)
-    - Total: 3n + 1 operations → O(n)
-    """
-    if n < 0:
-        raise ValueError("Factorial is not defined for negative numbers")
-    if n == 0:
-        return 1
-    
-    result = 1
-    for i in range(1, n + 1):
-        result *= i
-    return result
+NUMBERS = [50, 100, 200]  # default factorials computed in every round
+ROUNDS = 10
+WARMUP_ROUNDS = 1
+
+# Execution modes, in the order they are run and reported
+MODES = {
+    "threads": "Multithreaded",
+    "thread-pool": "Thread pool",
+    "single": "Single-threaded",
+    "process": "Process pool",
+    "free-threaded": "Free-threaded",
+}
+
+# 2. The factorial function (with its Big-O analysis) is factorial_worker.factorial,
+# kept in an importable module so pool workers, sub-interpreters included, can run it.
+# factorial_worker.FACTORIAL_CACHE is the optional FactorialCache the experiments share.
 
 
 class FactorialThread(threading.Thread):
@@ -57,187 +60,371 @@ class FactorialThread(threading.Thread):
     
     This class extends threading.Thread to calculate factorials in separate threads.
     Each thread records its own start and end times for accurate measurement.
+    With a thread_trace.ThreadTrace as trace it also records its CPU time,
+    context switches and when it was actually running.
     """
-    def __init__(self, number, results_dict, times_dict, thread_id):
+    def __init__(self, number, results_dict, times_dict, thread_id, algorithm="iterative", trace=None):
         threading.Thread.__init__(self)
         self.number = number
         self.results_dict = results_dict
         self.times_dict = times_dict
         self.thread_id = thread_id
+        self.algorithm = algorithm
+        self.trace = trace
         
     def run(self):
         """Thread execution method - calculates factorial and records timing"""
-        start_time = time.time_ns()
+        start_time = time.perf_counter_ns()
         
         # Calculate factorial (CPU-bound operation)
-        result = factorial(self.number)
+        if self.trace is None:
+            result = factorial(self.number, self.algorithm, factorial_worker.FACTORIAL_CACHE)
+        else:
+            result = self.traced_factorial()
         
-        end_time = time.time_ns()
+        end_time = time.perf_counter_ns()
         
         # Store results and timing information
         self.results_dict[self.thread_id] = result
         self.times_dict[self.thread_id] = (start_time, end_time)
 
+    def traced_factorial(self):
+        """The iterative factorial in chunks, marking the trace after each chunk"""
+        trace = self.trace
+        trace.begin()
+        if self.algorithm != "iterative" or factorial_worker.FACTORIAL_CACHE is not None:
+            # Opaque calls into C: a single segment
+            result = factorial(self.number, self.algorithm, factorial_worker.FACTORIAL_CACHE)
+            trace.mark()
+        else:
+            result = 1
+            for low in range(1, self.number + 1, trace.chunk_size):
+                for i in range(low, min(low + trace.chunk_size, self.number + 1)):
+                    result *= i
+                trace.mark()
+        trace.end()
+        return result
+
 
-def run_multithreaded_experiment():
+def free_threading_backend():
     """
-    3. Multithreaded Factorial Calculation
-    
-    Creates three separate threads for calculating 50!, 100!, and 200!
-    Measures time using: Time_Elapsed = End_Time_Last_Thread - Start_Time_First_Thread
+    Return (description, executor class) for running Python bytecode on several
+    cores inside one process, or None if this interpreter cannot do that.
+
+    - A free-threaded build (PEP 703, Python 3.13t+) with the GIL disabled runs
+      ordinary threads in parallel
+    - Python 3.14+ offers InterpreterPoolExecutor, where every worker is a
+      sub-interpreter with its own GIL (PEP 684 / PEP 734)
     """
-    numbers = [50, 100, 200]
-    rounds = 10
-    multithread_times = []
-    
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is not None and not is_gil_enabled():
+        return "free-threaded build, GIL disabled", ThreadPoolExecutor
+    interpreter_pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+    if interpreter_pool is not None:
+        return "sub-interpreters, one GIL per worker", interpreter_pool
+    return None
+
+
+def _span(worker_times):
+    """Time_Elapsed = End_Time_Last_Worker - Start_Time_First_Worker"""
+    return max(end for _, end in worker_times) - min(start for start, _ in worker_times)
+
+
+def multithreaded_round(numbers, algorithm="iterative", traces=None):
+    """One round with a new FactorialThread per number; appends the round's ThreadTraces to traces"""
+    results = {}
+    thread_times = {}
+    round_traces = None
+    if traces is not None:
+        round_traces = [ThreadTrace(f"thread_{i} ({num}!)") for i, num in enumerate(numbers)]
+        traces.append(round_traces)
+    threads = [FactorialThread(num, results, thread_times, f"thread_{i}", algorithm,
+                               round_traces[i] if round_traces else None)
+               for i, num in enumerate(numbers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    keys = [f"thread_{i}" for i in range(len(numbers))]
+    worker_times = [thread_times[key] for key in keys]
+    return RoundResult(_span(worker_times), [results[key] for key in keys], worker_times)
+
+
+def single_threaded_round(numbers, algorithm="iterative"):
+    """One round computing every factorial sequentially in the calling thread"""
+    start_time = time.perf_counter_ns()
+    results = [factorial(num, algorithm, factorial_worker.FACTORIAL_CACHE) for num in numbers]
+    end_time = time.perf_counter_ns()
+    return RoundResult(end_time - start_time, results, [(start_time, end_time)])
+
+
+def pool_round(executor, numbers, algorithm="iterative"):
+    """One round with every factorial submitted to an already running pool"""
+    futures = [executor.submit(timed_factorial, num, algorithm) for num in numbers]
+    outcomes = [future.result() for future in futures]
+    worker_times = [(start, end) for _, start, end in outcomes]
+    return RoundResult(_span(worker_times), [result for result, _, _ in outcomes], worker_times)
+
+
+def unavailable_reason(mode):
+    """Why a mode cannot run on this interpreter, or None if it can"""
+    if mode == "free-threaded" and free_threading_backend() is None:
+        return ("this interpreter has a GIL and no InterpreterPoolExecutor "
+                "(needs a free-threaded build or Python 3.14+)")
+    return None
+
+
+@contextmanager
+def open_mode(mode, numbers, algorithm="iterative", traces=None, workers=None):
+    """
+    Yield the round function of an execution mode. Pools are started here,
+    once, so worker start-up is not part of any measured round. Only the
+    threads mode is traced. Pools get one worker per number unless workers
+    is given.
+    """
+    if mode == "threads":
+        yield partial(multithreaded_round, numbers, algorithm, traces)
+    elif mode == "single":
+        yield partial(single_threaded_round, numbers, algorithm)
+    elif mode in ("thread-pool", "process", "free-threaded"):
+        if mode == "thread-pool":
+            executor_class = ThreadPoolExecutor
+        elif mode == "process":
+            executor_class = ProcessPoolExecutor
+        else:
+            executor_class = free_threading_backend()[1]
+        with executor_class(max_workers=workers or len(numbers)) as executor:
+            yield partial(pool_round, executor, numbers, algorithm)
+    else:
+        raise ValueError(f"Unknown execution mode: {mode}")
+
+
+def print_summary(title, stats):
+    """Print the statistics of one mode's samples"""
+    print(f"SUMMARY - {title.upper()}:")
+    print(f"  Mean Time:   {stats['mean']:>15,.2f} nanoseconds "
+          f"({stats['confidence']:.0%} CI {stats['ci_low']:,.0f} - {stats['ci_high']:,.0f})")
+    print(f"  Median Time: {stats['median']:>15,.2f} nanoseconds")
+    print(f"  Std Dev:     {stats['stdev']:>15,.2f} nanoseconds")
+    print(f"  Min Time:    {stats['min']:>15,} nanoseconds")
+    print(f"  Max Time:    {stats['max']:>15,} nanoseconds")
+    if stats["outliers"]:
+        rounds = ", ".join(str(i + 1) for i in stats["outliers"])
+        print(f"  Outliers:    round(s) {rounds} (outside Tukey fences)")
+    else:
+        print("  Outliers:    none")
+
+
+def run_experiment(mode, numbers=None, runner=None, algorithm="iterative", verbose=True, traces=None):
+    """
+    Run one execution mode through the benchmark runner and report it.
+
+    Every round is timed first; per-round details are only printed after the
+    last round, so printing never overlaps a measurement. Given a list as
+    traces, the threads mode appends the ThreadTraces of every measured round
+    to it and prints a Gantt chart per round.
+    Returns (elapsed times in ns per round, summary statistics).
+    """
+    numbers = numbers or NUMBERS
+    runner = runner or BenchmarkRunner(ROUNDS, WARMUP_ROUNDS)
+    title = MODES[mode]
+    if mode == "free-threaded":
+        title = f"{title} ({free_threading_backend()[0]})"
+
+    round_traces = [] if traces is not None and mode == "threads" else None
+    with open_mode(mode, numbers, algorithm, round_traces) as round_function:
+        rounds = runner.run(round_function)
+    if round_traces is not None:
+        round_traces = round_traces[runner.warmup:]
+        traces.extend(round_traces)
+    times = [round_result.elapsed_ns for round_result in rounds]
+    stats = summarize(times)
+
     print("=" * 80)
-    print("MULTITHREADED EXECUTION - 10 ROUNDS")
+    print(f"{title.upper()} EXECUTION - {len(rounds)} ROUNDS ({runner.warmup} WARMUP)")
     print("=" * 80)
-    
-    for round_num in range(rounds):
-        # Initialize storage for results and timing
-        results = {}
-        thread_times = {}
-        threads = []
-        
-        # Create thread objects
-        for i, num in enumerate(numbers):
-            thread = FactorialThread(num, results, thread_times, f"thread_{i}")
-            threads.append(thread)
-        
-        # Start all threads
-        for thread in threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Calculate overall timing according to the specified formula
-        start_times = [times[0] for times in thread_times.values()]
-        end_times = [times[1] for times in thread_times.values()]
-        
-        first_start = min(start_times)
-        last_end = max(end_times)
-        elapsed_time = last_end - first_start
-        
-        multithread_times.append(elapsed_time)
-        
-        # Display results for this round
-        print(f"Round {round_num + 1}:")
-        print(f"  Time Elapsed: {elapsed_time:>15,} nanoseconds")
-        print(f"  Individual Thread Times:")
-        for i, (start, end) in enumerate(thread_times.values()):
-            thread_duration = end - start
-            print(f"    Thread {i+1} (factorial {numbers[i]}): {thread_duration:>12,} ns")
-        
-        # Verify calculations (optional - can be removed for cleaner output)
-        for i, num in enumerate(numbers):
-            result = results[f"thread_{i}"]
-            digits = len(str(result))
-            print(f"    Factorial {num}! has {digits} digits")
-        print()
-    
-    # Calculate and display average
-    avg_time = sum(multithread_times) / len(multithread_times)
-    print(f"SUMMARY - MULTITHREADED:")
-    print(f"  Average Time: {avg_time:,.2f} nanoseconds")
-    print(f"  Min Time: {min(multithread_times):,} nanoseconds")
-    print(f"  Max Time: {max(multithread_times):,} nanoseconds")
+    if verbose:
+        for round_num, round_result in enumerate(rounds):
+            print(f"Round {round_num + 1}:")
+            print(f"  Time Elapsed: {round_result.elapsed_ns:>15,} nanoseconds")
+            if len(round_result.worker_times) > 1:
+                print(f"  Individual Worker Times:")
+                for i, (start, end) in enumerate(round_result.worker_times):
+                    print(f"    Worker {i+1} (factorial {numbers[i]}): {end - start:>12,} ns")
+            for num, result in zip(numbers, round_result.results):
+                print(f"    Factorial {num}! has {count_digits(result)} digits")
+            if round_traces is not None:
+                print(render_gantt(round_traces[round_num]))
+            print()
+    print_summary(title, stats)
     print("=" * 80)
+    return times, stats
+
+
+def run_multithreaded_experiment(numbers=None, runner=None, algorithm="iterative"):
+    """
+    3. Multithreaded Factorial Calculation
     
-    return multithread_times, avg_time
+    Creates a separate thread for each factorial (50!, 100! and 200! by default)
+    Measures time using: Time_Elapsed = End_Time_Last_Thread - Start_Time_First_Thread
+    """
+    return run_experiment("threads", numbers, runner, algorithm)
 
 
-def run_single_threaded_experiment():
+def run_single_threaded_experiment(numbers=None, runner=None, algorithm="iterative"):
     """
     4. Single-Threaded Factorial Calculation
     
-    Calculates the same factorials (50!, 100!, 200!) sequentially in a single thread
+    Calculates the same factorials sequentially in a single thread
     """
-    numbers = [50, 100, 200]
-    rounds = 10
-    single_thread_times = []
-    
-    print("SINGLE-THREADED EXECUTION - 10 ROUNDS")
-    print("=" * 80)
-    
-    for round_num in range(rounds):
-        results = []
-        
-        # Record start time
-        start_time = time.time_ns()
-        
-        # Calculate factorials sequentially
-        for num in numbers:
-            result = factorial(num)
-            results.append(result)
-        
-        # Record end time
-        end_time = time.time_ns()
-        
-        elapsed_time = end_time - start_time
-        single_thread_times.append(elapsed_time)
-        
-        print(f"Round {round_num + 1}:")
-        print(f"  Time Elapsed: {elapsed_time:>15,} nanoseconds")
-        
-        # Display individual calculation info
-        for i, (num, result) in enumerate(zip(numbers, results)):
-            digits = len(str(result))
-            print(f"    Factorial {num}! has {digits} digits")
-        print()
-    
-    # Calculate and display average
-    avg_time = sum(single_thread_times) / len(single_thread_times)
-    print(f"SUMMARY - SINGLE-THREADED:")
-    print(f"  Average Time: {avg_time:,.2f} nanoseconds")
-    print(f"  Min Time: {min(single_thread_times):,} nanoseconds")
-    print(f"  Max Time: {max(single_thread_times):,} nanoseconds")
-    print("=" * 80)
-    
-    return single_thread_times, avg_time
+    return run_experiment("single", numbers, runner, algorithm)
+
+
+def run_thread_pool_experiment(numbers=None, runner=None, algorithm="iterative"):
+    """
+    3b. Thread Pool Factorial Calculation
+
+    Same work as the multithreaded experiment, but on persistent worker threads
+    that are started once and fed through a work queue, so thread creation is
+    no longer inside the measured rounds (see thread_pool_study.py for its cost).
+    """
+    return run_experiment("thread-pool", numbers, runner, algorithm)
+
+
+def run_process_pool_experiment(numbers=None, runner=None, algorithm="iterative"):
+    """
+    5. Multiprocess Factorial Calculation
+
+    Each worker is a separate process with its own interpreter and GIL, so the
+    factorials really run on different cores at the same time.
+    """
+    return run_experiment("process", numbers, runner, algorithm)
 
 
-def main():
+def run_free_threaded_experiment(numbers=None, runner=None, algorithm="iterative"):
     """
-    Main function to run both experiments and provide comparative analysis
+    6. Free-Threaded / Sub-Interpreter Factorial Calculation
+
+    Parallel execution without separate processes, when the interpreter
+    supports it. Returns None (and runs nothing) otherwise.
+    """
+    if unavailable_reason("free-threaded"):
+        return None
+    return run_experiment("free-threaded", numbers, runner, algorithm)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare single-threaded, multithreaded and parallel factorial execution")
+    parser.add_argument("--numbers", type=int, nargs="+", default=NUMBERS,
+                        help="factorials computed in every round (default: %(default)s)")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="measured rounds per mode")
+    parser.add_argument("--warmup", type=int, default=WARMUP_ROUNDS,
+                        help="unmeasured rounds run first in every mode")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES),
+                        help="execution modes to run")
+    parser.add_argument("--algorithm", choices=["iterative"] + list(ALGORITHMS), default="iterative")
+    parser.add_argument("--keep-gc", action="store_true",
+                        help="leave the garbage collector enabled during measured rounds")
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse results through a FactorialCache (iterative --algorithm only: "
+                             "the cache computes by binary splitting)")
+    parser.add_argument("--cache-dir", help="persist cache checkpoints in this directory (implies --cache)")
+    parser.add_argument("--quiet", action="store_true", help="print only summaries, not every round")
+    parser.add_argument("--json", metavar="PATH", help="write samples, statistics and metadata as JSON")
+    parser.add_argument("--csv", metavar="PATH", help="write one row per measured round as CSV")
+    parser.add_argument("--trace", action="store_true",
+                        help="record CPU time, context switches and a run timeline per thread (threads mode)")
+    parser.add_argument("--trace-json", metavar="PATH",
+                        help="write the thread timelines as a Chrome trace (implies --trace)")
+    parser.add_argument("--chunked-n", type=int, default=100_000,
+                        help="n for the parallel chunked factorial experiment (0 to skip)")
+    args = parser.parse_args(argv)
+    if (args.cache or args.cache_dir) and args.algorithm != "iterative":
+        parser.error(f"--cache always computes by binary splitting and cannot time --algorithm {args.algorithm}")
+    return args
+
+
+def main(argv=None):
+    """
+    Main function to run all experiments and provide comparative analysis
     """
+    args = parse_args(argv)
+    if args.cache or args.cache_dir:
+        factorial_worker.FACTORIAL_CACHE = FactorialCache(directory=args.cache_dir)
+        computed_by = "FactorialCache (checkpoints extended by binary splitting)"
+    else:
+        computed_by = f"{args.algorithm} algorithm"
+    runner = BenchmarkRunner(args.rounds, args.warmup, disable_gc=not args.keep_gc)
+
     print("FACTORIAL CALCULATION PERFORMANCE ANALYSIS")
-    print("Comparing Multithreaded vs Single-Threaded Execution")
-    print()
-    
-    # Run multithreaded experiment
-    multi_times, multi_avg = run_multithreaded_experiment()
-    
-    print("\n" + "="*80)
+    print("Comparing Multithreaded, Single-Threaded and Parallel Execution")
+    print(f"Inputs: {args.numbers}, computed by: {computed_by}, "
+          f"{args.rounds} rounds + {args.warmup} warmup, GC {'on' if args.keep_gc else 'paused'}")
     print()
-    
-    # Run single-threaded experiment
-    single_times, single_avg = run_single_threaded_experiment()
-    
+
+    samples_by_mode = {}
+    stats_by_mode = {}
+    traces = [] if args.trace or args.trace_json else None
+    for mode in args.modes:
+        reason = unavailable_reason(mode)
+        if reason:
+            print(f"{MODES[mode].upper()} EXECUTION SKIPPED: {reason}")
+            print("=" * 80)
+            continue
+        times, stats = run_experiment(mode, args.numbers, runner, args.algorithm, not args.quiet, traces)
+        samples_by_mode[mode] = times
+        stats_by_mode[mode] = stats
+        print()
+
     # Comparative Analysis
     print("\n" + "="*80)
     print("COMPARATIVE ANALYSIS")
     print("="*80)
-    
-    improvement = ((single_avg - multi_avg) / single_avg) * 100
-    status = "IMPROVEMENT" if improvement > 0 else "OVERHEAD"
-    
-    print(f"Multithreaded Average Time:  {multi_avg:>15,.2f} ns")
-    print(f"Single-threaded Average Time: {single_avg:>15,.2f} ns")
-    print(f"Performance Difference:      {abs(improvement):>15.2f}% {status}")
-    print()
-    
-    print("DETAILED ROUND COMPARISON:")
-    print(f"{'Round':<6} {'Multithreaded (ns)':<20} {'Single-threaded (ns)':<20} {'Difference (ns)':<15}")
-    print("-" * 65)
-    for i in range(10):
-        multi_time = multi_times[i]
-        single_time = single_times[i]
-        diff = single_time - multi_time
-        print(f"{i+1:<6} {multi_time:<20,} {single_time:<20,} {diff:>15,}")
+    baseline = stats_by_mode.get("single")
+    print(f"{'Mode':<18} {'Mean (ns)':>16} {'Median (ns)':>16} {'95% CI half-width':>18} {'Speedup':>9}")
+    print("-" * 81)
+    for mode, stats in stats_by_mode.items():
+        half_width = (stats["ci_high"] - stats["ci_low"]) / 2
+        speedup = f"{baseline['median'] / stats['median']:>8.2f}x" if baseline else f"{'-':>9}"
+        print(f"{MODES[mode]:<18} {stats['mean']:>16,.2f} {stats['median']:>16,.2f} "
+              f"{half_width:>18,.2f} {speedup}")
+    if baseline:
+        print("(speedup = single-threaded median / mode median)")
+
+    if "threads" in samples_by_mode and "single" in samples_by_mode:
+        multi_times, single_times = samples_by_mode["threads"], samples_by_mode["single"]
+        print()
+        print("DETAILED ROUND COMPARISON:")
+        print(f"{'Round':<6} {'Multithreaded (ns)':<20} {'Single-threaded (ns)':<20} {'Difference (ns)':<15}")
+        print("-" * 65)
+        for i in range(len(multi_times)):
+            multi_time = multi_times[i]
+            single_time = single_times[i]
+            diff = single_time - multi_time
+            print(f"{i+1:<6} {multi_time:<20,} {single_time:<20,} {diff:>15,}")
+
+    # The modes above only parallelize separate factorials; this splits one
+    if args.chunked_n:
+        print("\n" + "="*80)
+        print()
+        run_parallel_factorial_experiment(args.chunked_n)
+
+    settings = {"numbers": args.numbers, "rounds": args.rounds, "warmup": args.warmup,
+                "algorithm": args.algorithm, "computed_by": computed_by, "gc_paused": not args.keep_gc,
+                "cache": factorial_worker.FACTORIAL_CACHE is not None}
+    if args.json:
+        write_json(args.json, samples_by_mode, settings)
+        print(f"\nResults written to {args.json}")
+    if args.csv:
+        write_csv(args.csv, samples_by_mode)
+        print(f"Results written to {args.csv}")
+    if args.trace_json and traces:
+        write_chrome_trace(args.trace_json, traces)
+        print(f"Thread trace written to {args.trace_json}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with session("factorial"):
+        main()
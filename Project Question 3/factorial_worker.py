@@ -0,0 +1,84 @@
+"""
+Factorial Worker
+
+The factorial function and the body run by pool workers. They live in this
+importable module rather than in the factorial_concurrent_analysis script
+because a worker must be able to find them by module name: an
+InterpreterPoolExecutor worker is a fresh sub-interpreter that imports what it
+runs, and cannot reliably resolve functions defined in the __main__ script.
+Process-pool workers started with spawn have the same constraint.
+"""
+
+import time
+
+from factorial_algorithms import ALGORITHMS
+from profiling import profiled
+
+# Optional factorial_cache.FactorialCache shared by the experiments. When set,
+# rounds after the first reuse cached results instead of recomputing them.
+# Process-pool workers get their own copy, and only when they are forked;
+# sub-interpreter workers never see it.
+FACTORIAL_CACHE = None
+
+
+@profiled
+def factorial(n, algorithm="iterative", cache=None):
+    """
+    2. Factorial Function with Big-O Analysis
+    
+    Time Complexity: O(n)
+    - The function performs exactly n multiplications
+    - Each iteration of the loop is a primitive operation
+    - Number of operations grows linearly with input size n
+    
+    Space Complexity: O(log(n!)) ≈ O(n log n)
+    - The result requires O(n log n) bits to store
+    - We use constant additional space (only one variable 'result')
+    
+    Primitive Operations Analysis:
+    - 1 assignment (result = 1)
+    - n comparisons (i <= n)
+    - n increments (i += 1)
+    - n multiplications (result *= i)
+    - Total: 3n + 1 operations → O(n)
+
+    The analysis above counts multiplications as O(1), which only holds while
+    the product fits in a machine word. For large n each step multiplies an
+    O(n log n)-bit number by a small one, so the loop is really O(n² log n)
+    bit operations. Pass algorithm="binary_split", "prime_swing" or "math"
+    (see factorial_algorithms.py) to use a subquadratic method instead, or a
+    FactorialCache as cache to resume from the nearest stored checkpoint. The
+    cache always extends its checkpoints by binary splitting, so it cannot be
+    combined with another algorithm.
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    if cache is not None:
+        if algorithm != "iterative":
+            raise ValueError(f"A FactorialCache cannot compute with the {algorithm} algorithm")
+        return cache.factorial(n)
+    if algorithm != "iterative":
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown factorial algorithm: {algorithm}")
+        return ALGORITHMS[algorithm](n)
+    if n == 0:
+        return 1
+    
+    result = 1
+    for i in range(1, n + 1):
+        result *= i
+    return result
+
+
+def timed_factorial(number, algorithm="iterative"):
+    """
+    Worker body for the pool-based modes: computes the factorial and records
+    its own start and end time, exactly like FactorialThread.run does.
+
+    perf_counter_ns is a system-wide monotonic clock on Linux, macOS and
+    Windows, so timestamps taken in different worker processes are comparable.
+    """
+    start_time = time.perf_counter_ns()
+    result = factorial(number, algorithm, FACTORIAL_CACHE)
+    end_time = time.perf_counter_ns()
+    return result, start_time, end_time
@@ -0,0 +1,203 @@
+"""
+Mixed CPU / I/O Workload
+
+The GIL only serializes Python bytecode: a thread that sleeps, waits on a
+socket or writes a file releases it. The factorial experiment is purely
+CPU-bound, so it can only ever show the cost of the GIL. This module generates
+workloads that mix factorial compute with simulated I/O and runs them under
+four execution models, to show where each one wins as the I/O share grows:
+
+- single:  every task in turn on the calling thread
+- threads: a ThreadPoolExecutor (overlaps I/O, not compute)
+- asyncio: one event loop; sleeps and socket round-trips are awaited natively,
+           compute and blocking file writes go through loop.run_in_executor
+- process: a ProcessPoolExecutor (overlaps both, at a per-task IPC cost)
+
+I/O tasks are a sleep (network/disk latency), a round-trip of a payload over a
+local socket pair, or writing the digit string of a factorial to a file with
+fsync.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from bigint_digits import to_decimal
+from factorial_concurrent_analysis import factorial
+
+Task = namedtuple("Task", ["kind", "value", "index"])  # value: n, seconds or payload bytes
+
+COMPUTE, SLEEP, SOCKET, FILE = "compute", "sleep", "socket", "file"
+IO_KINDS = (SLEEP, SOCKET, FILE)
+MIXED_MODES = ["single", "threads", "asyncio", "process"]
+DEFAULT_IO_RATIOS = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def generate_workload(task_count, io_ratio, compute_n=2_000, sleep_seconds=0.005,
+                      payload_bytes=4_096, file_n=1_000, seed=42):
+    """A deterministic list of tasks where about io_ratio of them are I/O tasks"""
+    if not 0.0 <= io_ratio <= 1.0:
+        raise ValueError("io_ratio must be between 0 and 1")
+    rng = random.Random(seed)
+    tasks = []
+    for index in range(task_count):
+        if rng.random() >= io_ratio:
+            tasks.append(Task(COMPUTE, compute_n, index))
+            continue
+        kind = rng.choice(IO_KINDS)
+        if kind == SLEEP:
+            tasks.append(Task(SLEEP, sleep_seconds, index))
+        elif kind == SOCKET:
+            tasks.append(Task(SOCKET, payload_bytes, index))
+        else:
+            tasks.append(Task(FILE, file_n, index))
+    return tasks
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("socket closed during round-trip")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def write_digits(directory, task):
+    """Write the decimal digits of task.value! to a file and fsync it"""
+    path = os.path.join(directory, f"factorial_{task.index}.txt")
+    with open(path, "w") as handle:
+        handle.write(to_decimal(factorial(task.value, "math")))
+        handle.flush()
+        os.fsync(handle.fileno())
+    return path
+
+
+def run_task(task, directory):
+    """Execute one task with blocking calls (single, threads and process modes)"""
+    if task.kind == COMPUTE:
+        return factorial(task.value).bit_length()
+    if task.kind == SLEEP:
+        time.sleep(task.value)
+        return None
+    if task.kind == SOCKET:
+        payload = b"x" * task.value
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(payload)
+            right.sendall(_recv_exactly(right, task.value))
+            return len(_recv_exactly(left, task.value))
+    return write_digits(directory, task)
+
+
+async def _recv_exactly_async(loop, sock, size):
+    chunks = []
+    while size:
+        chunk = await loop.sock_recv(sock, size)
+        if not chunk:
+            raise ConnectionError("socket closed during round-trip")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+async def run_task_async(task, directory):
+    """Execute one task on the event loop, offloading anything that would block it"""
+    loop = asyncio.get_running_loop()
+    if task.kind == COMPUTE:
+        return await loop.run_in_executor(None, partial(run_task, task, directory))
+    if task.kind == SLEEP:
+        await asyncio.sleep(task.value)
+        return None
+    if task.kind == SOCKET:
+        left, right = socket.socketpair()
+        left.setblocking(False)
+        right.setblocking(False)
+        with left, right:
+            await loop.sock_sendall(left, b"x" * task.value)
+            await loop.sock_sendall(right, await _recv_exactly_async(loop, right, task.value))
+            return len(await _recv_exactly_async(loop, left, task.value))
+    return await loop.run_in_executor(None, write_digits, directory, task)
+
+
+async def _run_all_async(tasks, directory, workers):
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loop.set_default_executor(executor)
+        return await asyncio.gather(*(run_task_async(task, directory) for task in tasks))
+
+
+def run_workload(tasks, mode, workers=None):
+    """Run every task under one execution model; returns wall time in ns"""
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with tempfile.TemporaryDirectory() as directory:
+        worker = partial(run_task, directory=directory)
+        if mode == "process":
+            # Start the worker processes before the clock starts
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(abs, range(workers)))
+                start = time.perf_counter_ns()
+                list(executor.map(worker, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+                return time.perf_counter_ns() - start
+
+        start = time.perf_counter_ns()
+        if mode == "single":
+            for task in tasks:
+                worker(task)
+        elif mode == "threads":
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(worker, tasks))
+        elif mode == "asyncio":
+            asyncio.run(_run_all_async(tasks, directory, workers))
+        else:
+            raise ValueError(f"Unknown execution mode: {mode}")
+        return time.perf_counter_ns() - start
+
+
+def run_mixed_workload_study(io_ratios=None, task_count=200, modes=None, workers=None, **workload_options):
+    """Print wall time per mode for each I/O ratio; returns {io_ratio: {mode: ns}}"""
+    io_ratios = io_ratios if io_ratios is not None else DEFAULT_IO_RATIOS
+    modes = modes or MIXED_MODES
+
+    print("=" * 80)
+    print(f"MIXED CPU / I/O WORKLOAD - {task_count} tasks per run")
+    print("=" * 80)
+    print(f"{'I/O ratio':>9} " + "".join(f"{mode + ' (ms)':>15}" for mode in modes) + f"{'Best':>10}")
+    print("-" * (20 + 15 * len(modes)))
+
+    results = {}
+    for io_ratio in io_ratios:
+        tasks = generate_workload(task_count, io_ratio, **workload_options)
+        timings = {mode: run_workload(tasks, mode, workers) for mode in modes}
+        results[io_ratio] = timings
+        best = min(timings, key=timings.get)
+        print(f"{io_ratio:>9.0%} " + "".join(f"{timings[mode] / 1e6:>15,.1f}" for mode in modes)
+              + f"{best:>10}")
+    print("=" * 80)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare execution models on mixed CPU/I-O workloads")
+    parser.add_argument("--io-ratios", type=float, nargs="+", default=DEFAULT_IO_RATIOS)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--modes", nargs="+", choices=MIXED_MODES, default=MIXED_MODES)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--compute-n", type=int, default=2_000, help="n of each compute task's factorial")
+    parser.add_argument("--sleep-ms", type=float, default=5.0, help="duration of each sleep task")
+    args = parser.parse_args()
+    run_mixed_workload_study(args.io_ratios, args.tasks, args.modes, args.workers,
+                             compute_n=args.compute_n, sleep_seconds=args.sleep_ms / 1000)
+
+
+if __name__ == "__main__":
+    main()
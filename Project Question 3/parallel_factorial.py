@@ -0,0 +1,154 @@
+"""
+Parallel Chunked Factorial
+
+Running separate factorials in separate processes cannot speed up a single
+huge factorial. Here the range 2..n itself is split across worker processes:
+
+1. The range is cut into chunks whose partial products have about the same
+   number of bits (so later chunks, with bigger factors, are shorter).
+2. Each worker multiplies its chunk with a binary-splitting product tree.
+3. The partial products are combined pairwise in the pool (a tree
+   reduction), so the big multiplications near the root also run in parallel.
+
+Partial products travel between processes as raw little-endian bytes from
+int.to_bytes, the most compact form of a non-negative integer.
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from factorial_algorithms import product_range
+
+
+def encode_int(value):
+    """Serialize a non-negative integer as little-endian bytes"""
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def decode_int(data):
+    """Inverse of encode_int"""
+    return int.from_bytes(data, "little")
+
+
+def balanced_ranges(n, parts):
+    """
+    Split [2, n + 1) into at most `parts` half-open ranges with roughly equal
+    log2(product), using lgamma(k + 1) = ln(k!) to locate the boundaries.
+    """
+    if n < 2:
+        return []
+    parts = max(1, min(parts, n - 1))
+    total = math.lgamma(n + 1)
+    boundaries = [2]
+    for i in range(1, parts):
+        target = total * i / parts
+        # Smallest k with ln((k - 1)!) >= target, found by bisection
+        low, high = boundaries[-1] + 1, n + 1
+        while low < high:
+            mid = (low + high) // 2
+            if math.lgamma(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low <= n:
+            boundaries.append(low)
+    boundaries.append(n + 1)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)
+            if boundaries[i] < boundaries[i + 1]]
+
+
+def _chunk_product(low, high):
+    """Worker: product of [low, high), returned in serialized form"""
+    return encode_int(product_range(low, high))
+
+
+def _multiply_encoded(left, right):
+    """Worker: one node of the reduction tree"""
+    return encode_int(decode_int(left) * decode_int(right))
+
+
+def parallel_factorial(n, executor, chunks_per_worker=1, workers=None):
+    """
+    n! computed on a process pool: balanced chunks, then a pairwise tree
+    reduction in the pool. `workers` should match the pool size.
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    if n < 2:
+        return 1
+    workers = workers or os.cpu_count() or 1
+    ranges = balanced_ranges(n, workers * chunks_per_worker)
+    partials = [executor.submit(_chunk_product, low, high) for low, high in ranges]
+    partials = [future.result() for future in partials]
+
+    while len(partials) > 1:
+        paired = [executor.submit(_multiply_encoded, partials[i], partials[i + 1])
+                  for i in range(0, len(partials) - 1, 2)]
+        leftover = [partials[-1]] if len(partials) % 2 else []
+        partials = [future.result() for future in paired] + leftover
+    return decode_int(partials[0])
+
+
+def run_parallel_factorial_experiment(n=100_000, worker_counts=None, rounds=3):
+    """
+    7. Parallel Chunked Factorial
+
+    Times one n! on pools of different sizes against the single-process
+    binary-splitting product (best of `rounds`), and reports speedup S(p)
+    and parallel efficiency E(p) = S(p) / p for p workers, as scaling_study
+    does; with more workers than cores, E(p) cannot exceed cores / p.
+    """
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({1, 2, 4, cores, 2 * cores})
+
+    print("=" * 80)
+    print(f"PARALLEL CHUNKED FACTORIAL - {n:,}! ON {cores} CORE(S)")
+    print("=" * 80)
+
+    baseline = None
+    expected = None
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        expected = product_range(2, n + 1) if n >= 2 else 1
+        elapsed = time.perf_counter_ns() - start
+        baseline = elapsed if baseline is None else min(baseline, elapsed)
+    print(f"Single process (binary splitting): {baseline:>15,} ns")
+    print()
+    print(f"{'Workers':>8} {'Time (ns)':>18} {'Speedup':>10} {'Efficiency':>11}")
+    print("-" * 50)
+
+    results = {}
+    for workers in worker_counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Start every worker process before timing anything
+            list(executor.map(abs, range(workers)))
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter_ns()
+                value = parallel_factorial(n, executor, workers=workers)
+                elapsed = time.perf_counter_ns() - start
+                best = elapsed if best is None else min(best, elapsed)
+            if value != expected:
+                raise AssertionError(f"Parallel result for {n}! with {workers} workers is wrong!")
+        speedup = baseline / best
+        results[workers] = best
+        print(f"{workers:>8} {best:>18,} {speedup:>9.2f}x {speedup / workers:>10.0%}")
+    print("=" * 80)
+    return baseline, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split one large factorial across worker processes")
+    parser.add_argument("n", type=int, nargs="?", default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", help="pool sizes to try")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    run_parallel_factorial_experiment(args.n, args.workers, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Scaling Study
+
+The main experiment always runs one worker per factorial for three small
+inputs. This study sweeps the worker count (1 to 2x the number of cores), the
+number of tasks per round and n, for every execution mode, and reports:
+
+- speedup S(p) = T(1) / T(p), against the same mode with one worker
+- parallel efficiency E(p) = S(p) / p
+- an Amdahl's law fit S(p) = 1 / ((1 - f) + f / p), where f is the parallel
+  fraction. Rearranged as 1 - 1/S = f (1 - 1/p), f is the least-squares slope
+  through the origin of y = 1 - 1/S against x = 1 - 1/p, and 1 / (1 - f) is
+  the largest speedup any number of workers could reach
+
+Worker counts only apply to the parallel modes: "threads" starts p threads at
+a time until every task has run, the pools get p workers, and "single" is run
+once per configuration as the serial reference.
+
+Large n makes the iterative factorial quadratic, so pair n above about 10^5
+with --algorithm binary_split, prime_swing or math.
+"""
+
+import argparse
+import csv
+import os
+from functools import partial
+
+from benchmark_runner import BenchmarkRunner, RoundResult, summarize
+from factorial_algorithms import ALGORITHMS
+from factorial_concurrent_analysis import (MODES, FactorialThread, _span, open_mode,
+                                           single_threaded_round, unavailable_reason)
+
+DEFAULT_NUMBERS = [50, 1_000, 10_000]
+DEFAULT_TASK_COUNTS = [4, 16]
+SCALING_MODES = ["threads", "thread-pool", "process", "free-threaded"]
+CSV_FIELDS = ["mode", "n", "tasks", "workers", "median_ns", "ci_low_ns", "ci_high_ns",
+              "speedup", "efficiency", "speedup_vs_single", "amdahl_parallel_fraction"]
+
+
+def default_worker_counts():
+    """1, 2, ... up to twice the number of cores"""
+    return list(range(1, 2 * (os.cpu_count() or 1) + 1))
+
+
+def wave_round(numbers, workers, algorithm="iterative"):
+    """One round of the threads mode with at most workers FactorialThreads alive at a time"""
+    results = {}
+    thread_times = {}
+    for first in range(0, len(numbers), workers):
+        threads = [FactorialThread(numbers[i], results, thread_times, i, algorithm)
+                   for i in range(first, min(first + workers, len(numbers)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    worker_times = [thread_times[i] for i in range(len(numbers))]
+    return RoundResult(_span(worker_times), [results[i] for i in range(len(numbers))], worker_times)
+
+
+def fit_amdahl(speedups):
+    """Parallel fraction f fitted to {workers: speedup}, clamped to [0, 1]"""
+    sum_xy = sum_xx = 0.0
+    for workers, speedup in speedups.items():
+        if workers < 2 or speedup <= 0:
+            continue
+        x = 1 - 1 / workers
+        sum_xy += x * (1 - 1 / speedup)
+        sum_xx += x * x
+    if sum_xx == 0:
+        return None
+    return min(1.0, max(0.0, sum_xy / sum_xx))
+
+
+def measure(mode, numbers, workers, runner, algorithm):
+    """Summary statistics of one mode with a given worker count"""
+    if mode == "threads":
+        rounds = runner.run(partial(wave_round, numbers, workers, algorithm))
+    else:
+        with open_mode(mode, numbers, algorithm, workers=workers) as round_function:
+            rounds = runner.run(round_function)
+    return summarize([round_result.elapsed_ns for round_result in rounds])
+
+
+def run_scaling_study(numbers=None, task_counts=None, worker_counts=None, modes=None,
+                      algorithm="iterative", rounds=3, warmup=1):
+    """Run the sweep, print one table per configuration and return a list of CSV rows"""
+    numbers = numbers or DEFAULT_NUMBERS
+    task_counts = task_counts or DEFAULT_TASK_COUNTS
+    worker_counts = sorted(set(worker_counts or default_worker_counts()) | {1})
+    modes = modes or SCALING_MODES
+    runner = BenchmarkRunner(rounds, warmup)
+
+    available = []
+    for mode in modes:
+        reason = unavailable_reason(mode)
+        if reason:
+            print(f"{MODES[mode]} skipped: {reason}")
+        else:
+            available.append(mode)
+
+    rows = []
+    for n in numbers:
+        for task_count in task_counts:
+            inputs = [n] * task_count
+            single = summarize([r.elapsed_ns for r in runner.run(partial(
+                single_threaded_round, inputs, algorithm))])["median"]
+
+            print("=" * 88)
+            print(f"SCALING - {task_count} x factorial({n:,}), {algorithm}, "
+                  f"single-threaded median {single:,.0f} ns")
+            print("=" * 88)
+            print(f"{'Mode':<16} {'Workers':>7} {'Median (ns)':>16} {'Speedup':>9} "
+                  f"{'Efficiency':>11} {'vs single':>10}")
+            print("-" * 88)
+            for mode in available:
+                medians = {}
+                mode_rows = []
+                for workers in worker_counts:
+                    stats = measure(mode, inputs, workers, runner, algorithm)
+                    medians[workers] = stats["median"]
+                    speedup = medians[1] / stats["median"]
+                    mode_rows.append({
+                        "mode": mode, "n": n, "tasks": task_count, "workers": workers,
+                        "median_ns": round(stats["median"]), "ci_low_ns": round(stats["ci_low"]),
+                        "ci_high_ns": round(stats["ci_high"]), "speedup": round(speedup, 4),
+                        "efficiency": round(speedup / workers, 4),
+                        "speedup_vs_single": round(single / stats["median"], 4),
+                    })
+                    print(f"{MODES[mode]:<16} {workers:>7} {stats['median']:>16,.0f} {speedup:>8.2f}x "
+                          f"{speedup / workers:>10.0%} {single / stats['median']:>9.2f}x")
+
+                fraction = fit_amdahl({workers: medians[1] / median for workers, median in medians.items()})
+                for row in mode_rows:
+                    row["amdahl_parallel_fraction"] = "" if fraction is None else round(fraction, 4)
+                rows.extend(mode_rows)
+                if fraction is None:
+                    print(f"{'':<16} Amdahl fit needs at least two worker counts")
+                elif fraction < 1:
+                    print(f"{'':<16} Amdahl: parallel fraction {fraction:.1%}, "
+                          f"speedup limit {1 / (1 - fraction):.2f}x")
+                else:
+                    print(f"{'':<16} Amdahl: parallel fraction 100%, no serial bottleneck measured")
+            print()
+    return rows
+
+
+def write_scaling_csv(path, rows):
+    with open(path, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep worker counts, task counts and n for every execution mode")
+    parser.add_argument("--numbers", type=int, nargs="+", default=DEFAULT_NUMBERS, help="values of n")
+    parser.add_argument("--tasks", type=int, nargs="+", default=DEFAULT_TASK_COUNTS,
+                        help="factorials computed per round")
+    parser.add_argument("--workers", type=int, nargs="+", help="worker counts (default: 1 to 2x cores)")
+    parser.add_argument("--modes", nargs="+", choices=SCALING_MODES, default=SCALING_MODES)
+    parser.add_argument("--algorithm", choices=["iterative"] + list(ALGORITHMS), default="iterative")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--csv", metavar="PATH", default="scaling_results.csv",
+                        help="results table (default: %(default)s)")
+    args = parser.parse_args()
+    rows = run_scaling_study(args.numbers, args.tasks, args.workers, args.modes,
+                             args.algorithm, args.rounds, args.warmup)
+    write_scaling_csv(args.csv, rows)
+    print(f"Results written to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
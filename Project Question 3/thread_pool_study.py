@@ -0,0 +1,110 @@
+"""
+Thread Spawning vs Thread Pool
+
+The multithreaded experiment creates, starts and joins a new FactorialThread
+for every task in every round, so thread start-up is part of what it measures.
+This study separates the two costs for batches of up to thousands of tasks:
+
+- spawn: one new FactorialThread per task; reports the time spent creating and
+  starting threads separately from the wall time of the whole batch
+- pool: one persistent ThreadPoolExecutor, created and warmed up once (its
+  start-up cost is reported on its own), then fed each batch through its
+  work queue and awaited through futures
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from benchmark_runner import summarize
+from factorial_concurrent_analysis import FactorialThread, timed_factorial
+
+DEFAULT_TASK_COUNTS = [3, 10, 100, 1_000, 5_000]
+
+
+def spawn_batch(task_count, number):
+    """Run one batch with a new thread per task; returns (start-up ns, batch wall ns)"""
+    results = {}
+    thread_times = {}
+    batch_start = time.perf_counter_ns()
+    threads = [FactorialThread(number, results, thread_times, i) for i in range(task_count)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter_ns()
+    for thread in threads:
+        thread.join()
+    batch_end = time.perf_counter_ns()
+    return started - batch_start, batch_end - batch_start
+
+
+def start_pool(workers):
+    """Create a ThreadPoolExecutor with every worker thread already running; returns (pool, ns)"""
+    start = time.perf_counter_ns()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    # Each blocked task forces the executor to start one more thread
+    barrier = threading.Barrier(workers + 1)
+    futures = [pool.submit(barrier.wait) for _ in range(workers)]
+    barrier.wait()
+    wait(futures)
+    return pool, time.perf_counter_ns() - start
+
+
+def pool_batch(pool, task_count, number):
+    """Run one batch on an existing pool; returns batch wall ns"""
+    batch_start = time.perf_counter_ns()
+    futures = [pool.submit(timed_factorial, number) for _ in range(task_count)]
+    for future in futures:
+        future.result()
+    return time.perf_counter_ns() - batch_start
+
+
+def run_spawn_vs_pool_study(task_counts=None, number=50, rounds=5, workers=None):
+    """Print spawn and pool timings per batch size; returns {task_count: (spawn stats, pool stats)}"""
+    task_counts = task_counts or DEFAULT_TASK_COUNTS
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)  # ThreadPoolExecutor's default
+
+    pool, pool_startup = start_pool(workers)
+    print("=" * 96)
+    print(f"THREAD SPAWNING VS THREAD POOL - factorial({number}) tasks, median of {rounds} rounds")
+    print("=" * 96)
+    print(f"Pool start-up (once, {workers} workers): {pool_startup:,} ns "
+          f"({pool_startup / workers:,.0f} ns per thread)")
+    print()
+    print(f"{'Tasks':>7} {'Spawn start-up (ns)':>21} {'Per thread (ns)':>16} {'Spawn batch (ns)':>18} "
+          f"{'Pool batch (ns)':>17} {'Pool speedup':>13}")
+    print("-" * 96)
+
+    results = {}
+    with pool:
+        for task_count in task_counts:
+            startup_samples, spawn_samples, pool_samples = [], [], []
+            for _ in range(rounds):
+                startup, spawn_total = spawn_batch(task_count, number)
+                startup_samples.append(startup)
+                spawn_samples.append(spawn_total)
+                pool_samples.append(pool_batch(pool, task_count, number))
+            startup_median = summarize(startup_samples)["median"]
+            spawn_stats, pool_stats = summarize(spawn_samples), summarize(pool_samples)
+            results[task_count] = (spawn_stats, pool_stats)
+            print(f"{task_count:>7,} {startup_median:>21,.0f} {startup_median / task_count:>16,.0f} "
+                  f"{spawn_stats['median']:>18,.0f} {pool_stats['median']:>17,.0f} "
+                  f"{spawn_stats['median'] / pool_stats['median']:>12.2f}x")
+    print("=" * 96)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-task thread spawning with a reused thread pool")
+    parser.add_argument("--tasks", type=int, nargs="+", default=DEFAULT_TASK_COUNTS,
+                        help="batch sizes to measure")
+    parser.add_argument("--number", type=int, default=50, help="n of the factorial each task computes")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, help="pool size (default: ThreadPoolExecutor's)")
+    args = parser.parse_args()
+    run_spawn_vs_pool_study(args.tasks, args.number, args.rounds, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Per-Thread CPU Time and Run Timeline
+
+Wall-clock start and end times cannot tell a thread that was computing from a
+thread that was waiting for the GIL. A ThreadTrace records, for one thread:
+
+- CPU time actually consumed (time.thread_time_ns), so wall - CPU is the time
+  spent waiting: for the GIL, or for a core on an oversubscribed machine
+- voluntary and involuntary context switches (getrusage(RUSAGE_THREAD), Linux
+  only); blocking on the GIL shows up as voluntary switches
+- a timeline: the work is split into chunks and each chunk boundary is marked
+  with both clocks. A chunk whose wall time exceeds its CPU time contained a
+  wait, and its CPU time is placed at the end of the chunk (the thread resumed
+  and ran until the mark), which is accurate to one chunk
+
+Traces of one round are rendered as a text Gantt chart or exported in the
+Chrome trace event format (open in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import json
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_RUSAGE_THREAD = getattr(resource, "RUSAGE_THREAD", None)
+
+# Gaps shorter than this between wall and CPU time are timer noise, not waits
+WAIT_TOLERANCE_NS = 20_000
+
+
+def context_switches():
+    """(voluntary, involuntary) context switches of the calling thread, or None if unsupported"""
+    if _RUSAGE_THREAD is None:
+        return None
+    usage = resource.getrusage(_RUSAGE_THREAD)
+    return usage.ru_nvcsw, usage.ru_nivcsw
+
+
+class ThreadTrace:
+    """Clock readings of one thread, taken by the thread itself"""
+
+    def __init__(self, label, chunk_size=256):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self.label = label
+        self.chunk_size = chunk_size  # multiplications between two marks
+        self.segments = []            # (wall start, wall end, CPU ns) per chunk
+        self.wall_start = self.wall_end = None
+        self.cpu_ns = 0
+        self.switches = None
+        self._last_wall = self._last_cpu = None
+        self._cpu_start = None
+        self._switches_start = None
+
+    def begin(self):
+        self._switches_start = context_switches()
+        self._cpu_start = self._last_cpu = time.thread_time_ns()
+        self.wall_start = self._last_wall = time.perf_counter_ns()
+
+    def mark(self):
+        """Close the current chunk"""
+        wall, cpu = time.perf_counter_ns(), time.thread_time_ns()
+        self.segments.append((self._last_wall, wall, cpu - self._last_cpu))
+        self._last_wall, self._last_cpu = wall, cpu
+
+    def end(self):
+        self.wall_end = time.perf_counter_ns()
+        self.cpu_ns = time.thread_time_ns() - self._cpu_start
+        finished = context_switches()
+        if finished is not None and self._switches_start is not None:
+            self.switches = tuple(after - before for after, before in zip(finished, self._switches_start))
+
+    @property
+    def wall_ns(self):
+        return self.wall_end - self.wall_start
+
+    @property
+    def waiting_ns(self):
+        return max(0, self.wall_ns - self.cpu_ns)
+
+    def running_intervals(self):
+        """Merged (start, end) wall-clock intervals during which the thread was running"""
+        intervals = []
+        for start, end, cpu in self.segments:
+            if end - start - cpu > WAIT_TOLERANCE_NS:
+                start = end - cpu
+            if intervals and start - intervals[-1][1] <= WAIT_TOLERANCE_NS:
+                intervals[-1] = (intervals[-1][0], end)
+            else:
+                intervals.append((start, end))
+        return intervals
+
+
+def render_gantt(traces, width=64):
+    """
+    Text Gantt chart of one round: '#' running, '.' started but waiting,
+    blank before the thread started or after it finished
+    """
+    origin = min(trace.wall_start for trace in traces)
+    span = max(trace.wall_end for trace in traces) - origin or 1
+    scale = width / span
+
+    def column(t):
+        return min(width - 1, int((t - origin) * scale))
+
+    label_width = max(len(trace.label) for trace in traces)
+    lines = [f"{'':<{label_width}} |{'0':<{width // 2}}{f'{span:,} ns':>{width - width // 2}}| "
+             f"{'CPU (ns)':>12} {'Waiting':>8} {'Switches':>10}"]
+    for trace in traces:
+        row = [" "] * width
+        for i in range(column(trace.wall_start), column(trace.wall_end) + 1):
+            row[i] = "."
+        for start, end in trace.running_intervals():
+            for i in range(column(start), column(end) + 1):
+                row[i] = "#"
+        switches = "n/a" if trace.switches is None else f"{trace.switches[0]}/{trace.switches[1]}"
+        waiting = trace.waiting_ns / trace.wall_ns if trace.wall_ns else 0.0
+        lines.append(f"{trace.label:<{label_width}} |{''.join(row)}| "
+                     f"{trace.cpu_ns:>12,} {waiting:>8.0%} {switches:>10}")
+    return "\n".join(lines)
+
+
+def chrome_trace_events(traces, round_index=0):
+    """Trace events for one round: a 'run' slice per running interval plus a thread-name record"""
+    events = []
+    for tid, trace in enumerate(traces):
+        events.append({"name": "thread_name", "ph": "M", "pid": round_index, "tid": tid,
+                       "args": {"name": trace.label}})
+        for start, end in trace.running_intervals():
+            events.append({"name": "run", "ph": "X", "pid": round_index, "tid": tid,
+                           "ts": start / 1000, "dur": (end - start) / 1000})
+        events.append({"name": trace.label, "ph": "X", "pid": round_index, "tid": tid, "cat": "thread",
+                       "ts": trace.wall_start / 1000, "dur": trace.wall_ns / 1000,
+                       "args": {"cpu_ns": trace.cpu_ns, "waiting_ns": trace.waiting_ns,
+                                "context_switches": trace.switches}})
+    return events
+
+
+def write_chrome_trace(path, rounds):
+    """Write a list of rounds (each a list of ThreadTraces) as one Chrome trace file"""
+    events = []
+    for round_index, traces in enumerate(rounds):
+        events.append({"name": "process_name", "ph": "M", "pid": round_index, "tid": 0,
+                       "args": {"name": f"Round {round_index + 1}"}})
+        events.extend(chrome_trace_events(traces, round_index))
+    with open(path, "w") as handle:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ns"}, handle)
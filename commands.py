@@ -0,0 +1,237 @@
+# commands.py
+import argparse
+import json
+import shlex
+import sys
+
+from models import BabyProduct
+
+
+class CommandError(Exception):
+    """A scripted command that could not be executed"""
+
+
+def product_to_dict(product):
+    """JSON-friendly view of a BabyProduct"""
+    return {"product_id": product.product_id, "name": product.name, "category": product.category,
+            "price": product.price, "quantity": product.quantity, "age_range": product.age_range}
+
+
+def _coerce(argument, convert, default, value):
+    """An argument value checked against and converted by its COMMANDS converter
+
+    Text is converted; other values (from JSON) must already have the right
+    type. "" keeps an optional argument's default.
+    """
+    if default and (value is default[0] or value == ""):
+        return default[0]
+    if isinstance(value, str):
+        return convert(value)
+    if convert is str or isinstance(value, bool) or not isinstance(value, (int, float)) or \
+            (convert is int and not isinstance(value, int)):
+        expected = {str: "a string", int: "an integer"}.get(convert, "a number")
+        raise TypeError(f"{argument} must be {expected}, not {type(value).__name__}")
+    return convert(value)
+
+
+class InventoryCommands:
+    """Non-interactive interface to an InventorySystem
+
+    Every command is a cmd_<name> method returning JSON-friendly data.
+    COMMANDS lists the arguments of each command in order, as (argument,
+    convert) or (argument, convert, default), where convert turns a text
+    argument into its value; the same table builds the argparse subcommands.
+    Optional arguments may be omitted at the end of a line or passed as "" to
+    keep their default.
+    """
+
+    COMMANDS = {
+        "insert": [("product_id", str), ("name", str), ("category", str), ("price", float),
+                   ("quantity", int), ("age_range", str, "")],
+        "search": [("product_id", str)],
+        "update": [("product_id", str), ("price", float, None), ("quantity", int, None)],
+        "list": [],
+        "report": [("threshold", int, 25)],
+    }
+
+    def __init__(self, system):
+        self.system = system
+
+    def cmd_insert(self, product_id, name, category, price, quantity, age_range=""):
+        """Insert a new product"""
+        if self.system.storage.hash_table.search(product_id):
+            raise CommandError(f"Product ID {product_id} already exists")
+        self.system.storage.insert_product(BabyProduct(product_id, name, category, price, quantity, age_range))
+        return {"product_id": product_id}
+
+    def cmd_search(self, product_id):
+        """Look up a product by ID (null if it does not exist)"""
+        product = self.system.storage.hash_table.search(product_id)
+        return product_to_dict(product) if product else None
+
+    def cmd_update(self, product_id, price=None, quantity=None):
+        """Change a product's price and/or quantity"""
+        try:
+            return product_to_dict(self.system.storage.update_product(product_id, price, quantity))
+        except KeyError:
+            raise CommandError(f"Product ID {product_id} not found") from None
+
+    def cmd_list(self):
+        """All products"""
+        return [product_to_dict(product) for product in self.system.storage.get_all_products_array()]
+
+    def cmd_report(self, threshold=25):
+        """Stock value per category, low-stock products and price quartiles"""
+        try:
+            snapshot = self.system.get_snapshot()
+        except ImportError as e:
+            raise CommandError(str(e)) from None
+        return {"stock_value_by_category": snapshot.stock_value_by_category(),
+                "quantity_by_category": snapshot.quantity_by_category(),
+                "total_stock_value": snapshot.total_stock_value(),
+                "below_threshold": snapshot.below_threshold(threshold),
+                "price_quartiles": list(snapshot.price_quantiles((0.25, 0.5, 0.75)).values())}
+
+    def execute(self, name, args=(), kwargs=None):
+        """Run one command; args are bound in COMMANDS order, then kwargs by name"""
+        spec = self.COMMANDS.get(name)
+        if spec is None:
+            raise CommandError(f"Unknown command: {name}")
+        args = list(args)
+        if len(args) > len(spec):
+            raise CommandError(f"{name} takes at most {len(spec)} arguments")
+        given = dict(zip((argument for argument, *_ in spec), args))
+        for argument, value in (kwargs or {}).items():
+            if argument in given:
+                raise CommandError(f"{name}: {argument} given twice")
+            given[argument] = value
+        unknown = given.keys() - {argument for argument, *_ in spec}
+        if unknown:
+            raise CommandError(f"{name}: unknown argument {min(unknown)}")
+        values = {}
+        try:
+            for argument, convert, *default in spec:
+                if argument in given:
+                    values[argument] = _coerce(argument, convert, default, given[argument])
+                elif not default:
+                    raise CommandError(f"{name}: missing argument {argument}")
+        except (TypeError, ValueError) as e:
+            raise CommandError(f"{name}: {e}") from None
+        # Outside the try: an error raised by the command itself is not a usage error
+        return getattr(self, "cmd_" + name.replace("-", "_"))(**values)
+
+    def execute_line(self, line):
+        """Run one batch line: a JSON object {"command": ..., <argument>: ...} or 'command arg ... --option value'
+
+        As with the argparse subcommands, --option value (or --option=value)
+        names an argument, dashes standing for underscores; other words are
+        bound in order, and everything after a lone -- is taken as words.
+        """
+        line = line.strip()
+        if line.startswith("{"):
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise CommandError(f"Invalid JSON: {e}") from None
+            name = request.pop("command", None)
+            if name is None:
+                raise CommandError("JSON commands need a 'command' field")
+            return self.execute(name, kwargs=request)
+        tokens = shlex.split(line) if '"' in line or "'" in line else line.split()
+        if not tokens:
+            raise CommandError("Empty command")
+        name, args, kwargs = tokens[0], [], {}
+        words = iter(tokens[1:])
+        for word in words:
+            if word == "--":
+                args.extend(words)
+            elif word.startswith("--"):
+                option, equals, value = word[2:].partition("=")
+                if not equals:
+                    value = next(words, None)
+                    if value is None:
+                        raise CommandError(f"{name}: --{option} needs a value")
+                kwargs[option.replace("-", "_")] = value
+            else:
+                args.append(word)
+        return self.execute(name, args, kwargs)
+
+    def run_batch(self, lines, output, stop_on_error=False):
+        """Run every non-empty, non-comment line, writing one JSON result per line; returns the error count"""
+        errors = 0
+        write = output.write
+        dumps = json.dumps
+        for number, line in enumerate(lines, 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                write(dumps({"line": number, "ok": True, "result": self.execute_line(line)}) + "\n")
+            except Exception as e:
+                # Any failure is reported for its line; the rest of the batch still runs
+                errors += 1
+                message = str(e) if isinstance(e, CommandError) else f"{type(e).__name__}: {e}"
+                write(dumps({"line": number, "ok": False, "error": message}) + "\n")
+                if stop_on_error:
+                    break
+        return errors
+
+
+# Shown by "batch --help"
+BATCH_EXAMPLE = """example input:
+  # text lines take arguments in order, or as --option value like the subcommands
+  search BP001
+  update BP001 --quantity 40
+  update BP002 "" 30
+  report --threshold 30
+  {"command": "update", "product_id": "BP003", "price": 14.5}
+"""
+
+
+def build_parser():
+    """argparse parser with one subcommand per command, plus 'batch'"""
+    parser = argparse.ArgumentParser(description="Baby Shop Inventory System command interface "
+                                                 "(run without a command for the interactive menu)")
+    parser.add_argument("--no-sample-data", action="store_true", help="start with an empty inventory")
+    subparsers = parser.add_subparsers(dest="command")
+    for name, spec in InventoryCommands.COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=getattr(InventoryCommands,
+                                                             "cmd_" + name.replace("-", "_")).__doc__)
+        for argument, convert, *default in spec:
+            if default:
+                subparser.add_argument("--" + argument.replace("_", "-"), dest=argument,
+                                       type=convert, default=default[0])
+            else:
+                subparser.add_argument(argument, type=convert)
+    batch = subparsers.add_parser("batch", help="Run commands from a file or stdin, one per line, "
+                                                "printing one JSON result per line",
+                                  epilog=BATCH_EXAMPLE, formatter_class=argparse.RawDescriptionHelpFormatter)
+    batch.add_argument("file", nargs="?", default="-", help="command file ('-' for stdin)")
+    batch.add_argument("--stop-on-error", action="store_true")
+    return parser
+
+
+def parse_args(argv):
+    """Parse a scripted invocation; the command is None when only options are given"""
+    return build_parser().parse_args(argv)
+
+
+def run(args, create_system):
+    """Run the command of parse_args(...) and return the process exit status
+
+    The system is only created now, by calling create_system(seed_sample_data=...).
+    """
+    args = vars(args)
+    commands = InventoryCommands(create_system(seed_sample_data=not args.pop("no_sample_data")))
+    name = args.pop("command")
+    if name == "batch":
+        if args["file"] == "-":
+            return 1 if commands.run_batch(sys.stdin, sys.stdout, args["stop_on_error"]) else 0
+        with open(args["file"]) as handle:
+            return 1 if commands.run_batch(handle, sys.stdout, args["stop_on_error"]) else 0
+    try:
+        result = commands.execute(name, kwargs=args)
+    except CommandError as e:
+        print(json.dumps({"ok": False, "error": str(e)}))
+        return 1
+    print(json.dumps({"ok": True, "result": result}))
+    return 0
@@ -0,0 +1,147 @@
+# data_generators.py
+import math
+import random
+
+from models import BabyProduct
+
+# (category, median price, product nouns); earlier categories get more SKUs
+CATEGORIES = [
+    ("Hygiene", 9.99, ["Diapers Pack", "Baby Wipes", "Nappy Cream", "Cotton Buds", "Changing Mat"]),
+    ("Feeding", 12.99, ["Baby Bottle", "Sippy Cup", "Bib", "Formula Tin", "Bottle Warmer"]),
+    ("Clothing", 14.99, ["Baby Onesie", "Sleepsuit", "Knitted Hat", "Mittens", "Romper"]),
+    ("Toys", 15.99, ["Soft Teddy Bear", "Rattle Toy", "Stacking Cups", "Activity Gym", "Bath Duck"]),
+    ("Bathing", 8.99, ["Baby Shampoo", "Hooded Towel", "Bath Seat", "Sponge", "Bath Thermometer"]),
+    ("Teething", 6.99, ["Teething Ring", "Teething Gel", "Silicone Teether", "Chew Necklace", "Soother"]),
+    ("Safety", 39.99, ["Baby Monitor", "Stair Gate", "Corner Guards", "Cabinet Locks", "Outlet Covers"]),
+    ("Travel", 149.99, ["Stroller", "Car Seat", "Baby Carrier", "Travel Cot", "Changing Bag"]),
+]
+VARIANTS = ["Classic", "Organic", "Deluxe", "Mini", "Eco", "Premium", "Value", "Sensory"]
+AGE_RANGES = ["0-3 months", "0-6 months", "0-12 months", "3-6 months", "3-9 months",
+              "6-12 months", "0-24 months", "12-36 months"]
+
+
+def sku_id(index):
+    """Product ID of the index-th generated SKU (0-based)"""
+    return f"SKU{index:08d}"
+
+
+class ZipfSampler:
+    """Draws ranks 1..n with P(k) proportional to 1 / k**exponent in O(1) time and memory
+
+    Uses rejection-inversion (Hormann and Derflinger, 1996): a continuous
+    hat function is inverted exactly and most draws are accepted on the first
+    try, so there is no cumulative table to build, even for n in the billions.
+    """
+
+    def __init__(self, n, exponent=1.0, rng=None):
+        if n < 1 or exponent <= 0:
+            raise ValueError("n must be >= 1 and exponent must be > 0")
+        self.n = n
+        self.exponent = exponent
+        self.rng = rng or random.Random()
+        self._h_integral_x1 = self._h_integral(1.5) - 1.0
+        self._h_integral_n = self._h_integral(n + 0.5)
+        self._s = 2.0 - self._h_integral_inverse(self._h_integral(2.5) - self._h(2.0))
+
+    def sample(self):
+        """One rank in 1..n"""
+        random_ = self.rng.random
+        while True:
+            u = self._h_integral_n + random_() * (self._h_integral_x1 - self._h_integral_n)
+            x = self._h_integral_inverse(u)
+            k = min(max(int(x + 0.5), 1), self.n)
+            if k - x <= self._s or u >= self._h_integral(k + 0.5) - self._h(k):
+                return k
+
+    def _h(self, x):
+        return math.exp(-self.exponent * math.log(x))
+
+    def _h_integral(self, x):
+        log_x = math.log(x)
+        return _expm1_over_x((1.0 - self.exponent) * log_x) * log_x
+
+    def _h_integral_inverse(self, x):
+        t = max(x * (1.0 - self.exponent), -1.0)
+        return math.exp(_log1p_over_x(t) * x)
+
+
+def _expm1_over_x(x):
+    # (e**x - 1) / x, with its series near 0 where the division loses precision
+    if abs(x) > 1e-8:
+        return math.expm1(x) / x
+    return 1.0 + x * 0.5 * (1.0 + x / 3.0 * (1.0 + 0.25 * x))
+
+
+def _log1p_over_x(x):
+    # log(1 + x) / x, likewise
+    if abs(x) > 1e-8:
+        return math.log1p(x) / x
+    return 1.0 - x * (0.5 - x * (1.0 / 3.0 - 0.25 * x))
+
+
+def generate_catalogue(count, seed=42, category_exponent=1.0):
+    """Yield count BabyProducts with production-like skew, one at a time
+
+    Category sizes follow a Zipf law over CATEGORIES, prices are log-normal
+    around each category's median, and stock levels are heavy-tailed: most
+    SKUs hold a few units, a handful hold thousands and about 5% are out of
+    stock. The same seed always yields the same catalogue.
+    """
+    rng = random.Random(seed)
+    categories = ZipfSampler(len(CATEGORIES), category_exponent, rng)
+    for index in range(count):
+        category, median_price, nouns = CATEGORIES[categories.sample() - 1]
+        name = f"{rng.choice(VARIANTS)} {rng.choice(nouns)}"
+        price = round(median_price * rng.lognormvariate(0.0, 0.5), 2)
+        quantity = 0 if rng.random() < 0.05 else int(rng.paretovariate(1.2) * 5)
+        yield BabyProduct(sku_id(index), name, category, max(price, 0.99), quantity, rng.choice(AGE_RANGES))
+
+
+def access_trace(catalogue_size, length, exponent=1.0, seed=42):
+    """Yield length product IDs from a catalogue of catalogue_size SKUs, Zipf-distributed
+
+    The popularity ranks are scattered over the catalogue by an affine
+    bijection (rank * multiplier + offset modulo catalogue_size), so hot SKUs
+    are not simply the first ones inserted, and no permutation table is held.
+    """
+    rng = random.Random(seed)
+    sampler = ZipfSampler(catalogue_size, exponent, rng)
+    multiplier = rng.randrange(1, catalogue_size + 1)
+    while math.gcd(multiplier, catalogue_size) != 1:
+        multiplier += 1
+    offset = rng.randrange(catalogue_size)
+    for _ in range(length):
+        yield sku_id(((sampler.sample() - 1) * multiplier + offset) % catalogue_size)
+
+
+def main():
+    """Write a catalogue and/or an access trace as JSON-lines batch commands for main.py"""
+    import argparse
+    import json
+    import sys
+    parser = argparse.ArgumentParser(description="Generate inventory load-test input "
+                                                 "(pipe into: python main.py --no-sample-data batch)")
+    parser.add_argument("--products", type=int, default=10_000, help="catalogue size")
+    parser.add_argument("--accesses", type=int, default=100_000, help="trace length (0 for none)")
+    parser.add_argument("--exponent", type=float, default=1.0, help="Zipf exponent of the trace")
+    parser.add_argument("--update-ratio", type=float, default=0.1, help="share of accesses that are updates")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-catalogue", action="store_true", help="only write the access trace")
+    args = parser.parse_args()
+
+    write = sys.stdout.write
+    if not args.no_catalogue:
+        for product in generate_catalogue(args.products, args.seed):
+            write(json.dumps({"command": "insert", "product_id": product.product_id, "name": product.name,
+                              "category": product.category, "price": product.price,
+                              "quantity": product.quantity, "age_range": product.age_range}) + "\n")
+    rng = random.Random(args.seed + 1)
+    for product_id in access_trace(args.products, args.accesses, args.exponent, args.seed):
+        if rng.random() < args.update_ratio:
+            write(f"update {product_id} '' {rng.randrange(200)}\n")
+        else:
+            write(f"search {product_id}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,39 @@
 # main.py
+import sys
+import profiling
 from inventory_system import InventorySystem
 
 def main():
     """Main function to run the Baby Shop Inventory System"""
+    seed_sample_data = True
+    if len(sys.argv) > 1:
+        # Scripted use: python main.py <command> ... or python main.py batch [file].
+        # Imported here so the interactive menu does not pay for argparse and json.
+        import commands
+        args = commands.parse_args(sys.argv[1:])
+        if args.command is not None:
+            sys.exit(commands.run(args, InventorySystem))
+        # Only options, such as --no-sample-data: start the menu with them
+        seed_sample_data = not args.no_sample_data
+    
     print("Initializing Baby Shop Inventory System...")
-    print("Loading predefined products...")
     
     # Create and run the inventory system
-    system = InventorySystem()
-
-    print("\nSystem ready! Predefined products loaded:")
-    print("- Baby Bottle (BP001)")
-    print("- Diapers Pack (BP002)") 
-    print("- Soft Teddy Bear (BP003)")
-    print("- Baby Onesie (BP004)")
-    print("- Baby Monitor (BP005)")
-    print("- Baby Shampoo (BP006)")
-    print("- Teething Ring (BP007)")
-    print("- Stroller (BP008)")
-    print("- Baby Wipes (BP009)")
-    print("- Rattle Toy (BP010)")
+    system = InventorySystem(seed_sample_data=seed_sample_data)
+    
+    # Storage is built on first use, so only list products once they are really there
+    if system.seed_sample_data:
+        print("Loading predefined products...")
+        products = system.storage.get_all_products_array()
+        print(f"\nSystem ready! {len(products)} predefined products loaded:")
+        for product in products:
+            print(f"- {product.name} ({product.product_id})")
+    else:
+        print("\nSystem ready! The inventory is empty.")
     
     # Start the system
     system.run()
 
 if __name__ == "__main__":
-    main()
+    with profiling.session("inventory"):
+        main()